@@ -0,0 +1,100 @@
+"""
+Benchmark for the dead-cat lineart recoloring in generate_sprite.
+
+Renders a full afterlife clan (StarClan, Dark Forest and Unknown Residence cats
+with accessories and missing-part scars) once with the old per-pixel recoloring
+and once with the current mask-based one, and checks that both draw the same sprites.
+
+Run from the root of the repository:
+    python bin/benchmark_lineart_recolor.py [number of cats]
+"""
+
+import os
+import sys
+import time
+from random import choice, seed
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+sys.path.insert(0, os.getcwd())
+
+import pygame
+
+from scripts.game_structure import game  # must be imported before the screen settings
+import scripts.game_structure.screen_settings  # sets up the display
+import scripts.utility
+from scripts.cat.cats import Cat
+from scripts.cat.enums import CatGroup
+from scripts.cat.pelts import Pelt
+from scripts.cat.sprites import sprites
+from scripts.game_structure import image_cache
+from scripts.utility import generate_sprite
+
+
+def legacy_recolor_lineart(sprite, color=None, source=None) -> pygame.Surface:
+    """The per-pixel recoloring generate_sprite used before, without the in-place write bug."""
+    out = sprite.copy()
+    if color:
+        pixel_array = pygame.PixelArray(out)
+        pixel_array.replace((0, 0, 0), color, distance=0)
+        del pixel_array
+        return out
+
+    width, height = sprite.get_size()
+    for x in range(width):
+        for y in range(height):
+            if sprite.get_at((x, y)) == pygame.Color(0, 0, 0):
+                out.set_at((x, y), source.get_at((x, y)))
+    return out
+
+
+def create_afterlife_clan(amount):
+    afterlife_ids = (
+        CatGroup.STARCLAN_ID,
+        CatGroup.DARK_FOREST_ID,
+        CatGroup.UNKNOWN_RESIDENCE_ID,
+    )
+    accessories = Pelt.plant_accessories + Pelt.wild_accessories
+    cats = []
+    for i in range(amount):
+        cat = Cat(disable_random=True, moons=choice(range(12, 120)))
+        cat.pelt.accessory = [choice(accessories)]
+        cat.pelt.scars = [choice(Pelt.missing_part_scars)]
+        cat.status.send_to_afterlife(target_ID=afterlife_ids[i % len(afterlife_ids)])
+        cats.append(cat)
+    return cats
+
+
+def render(cats, recolor) -> tuple:
+    scripts.utility.recolor_lineart = recolor
+    image_cache.sprite_cache.clear()
+    start = time.perf_counter()
+    rendered = [generate_sprite(cat) for cat in cats]
+    return time.perf_counter() - start, rendered
+
+
+def main():
+    amount = int(sys.argv[1]) if len(sys.argv) > 1 else 300
+    seed(0)
+    sprites.load_all()
+    cats = create_afterlife_clan(amount)
+
+    current_recolor = scripts.utility.recolor_lineart
+    legacy_time, legacy_sprites = render(cats, legacy_recolor_lineart)
+    current_time, current_sprites = render(cats, current_recolor)
+    scripts.utility.recolor_lineart = current_recolor
+
+    mismatches = sum(
+        pygame.image.tobytes(old, "RGBA") != pygame.image.tobytes(new, "RGBA")
+        for old, new in zip(legacy_sprites, current_sprites)
+    )
+
+    print(f"rendered {amount} afterlife cats")
+    print(f"per-pixel recolor:  {legacy_time:.3f}s")
+    print(f"mask-based recolor: {current_time:.3f}s")
+    print(f"speedup:            {legacy_time / current_time:.1f}x")
+    print(f"differing sprites:  {mismatches}")
+
+
+if __name__ == "__main__":
+    main()
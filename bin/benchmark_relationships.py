@@ -0,0 +1,117 @@
+"""
+Benchmark for the memory and access cost of the relationship graph.
+
+Creates a Clan of the given numbers of cats, each in a fresh process, and gives every cat a
+relationship to every other cat. Prints how long building the graph, changing every
+relationship and turning every relationship into its save dict took, and how much memory a
+relationship takes up.
+
+For the time a moon skip takes with that many cats, use simulate_moons.py --cats <number>.
+
+Run from the root of the repository:
+    python bin/benchmark_relationships.py [number of cats ...]
+"""
+
+import os
+import subprocess
+import sys
+import time
+import tracemalloc
+from random import seed
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+sys.path.insert(0, os.getcwd())
+
+try:
+    import resource
+except ImportError:  # not available on Windows
+    resource = None
+
+MEASURED_CATS = 50
+"""Amount of cats whose relationships are traced to measure the memory of a relationship"""
+
+
+def peak_memory() -> int:
+    if resource is None:
+        return 0
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # bytes on macOS, kilobytes everywhere else
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def run_amount(amount):
+    # the game must be imported before the screen settings
+    from scripts.game_structure import game
+    import scripts.game_structure.screen_settings  # sets up the display
+    from scripts.cat.cats import Cat
+
+    seed(0)
+    cats = [Cat() for _ in range(amount)]
+
+    # tracing every allocation is slow, so only a sample of the graph is traced
+    measured = cats[:MEASURED_CATS]
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    for cat in measured:
+        cat.init_all_relationships()
+    traced = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    rel_memory = traced / sum(len(cat.relationships) for cat in measured)
+
+    start = time.perf_counter()
+    for cat in cats[MEASURED_CATS:]:
+        cat.init_all_relationships()
+    build_time = time.perf_counter() - start
+    relationships = [rel for cat in cats for rel in cat.relationships.values()]
+
+    start = time.perf_counter()
+    for rel in relationships:
+        rel.like += 1
+        rel.comfort -= 1
+        rel.like_tier
+    change_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for rel in relationships:
+        rel.to_dict()
+    save_time = time.perf_counter() - start
+
+    print(
+        f"{len(relationships)} {build_time} {change_time} {save_time} {rel_memory} {peak_memory()}"
+    )
+
+
+def main():
+    if len(sys.argv) > 2 and sys.argv[1] == "run":
+        run_amount(int(sys.argv[2]))
+        return
+
+    amounts = [int(amount) for amount in sys.argv[1:]] or [500, 2000]
+    print(
+        f"{'cats':>6}{'relationships':>15}{'build':>9}{'change':>9}{'to_dict':>9}"
+        f"{'per relationship':>18}{'peak memory':>13}"
+    )
+    for amount in amounts:
+        result = subprocess.run(
+            [sys.executable, __file__, "run", str(amount)],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        (
+            count,
+            build_time,
+            change_time,
+            save_time,
+            rel_memory,
+            peak,
+        ) = result.stdout.split()[-6:]
+        print(
+            f"{amount:>6}{count:>15}{float(build_time):>8.2f}s{float(change_time):>8.2f}s"
+            f"{float(save_time):>8.2f}s{float(rel_memory):>16.0f} B{int(peak) / 2**20:>10.1f} MB"
+        )
+
+
+if __name__ == "__main__":
+    main()
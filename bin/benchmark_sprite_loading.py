@@ -0,0 +1,91 @@
+"""
+Benchmark for the startup cost of loading the cat sprites.
+
+Loads the sprites eagerly without a baked atlas, eagerly from the baked atlas and lazily,
+each in a fresh process, and then draws a screen of cats. Prints how long loading and the
+first screen took, and how much memory the loaded sprite surfaces take up.
+
+Run from the root of the repository:
+    python bin/benchmark_sprite_loading.py [number of cats]
+"""
+
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from random import seed
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+sys.path.insert(0, os.getcwd())
+
+MODES = ("eager", "atlas", "lazy")
+
+
+def surface_memory(surfaces) -> int:
+    """Bytes of pixel data behind the surfaces, counting surfaces that share pixels once"""
+    owners = {id(s.get_abs_parent()): s.get_abs_parent() for s in surfaces}
+    return sum(
+        s.get_width() * s.get_height() * s.get_bytesize() for s in owners.values()
+    )
+
+
+def run_mode(mode, amount, cache_dir):
+    # the game must be imported before the screen settings
+    from scripts.game_structure import game
+    import scripts.game_structure.screen_settings  # sets up the display
+    import scripts.cat.sprites
+    from scripts.cat.cats import Cat
+    from scripts.cat.sprites import sprites
+    from scripts.game_structure import constants
+    from scripts.utility import generate_sprite
+
+    scripts.cat.sprites.get_cache_dir = lambda: cache_dir
+    constants.CONFIG["cat_sprites"]["lazy_loading"] = mode == "lazy"
+
+    seed(0)
+    cats = [Cat() for _ in range(amount)]
+
+    start = time.perf_counter()
+    sprites.load_all()
+    load_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for cat in cats:
+        generate_sprite(cat)
+    render_time = time.perf_counter() - start
+
+    memory = surface_memory(
+        list(sprites.spritesheets.values()) + list(dict.values(sprites.sprites))
+    )
+    print(f"{load_time} {render_time} {memory}")
+
+
+def main():
+    if len(sys.argv) > 2 and sys.argv[1] in MODES:
+        run_mode(sys.argv[1], int(sys.argv[2]), sys.argv[3])
+        return
+
+    amount = int(sys.argv[1]) if len(sys.argv) > 1 else 30
+    with tempfile.TemporaryDirectory() as cache_dir:
+        print(f"loading sprites and drawing {amount} cats")
+        print(f"{'mode':<7}{'load':>9}{'first screen':>14}{'total':>9}{'memory':>11}")
+        for mode in MODES:
+            # the eager run leaves the atlas behind for the atlas run
+            result = subprocess.run(
+                [sys.executable, __file__, mode, str(amount), cache_dir],
+                capture_output=True,
+                text=True,
+                check=True,
+            )
+            load_time, render_time, memory = result.stdout.split()[-3:]
+            load_time, render_time = float(load_time), float(render_time)
+            print(
+                f"{mode:<7}{load_time:>8.3f}s{render_time:>13.3f}s"
+                f"{load_time + render_time:>8.3f}s{int(memory) / 2**20:>8.1f} MB"
+            )
+
+
+if __name__ == "__main__":
+    main()
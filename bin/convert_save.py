@@ -0,0 +1,63 @@
+"""
+Converts the save of a clan between the JSON directory layout and a single SQLite database.
+
+The cats, relationships, histories, conditions and clan data are copied over, checked to be
+identical, and only then removed from the old storage. All other files of the clan stay as they are.
+
+Run from the root of the repository, with the game closed:
+    python bin/convert_save.py <clan name> sqlite|json
+"""
+
+import os
+import sys
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+sys.path.insert(0, os.getcwd())
+
+from scripts.game_structure import game  # must be imported before the save storage
+from scripts.game_structure.game.save_load import (
+    get_clan_storage,
+    close_clan_storage,
+    copy_clan_storage,
+)
+from scripts.game_structure.game.save_load.storage import (
+    JsonClanStorage,
+    SqliteClanStorage,
+)
+from scripts.housekeeping.datadir import get_save_dir
+
+STORAGE_TYPES = {"sqlite": SqliteClanStorage, "json": JsonClanStorage}
+
+
+def main():
+    if len(sys.argv) != 3 or sys.argv[2] not in STORAGE_TYPES:
+        print(__doc__)
+        sys.exit(1)
+
+    clanname, storage_type = sys.argv[1], STORAGE_TYPES[sys.argv[2]]
+    if not os.path.isdir(os.path.join(get_save_dir(), clanname)):
+        print(f"There is no save of {clanname} in {get_save_dir()}")
+        sys.exit(1)
+
+    source = get_clan_storage(clanname)
+    if isinstance(source, storage_type):
+        print(f"{clanname} is already saved as {sys.argv[2]}")
+        return
+
+    target = storage_type(clanname)
+    try:
+        copy_clan_storage(source, target)
+    except:
+        target.remove_all()
+        raise
+    finally:
+        target.close()
+
+    source.remove_all()
+    close_clan_storage(clanname)
+    print(f"Converted {clanname} to {sys.argv[2]}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,224 @@
+"""
+Headless moon-skip simulator, for capacity testing big Clans and catching slowdowns.
+
+Generates a new Clan with the given number of cats (or copies an existing save), then runs
+one_moon for the given number of moons with a fixed seed, without a display. Prints the moons
+per second, the time spent in each timing span of the moon skip, the peak memory and the final population.
+
+Everything runs in a scratch data directory, so no real saves are touched. Runs with the same
+arguments and seed give the same moons.
+
+Run from the root of the repository:
+    python bin/simulate_moons.py [--moons 50] [--cats 30 | --clan <clan name>] [--seed 0] [--autosave] [--report timings.json]
+"""
+
+import argparse
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from random import choice, seed
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+sys.path.insert(0, os.getcwd())
+
+try:
+    import resource
+except ImportError:  # not available on Windows
+    resource = None
+
+
+def generate_clan(amount: int, game_mode: str):
+    from scripts.cat.cats import create_cat, Cat
+    from scripts.cat.enums import CatRank
+    from scripts.clan import Clan
+    from scripts.clan_package.settings import set_clan_setting
+    from scripts.game_structure import game
+
+    game.clan = Clan(
+        name="Simulation",
+        leader=create_cat(CatRank.LEADER),
+        deputy=create_cat(CatRank.DEPUTY),
+        medicine_cat=create_cat(CatRank.MEDICINE_CAT),
+        biome="Forest",
+        camp_bg="camp1",
+        symbol="ADDER0",
+        game_mode=game_mode,
+        starting_members=[
+            create_cat(
+                choice(
+                    [
+                        CatRank.KITTEN,
+                        CatRank.APPRENTICE,
+                        CatRank.WARRIOR,
+                        CatRank.WARRIOR,
+                        CatRank.ELDER,
+                    ]
+                )
+            )
+            for _ in range(max(amount - 3, 0))
+        ],
+        starting_season="Newleaf",
+    )
+    game.clan.create_clan()
+    game.clan.herb_supply.start_storage(15)
+    Cat.grief_strings.clear()
+    Cat.sort_cats()
+    if game.clan.freshkill_pile:
+        # prevent them from just dying of starvation
+        set_clan_setting("business as usual", False)
+        set_clan_setting("hunting", True)
+
+
+def load_clan(clanname: str):
+    from scripts.clan import clan_class
+    from scripts.game_structure import game
+    from scripts.game_structure.game.switches import switch_set_value, Switch
+    from scripts.game_structure.load_cat import load_cats, version_convert
+
+    switch_set_value(Switch.clan_list, [clanname])
+    switch_set_value(Switch.clan_name, clanname)
+    load_cats()
+    version_convert(clan_class.load_clan())
+    game.load_events()
+
+
+def copy_clan_save(clanname: str, save_dir: str, scratch_save_dir: str):
+    if not os.path.isdir(os.path.join(save_dir, clanname)):
+        print(f"There is no save of {clanname} in {save_dir}")
+        sys.exit(1)
+    os.makedirs(scratch_save_dir, exist_ok=True)
+    shutil.copytree(
+        os.path.join(save_dir, clanname), os.path.join(scratch_save_dir, clanname)
+    )
+    for clan_file in (f"{clanname}clan.json", f"{clanname}clan.txt"):
+        if os.path.exists(os.path.join(save_dir, clan_file)):
+            shutil.copy(os.path.join(save_dir, clan_file), scratch_save_dir)
+
+
+def peak_memory() -> str:
+    if resource is None:
+        return "unavailable"
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # bytes on macOS, kilobytes everywhere else
+    peak = peak if sys.platform == "darwin" else peak * 1024
+    return f"{peak / 2**20:.1f} MB"
+
+
+def simulate(args, data_dir: str):
+    import scripts.housekeeping.datadir
+
+    real_save_dir = scripts.housekeeping.datadir.get_save_dir()
+    scripts.housekeeping.datadir.get_data_dir = lambda: data_dir
+    if args.clan:
+        copy_clan_save(
+            args.clan, real_save_dir, scripts.housekeeping.datadir.get_save_dir()
+        )
+
+    # the game must be imported before the screen settings
+    from scripts.game_structure import game
+    import scripts.game_structure.screen_settings  # sets up the display
+    from scripts import events
+    from scripts.cat.cats import Cat
+    from scripts.cat.sprites import sprites
+    from scripts.clan_package.settings import set_clan_setting
+    from scripts.game_structure import constants, timing
+
+    seed(args.seed)
+    # the sprites are only drawn for cats that are shown, which none are
+    constants.CONFIG["cat_sprites"]["lazy_loading"] = True
+    sprites.load_all()
+
+    start = time.perf_counter()
+    if args.clan:
+        load_clan(args.clan)
+    else:
+        generate_clan(args.cats, args.game_mode)
+    setup_time = time.perf_counter() - start
+    print(
+        f"{'loaded' if args.clan else 'generated'} {game.clan.name} in {setup_time:.2f}s"
+    )
+    print(
+        f"{len(Cat.living_clan_cats())} living Clan cats, {len(Cat.all_cats)} cats total"
+    )
+
+    if args.autosave:
+        set_clan_setting("autosave", True)
+
+    timing.set_enabled(True)
+    moons = 0
+    start = time.perf_counter()
+    while moons < args.moons and Cat.living_clan_cats():
+        events.one_moon()
+        moons += 1
+    total_time = time.perf_counter() - start
+
+    print()
+    print(f"ran {moons} moons in {total_time:.2f}s ({moons / total_time:.2f} moons/s)")
+    print(f"  {'span':<26}{'total':>9}{'share':>8}{'calls':>8}{'max':>10}")
+    for span in timing.get_report():
+        print(
+            f"  {span['name']:<26}{span['total']:>8.2f}s{100 * span['total'] / total_time:>7.1f}%"
+            f"{span['calls']:>8}{span['max'] * 1000:>8.1f}ms"
+        )
+    print("  (spans run inside one_moon and one_moon_cat are also part of their time)")
+    if args.report:
+        print(f"timings written to {timing.dump_report(os.path.abspath(args.report))}")
+    print(f"peak memory: {peak_memory()}")
+
+    print()
+    print("final population:")
+    print(f"  living Clan cats:  {len(Cat.living_clan_cats())}")
+    print(f"  living outsiders:  {len(Cat.outsider_cats())}")
+    print(f"  living cats:       {len(Cat.living_cats())}")
+    print(f"  dead cats:         {len(Cat.afterlife_cats())}")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Run moon skips without a display and report how long they took."
+    )
+    parser.add_argument("--moons", type=int, default=50, help="moons to run")
+    parser.add_argument("--seed", type=int, default=0, help="seed for the random rolls")
+    parser.add_argument(
+        "--cats", type=int, default=30, help="starting cats of a generated Clan"
+    )
+    parser.add_argument(
+        "--clan", help="run an existing save (copied) instead of a generated Clan"
+    )
+    parser.add_argument(
+        "--game-mode",
+        default="expanded",
+        choices=("classic", "expanded", "cruel season"),
+        help="game mode of a generated Clan",
+    )
+    parser.add_argument(
+        "--autosave",
+        action="store_true",
+        help="save every 5 moons, like the autosave setting does",
+    )
+    parser.add_argument("--report", help="also write the timings to this JSON file")
+    parser.add_argument(
+        "--data-dir",
+        help="data directory to run in, kept afterwards. Default is a temporary one",
+    )
+    args = parser.parse_args()
+
+    # sets are iterated in hash order, which has to be fixed too for the seed to give the same moons
+    if os.environ.get("PYTHONHASHSEED") != "0":
+        env = dict(os.environ, PYTHONHASHSEED="0")
+        sys.exit(subprocess.run([sys.executable, *sys.argv], env=env).returncode)
+
+    if args.data_dir:
+        os.makedirs(args.data_dir, exist_ok=True)
+        simulate(args, os.path.abspath(args.data_dir))
+    else:
+        with tempfile.TemporaryDirectory() as data_dir:
+            simulate(args, data_dir)
+
+
+if __name__ == "__main__":
+    main()
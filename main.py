@@ -205,6 +205,7 @@ from scripts.utility import (
 
 # from scripts.debug_menu import debugmode
 from scripts.debug_console import debug_mode
+from scripts.game_structure.frame_profiler import frame_profiler
 import pygame
 
 # import all screens for initialization (Note - must be done after pygame_gui manager is created)
@@ -350,6 +351,7 @@ else:
 
 while 1:
     time_delta = clock.tick(fps) / 1000.0
+    frame_profiler.begin_frame(game.current_screen)
 
     if switch_get_value(Switch.switch_clan):
         load_game()
@@ -357,6 +359,7 @@ while 1:
     # Draw screens
     # This occurs before events are handled to stop pygame_gui buttons from blinking.
     game.all_screens[game.current_screen].on_use()
+    frame_profiler.end_stage("on_use")
     # EVENTS
     for event in pygame.event.get():
         if (
@@ -418,11 +421,14 @@ while 1:
                 )
 
         MANAGER.process_events(event)
+    frame_profiler.end_stage("events")
 
     MANAGER.update(time_delta)
+    frame_profiler.end_stage("manager_update")
 
     # update
     game.update_game()
+    frame_profiler.end_stage("update_game")
     if game.switch_screens:
         all_screens.get_screen(
             game.last_screen_forupdate.replace(" ", "_")
@@ -435,12 +441,17 @@ while 1:
         and not music_manager.muted
     ):
         music_manager.play_queued()
+    frame_profiler.end_stage("screen_switch")
 
     debug_mode.pre_update(clock)
+    frame_profiler.end_stage("debug")
     # END FRAME
 
     MANAGER.draw_ui(screen)
+    frame_profiler.end_stage("draw_ui")
 
     debug_mode.post_update(screen)
+    frame_profiler.end_stage("debug_overlay")
 
     pygame.display.update()
+    frame_profiler.end_stage("display_update")
@@ -21,6 +21,7 @@ from scripts.cat.history import History
 from scripts.cat.names import Name
 from scripts.cat.pelts import Pelt
 from scripts.cat.personality import Personality
+from scripts.cat.population import CatRegistry
 from scripts.cat.skills import CatSkills
 from scripts.cat.status import Status, StatusDict
 from scripts.cat.thoughts import Thoughts
@@ -37,8 +38,8 @@ from scripts.conditions import (
 )
 from scripts.event_class import Single_Event
 from scripts.events_module.generate_events import GenerateEvents
-from scripts.game_structure import image_cache, constants, game
-from scripts.game_structure.game.save_load import safe_save
+from scripts.game_structure import image_cache, constants, game, timing
+from scripts.game_structure.game.save_load import safe_save, get_clan_storage
 from scripts.game_structure.game.settings import game_setting_get
 from scripts.game_structure.game.switches import switch_get_value, Switch
 from scripts.game_structure.localization import load_lang_resource
@@ -57,6 +58,7 @@ from scripts.utility import (
 import scripts.game_structure.screen_settings
 
 if TYPE_CHECKING:
+    from scripts.game_structure.game.save_load.storage import ClanStorage
     import pygame
 
 
@@ -91,6 +93,7 @@ class Cat:
         CatRank.DEPUTY,
         CatRank.LEADER,
     ]
+    rank_sort_index = {rank: i for i, rank in enumerate(rank_sort_order)}
 
     gender_tags = {"female": "F", "male": "M"}
 
@@ -106,7 +109,7 @@ class Cat:
         "master": (321, 321),
     }
 
-    all_cats: Dict[str, Cat] = {}  # ID: object
+    all_cats: CatRegistry = CatRegistry()  # ID: object
     outside_cats: Dict[str, Cat] = {}  # cats outside the clan
     id_iter = itertools.count()
 
@@ -159,6 +162,7 @@ class Cat:
         """
 
         self._history = None
+        self._relationships = None
 
         if (
             faded
@@ -176,8 +180,9 @@ class Cat:
         # Public attributes
         self.gender = gender
         self.status: Status = Status(**status_dict) if status_dict else Status()
+        self.status.on_change = self.population_changed
         self.backstory = backstory
-        self.age: Optional[CatAge] = None
+        self._age: Optional[CatAge] = None
         self.skills = CatSkills(skill_dict=skill_dict)
         self.personality = Personality(
             trait="troublesome", lawful=0, aggress=0, stable=0, social=0
@@ -349,6 +354,7 @@ class Cat:
 
         # SAVE CAT INTO ALL_CATS DICTIONARY IN CATS-CLASS
         self.all_cats[self.ID] = self
+        Inheritance.register_cat(self)
 
         if self.ID is not None and self.ID != "0":
             Cat.insert_cat(self)
@@ -612,12 +618,36 @@ class Cat:
         """load history if it is None"""
         if self._history is None:
             self.load_history()
+            if self._history is not None and not self.status.alive_in_player_clan:
+                save_load.mark_loaded(self.ID)
         return self._history
 
     @history.setter
     def history(self, val: History):
         self._history = val
 
+    @property
+    def relationships(self) -> Dict[str, Relationship]:
+        """load relationships if they are None. Dead cats have no relationships"""
+        if self._relationships is None:
+            if self.dead:
+                self._relationships = {}
+            else:
+                # a relationship can be created for the cat right before they are loaded
+                changed = self.ID in save_load.changed_relationships
+                self.load_relationship_of_cat()
+                if len(self._relationships) < 1:
+                    self.init_all_relationships()
+                if changed:
+                    save_load.changed_relationships.add(self.ID)
+                if not self.status.alive_in_player_clan:
+                    save_load.mark_loaded(self.ID)
+        return self._relationships
+
+    @relationships.setter
+    def relationships(self, val: Optional[Dict[str, Relationship]]):
+        self._relationships = val
+
     def get_genderalign_string(self):
         # translate it if it's default
         if self.genderalign in (
@@ -1112,65 +1142,62 @@ class Cat:
             print("WARNING: History failed to load, no Clan in switches?")
             return
 
-        history_directory = f"{get_save_dir()}/{clanname}/history/"
-        cat_history_directory = history_directory + self.ID + "_history.json"
+        try:
+            history_data = get_clan_storage(clanname).read_history(self.ID)
+            if history_data is None:
+                self._history = History(
+                    beginning={},
+                    mentor_influence={},
+                    app_ceremony={},
+                    lead_ceremony=None,
+                    possible_history={},
+                    died_by=[],
+                    scar_events=[],
+                    murder={},
+                    cat=self,
+                )
+                return
 
-        if not os.path.exists(cat_history_directory):
             self._history = History(
-                beginning={},
-                mentor_influence={},
-                app_ceremony={},
-                lead_ceremony=None,
-                possible_history={},
-                died_by=[],
-                scar_events=[],
-                murder={},
+                beginning=(
+                    history_data["beginning"] if "beginning" in history_data else {}
+                ),
+                mentor_influence=(
+                    history_data["mentor_influence"]
+                    if "mentor_influence" in history_data
+                    else {}
+                ),
+                app_ceremony=(
+                    history_data["app_ceremony"]
+                    if "app_ceremony" in history_data
+                    else {}
+                ),
+                lead_ceremony=(
+                    history_data["lead_ceremony"]
+                    if "lead_ceremony" in history_data
+                    else None
+                ),
+                possible_history=(
+                    history_data["possible_history"]
+                    if "possible_history" in history_data
+                    else {}
+                ),
+                died_by=(history_data["died_by"] if "died_by" in history_data else []),
+                scar_events=(
+                    history_data["scar_events"] if "scar_events" in history_data else []
+                ),
+                murder=history_data["murder"] if "murder" in history_data else {},
+                afterlife_acceptance=(
+                    history_data["afterlife_acceptance"]
+                    if "afterlife_acceptance" in history_data
+                    else None
+                ),
                 cat=self,
             )
-            return
-        try:
-            with open(cat_history_directory, "r", encoding="utf-8") as read_file:
-                history_data = ujson.loads(read_file.read())
-
-                self._history = History(
-                    beginning=(
-                        history_data["beginning"] if "beginning" in history_data else {}
-                    ),
-                    mentor_influence=(
-                        history_data["mentor_influence"]
-                        if "mentor_influence" in history_data
-                        else {}
-                    ),
-                    app_ceremony=(
-                        history_data["app_ceremony"]
-                        if "app_ceremony" in history_data
-                        else {}
-                    ),
-                    lead_ceremony=(
-                        history_data["lead_ceremony"]
-                        if "lead_ceremony" in history_data
-                        else None
-                    ),
-                    possible_history=(
-                        history_data["possible_history"]
-                        if "possible_history" in history_data
-                        else {}
-                    ),
-                    died_by=(
-                        history_data["died_by"] if "died_by" in history_data else []
-                    ),
-                    scar_events=(
-                        history_data["scar_events"]
-                        if "scar_events" in history_data
-                        else []
-                    ),
-                    murder=history_data["murder"] if "murder" in history_data else {},
-                    afterlife_acceptance=(
-                        history_data["afterlife_acceptance"]
-                        if "afterlife_acceptance" in history_data
-                        else None
-                    ),
-                    cat=self,
+            if save_load.saved_clan == clanname:
+                # the history is the same as in the file, no need to write it again
+                save_load.saved_histories[self.ID] = ujson.dumps(
+                    self._history.make_dict()
                 )
         except Exception:
             self._history = None
@@ -1180,18 +1207,14 @@ class Cat:
                 f"you'd like to preserve!"
             )
 
-    def save_history(self, history_dir):
+    def save_history(self, storage: ClanStorage):
         """Save this cat's history.
 
-        :param history_dir: Directory to save cat's history to
-        :type history_dir: str
+        :param storage: storage of the clan, inside a transaction
         """
-        if not os.path.exists(history_dir):
-            os.makedirs(history_dir)
-
         history_dict = self.history.make_dict()
         try:
-            safe_save(f"{history_dir}/{self.ID}_history.json", history_dict)
+            storage.write_history(self.ID, history_dict)
         except:
             self.history = History(
                 beginning={},
@@ -1556,6 +1579,7 @@ class Cat:
         if self.status.rank.is_any_apprentice_rank():
             self.update_mentor()
 
+    @timing.timed("thoughts", per_cat=True)
     def thoughts(
         self, just_died=False, lives_left: int = 0, other_clan_cats: list = None
     ):
@@ -1651,12 +1675,11 @@ class Cat:
         # insert thought
         self.thought = str(chosen_thought)
 
+    @timing.timed("relationships.interaction", per_cat=True)
     def relationship_interaction(self):
         """Randomly choose a cat of the Clan and have an interaction with them."""
         cats_to_choose = [
-            iter_cat
-            for iter_cat in Cat.all_cats.values()
-            if iter_cat.ID != self.ID and iter_cat.status.alive_in_player_clan
+            iter_cat for iter_cat in Cat.living_clan_cats() if iter_cat.ID != self.ID
         ]
         # if there are no cats to interact, stop
         if not cats_to_choose:
@@ -2261,27 +2284,18 @@ class Cat:
                 )
                 self.get_ill(illness_name)
 
-    def save_condition(self):
+    def save_condition(self, storage: ClanStorage):
         # save conditions for each cat
-        clanname = None
-        if switch_get_value(Switch.clan_name) != "":
-            clanname = switch_get_value(Switch.clan_name)
-        elif len(switch_get_value(Switch.clan_list)) > 0:
-            clanname = switch_get_value(Switch.clan_list)[0]
-        elif game.clan is not None:
-            clanname = game.clan.name
-
-        condition_directory = get_save_dir() + "/" + clanname + "/conditions"
-        condition_file_path = condition_directory + "/" + self.ID + "_conditions.json"
+        storage.write_conditions(self.ID, self.get_conditions_save_dict())
 
+    def get_conditions_save_dict(self) -> Optional[dict]:
+        """Returns the conditions to save for this cat, or None if no condition file should exist."""
         if (
             (not self.is_ill() and not self.is_injured() and not self.is_disabled())
             or self.dead
             or self.status.is_outsider
         ):
-            if os.path.exists(condition_file_path):
-                os.remove(condition_file_path)
-            return
+            return None
 
         conditions = {}
 
@@ -2294,7 +2308,7 @@ class Cat:
         if self.is_disabled():
             conditions["permanent conditions"] = self.permanent_condition
 
-        safe_save(condition_file_path, conditions)
+        return conditions
 
     def load_conditions(self):
         if switch_get_value(Switch.clan_name) != "":
@@ -2302,17 +2316,14 @@ class Cat:
         else:
             clanname = switch_get_value(Switch.clan_list)[0]
 
-        condition_directory = get_save_dir() + "/" + clanname + "/conditions/"
-        condition_cat_directory = condition_directory + self.ID + "_conditions.json"
-        if not os.path.exists(condition_cat_directory):
-            return
-
         try:
-            with open(condition_cat_directory, "r", encoding="utf-8") as read_file:
-                rel_data = ujson.loads(read_file.read())
-                self.illnesses = rel_data.get("illnesses", {})
-                self.injuries = rel_data.get("injuries", {})
-                self.permanent_condition = rel_data.get("permanent conditions", {})
+            rel_data = get_clan_storage(clanname).read_conditions(self.ID)
+            if rel_data is None:
+                return
+
+            self.illnesses = rel_data.get("illnesses", {})
+            self.injuries = rel_data.get("injuries", {})
+            self.permanent_condition = rel_data.get("permanent conditions", {})
 
             if "paralyzed" in self.permanent_condition and not self.pelt.paralyzed:
                 self.pelt.paralyzed = True
@@ -2765,14 +2776,14 @@ class Cat:
                 )
                 self.relationships[the_cat.ID] = rel
 
-    def save_relationship_of_cat(self, relationship_dir):
+    def save_relationship_of_cat(self, storage: ClanStorage):
         # save relationships for each cat
 
         rel = []
         for r in self.relationships.values():
             rel.append(r.to_dict())
 
-        safe_save(f"{relationship_dir}/{self.ID}_relations.json", rel)
+        storage.write_relationships(self.ID, rel)
 
     def load_relationship_of_cat(self):
         if switch_get_value(Switch.clan_name) != "":
@@ -2780,57 +2791,57 @@ class Cat:
         else:
             clanname = switch_get_value(Switch.clan_list)[0]
 
-        relation_directory = get_save_dir() + "/" + clanname + "/relationships/"
-        relation_cat_directory = relation_directory + self.ID + "_relations.json"
+        storage = get_clan_storage(clanname)
 
         self.relationships = {}
-        if os.path.exists(relation_directory):
-            if not os.path.exists(relation_cat_directory):
+        if storage.has_relationships():
+            rel_data = storage.read_relationships(self.ID)
+            if rel_data is None:
                 self.init_all_relationships()
                 for cat in Cat.all_cats.values():
                     cat.create_one_relationship(self)
                 return
             try:
-                with open(relation_cat_directory, "r", encoding="utf-8") as read_file:
-                    rel_data = ujson.loads(read_file.read())
-
-                    for rel in rel_data:
-                        # checking validity
-                        cat_to = self.all_cats.get(rel["cat_to_id"])
-                        if cat_to is None or rel["cat_to_id"] == self.ID:
-                            continue
-
-                        # converting old saves
-                        if "platonic_like" in rel:
-                            # romance
-                            rel["romance"] = rel["romantic_love"]
-                            rel.pop("romantic_love")
-                            # like
-                            rel["like"] = rel["platonic_like"] - rel["dislike"]
-                            rel.pop("platonic_like")
-                            rel.pop("dislike")
-                            # respect
-                            rel["respect"] = rel["admiration"] - rel["jealousy"]
-                            rel.pop("admiration")
-                            rel.pop("jealousy")
-                            # comfort
-                            rel["comfort"] = rel["comfortable"]
-                            rel.pop("comfortable")
-
-                        # create relationship
-                        new_rel = Relationship(
-                            cat_from=self,
-                            cat_to=cat_to,
-                            mates=rel["mates"] or False,
-                            family=rel["family"] or False,
-                            romance=(rel["romance"] or 0),
-                            like=(rel["like"] or 0),
-                            respect=rel["respect"] or 0,
-                            comfort=rel["comfort"] or 0,
-                            trust=rel["trust"] or 0,
-                            log=rel["log"],
-                        )
-                        self.relationships[rel["cat_to_id"]] = new_rel
+                for rel in rel_data:
+                    # checking validity
+                    cat_to = self.all_cats.get(rel["cat_to_id"])
+                    if cat_to is None or rel["cat_to_id"] == self.ID:
+                        continue
+
+                    # converting old saves
+                    if "platonic_like" in rel:
+                        # romance
+                        rel["romance"] = rel["romantic_love"]
+                        rel.pop("romantic_love")
+                        # like
+                        rel["like"] = rel["platonic_like"] - rel["dislike"]
+                        rel.pop("platonic_like")
+                        rel.pop("dislike")
+                        # respect
+                        rel["respect"] = rel["admiration"] - rel["jealousy"]
+                        rel.pop("admiration")
+                        rel.pop("jealousy")
+                        # comfort
+                        rel["comfort"] = rel["comfortable"]
+                        rel.pop("comfortable")
+
+                    # create relationship
+                    new_rel = Relationship(
+                        cat_from=self,
+                        cat_to=cat_to,
+                        mates=rel["mates"] or False,
+                        family=rel["family"] or False,
+                        romance=(rel["romance"] or 0),
+                        like=(rel["like"] or 0),
+                        respect=rel["respect"] or 0,
+                        comfort=rel["comfort"] or 0,
+                        trust=rel["trust"] or 0,
+                        log=rel["log"],
+                    )
+                    self.relationships[rel["cat_to_id"]] = new_rel
+
+                # the relationships are the same as in the file, no need to write them again
+                save_load.changed_relationships.discard(self.ID)
 
             except KeyError:
                 print(
@@ -3096,79 +3107,109 @@ class Cat:
 
         return cat_ob
 
+    # ---------------------------------------------------------------------------- #
+    #                                 Population                                   #
+    # ---------------------------------------------------------------------------- #
+
+    @staticmethod
+    def get_registry() -> CatRegistry:
+        """Returns all_cats, turning it back into a CatRegistry if it was replaced by a plain dict."""
+        if not isinstance(Cat.all_cats, CatRegistry):
+            Cat.all_cats = CatRegistry(Cat.all_cats)
+        return Cat.all_cats
+
+    def population_changed(self):
+        """Moves the cat to the population views that match its current status and age."""
+        if isinstance(Cat.all_cats, CatRegistry):
+            Cat.all_cats.refresh(self)
+
+    def name_changed(self):
+        """Lets the name search know that the cat's name may have changed."""
+        if isinstance(Cat.all_cats, CatRegistry):
+            Cat.all_cats.name_changed(self)
+
+    def sort_key_changed(self):
+        """Lets the registry know that the cat's sort keys may have changed."""
+        if isinstance(Cat.all_cats, CatRegistry):
+            Cat.all_cats.sort_key_changed(self)
+
+    @staticmethod
+    def living_cats() -> List[Cat]:
+        """Returns all living cats, both in and out of the Clan."""
+        return Cat.get_registry().living()
+
+    @staticmethod
+    def living_clan_cats() -> List[Cat]:
+        """Returns all living cats of the player Clan."""
+        return Cat.get_registry().clan()
+
+    @staticmethod
+    def clan_cats_with_rank(ranks: List[CatRank]) -> List[Cat]:
+        """Returns the living cats of the player Clan that hold one of the given ranks."""
+        return Cat.get_registry().with_rank(ranks)
+
+    @staticmethod
+    def clan_cats_of_age(ages: List[CatAge]) -> List[Cat]:
+        """Returns the living cats of the player Clan that are one of the given ages."""
+        return Cat.get_registry().of_age(ages)
+
+    @staticmethod
+    def outsider_cats() -> List[Cat]:
+        """Returns all living cats that aren't clancats."""
+        return Cat.get_registry().outsiders()
+
+    @staticmethod
+    def afterlife_cats(group_IDs: List[str] = None) -> List[Cat]:
+        """Returns the dead cats in the given afterlife groups, or in all afterlives if none are given."""
+        if group_IDs is None:
+            return Cat.get_registry().in_afterlife()
+        return Cat.get_registry().in_afterlife(group_IDs)
+
     # ---------------------------------------------------------------------------- #
     #                                  Sorting                                     #
     # ---------------------------------------------------------------------------- #
 
     @staticmethod
     def sort_cats(given_list=None):
-        # disable unnecessary lambda in this function
-        # pylint: disable=unnecessary-lambda
         if given_list is None:
             given_list = []
         if not given_list:
             given_list = Cat.all_cats_list
-        sort_type = switch_get_value(Switch.sort_type)
+        given_list.sort(key=Cat.get_sort_key())
+
+    @staticmethod
+    def insert_cat(c: Cat):
+        bisect.insort(Cat.all_cats_list, c, key=Cat.get_sort_key())
+
+    @staticmethod
+    def get_sort_key():
+        """Returns the key function for the current sort type. The keys are kept by the registry until they change."""
+        return Cat.get_registry().get_sort_key(
+            switch_get_value(Switch.sort_type), Cat.make_sort_key
+        )
+
+    @staticmethod
+    def make_sort_key(cat: Cat, sort_type: str):
+        """Returns the key of the cat for the sort type, the cats with the lowest keys come first"""
         if sort_type == "age":
-            given_list.sort(key=lambda x: Cat.get_adjusted_age(x))
+            return Cat.get_adjusted_age(cat)
         elif sort_type == "reverse_age":
-            given_list.sort(key=lambda x: Cat.get_adjusted_age(x), reverse=True)
+            return -1 * Cat.get_adjusted_age(cat)
         elif sort_type == "id":
-            given_list.sort(key=lambda x: int(x.ID))
+            return int(cat.ID)
         elif sort_type == "reverse_id":
-            given_list.sort(key=lambda x: int(x.ID), reverse=True)
+            return -1 * int(cat.ID)
         elif sort_type == "rank":
-            given_list.sort(
-                key=lambda x: (Cat.rank_order(x), Cat.get_adjusted_age(x)), reverse=True
-            )
+            return -1 * Cat.rank_order(cat), -1 * Cat.get_adjusted_age(cat)
         elif sort_type == "exp":
-            given_list.sort(key=lambda x: x.experience, reverse=True)
+            return -1 * cat.experience
         elif sort_type == "death":
-            given_list.sort(key=lambda x: -1 * int(x.dead_for))
-
-        return
-
-    @staticmethod
-    def insert_cat(c: Cat):
-        sort_type = switch_get_value(Switch.sort_type)
-        try:
-            if sort_type == "age":
-                bisect.insort(
-                    Cat.all_cats_list, c, key=lambda x: Cat.get_adjusted_age(x)
-                )
-            elif sort_type == "reverse_age":
-                bisect.insort(
-                    Cat.all_cats_list, c, key=lambda x: -1 * Cat.get_adjusted_age(x)
-                )
-            elif sort_type == "rank":
-                bisect.insort(
-                    Cat.all_cats_list,
-                    c,
-                    key=lambda x: (
-                        -1 * Cat.rank_order(x),
-                        -1 * Cat.get_adjusted_age(x),
-                    ),
-                )
-            elif sort_type == "exp":
-                bisect.insort(Cat.all_cats_list, c, key=lambda x: x.experience)
-            elif sort_type == "id":
-                bisect.insort(Cat.all_cats_list, c, key=lambda x: int(x.ID))
-            elif sort_type == "reverse_id":
-                bisect.insort(Cat.all_cats_list, c, key=lambda x: -1 * int(x.ID))
-            elif sort_type == "death":
-                bisect.insort(Cat.all_cats_list, c, key=lambda x: -1 * int(x.dead_for))
-        except (TypeError, NameError):
-            # If you are using python 3.8, key is not a supported parameter into insort. Therefore, we'll need to
-            # do the slower option of adding the cat, then resorting
-            Cat.all_cats_list.append(c)
-            Cat.sort_cats()
+            return -1 * int(cat.dead_for)
+        return 0
 
     @staticmethod
     def rank_order(cat: Cat):
-        if cat.status.rank in Cat.rank_sort_order:
-            return Cat.rank_sort_order.index(cat.status.rank)
-        else:
-            return 0
+        return Cat.rank_sort_index.get(cat.status.rank, 0)
 
     @staticmethod
     def get_adjusted_age(cat: Cat):
@@ -3195,6 +3236,15 @@ class Cat:
     #                                  properties                                  #
     # ---------------------------------------------------------------------------- #
 
+    @property
+    def name(self) -> Name:
+        return self._name
+
+    @name.setter
+    def name(self, value: Name):
+        self._name = value
+        self.name_changed()
+
     @property
     def experience(self):
         return self._experience
@@ -3203,6 +3253,7 @@ class Cat:
     def experience(self, exp: int):
         exp = min(exp, self.experience_levels_range["master"][1])
         self._experience = int(exp)
+        self.sort_key_changed()
 
         for x in self.experience_levels_range:
             if (
@@ -3213,6 +3264,18 @@ class Cat:
                 self.experience_level = x
                 break
 
+    @property
+    def age(self) -> Optional[CatAge]:
+        return self._age
+
+    @age.setter
+    def age(self, value: Optional[CatAge]):
+        # faded cats may not have an age yet
+        changed = getattr(self, "_age", None) != value
+        self._age = value
+        if changed:
+            self.population_changed()
+
     @property
     def moons(self):
         return self._moons
@@ -3220,6 +3283,7 @@ class Cat:
     @moons.setter
     def moons(self, value: int):
         self._moons = value
+        self.sort_key_changed()
 
         updated_age = False
         for key_age in self.age_moons.keys():
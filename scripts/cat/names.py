@@ -173,6 +173,39 @@ class Name:
     def __str__(self):
         return self.__repr__()
 
+    @property
+    def prefix(self):
+        return self._prefix
+
+    @prefix.setter
+    def prefix(self, value):
+        self._prefix = value
+        self._changed()
+
+    @property
+    def suffix(self):
+        return self._suffix
+
+    @suffix.setter
+    def suffix(self, value):
+        self._suffix = value
+        self._changed()
+
+    @property
+    def specsuffix_hidden(self):
+        return self._specsuffix_hidden
+
+    @specsuffix_hidden.setter
+    def specsuffix_hidden(self, value):
+        self._specsuffix_hidden = value
+        self._changed()
+
+    def _changed(self):
+        # self.cat isn't set yet while the name is made
+        cat = getattr(self, "cat", None)
+        if cat is not None:
+            cat.name_changed()
+
     # Generate possible prefix
     def give_prefix(self, eyes, colour, biome):
         """Generate possible prefix."""
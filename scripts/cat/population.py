@@ -0,0 +1,358 @@
+"""
+Contains the CatRegistry, the dict of all cats that also keeps live views of the population, an index of the
+names of the cats and their sort keys
+"""
+
+from __future__ import annotations
+
+import itertools
+from collections import defaultdict
+from typing import Any, Callable, Dict, List, Iterable, Optional, Set, TYPE_CHECKING
+
+import i18n
+
+from scripts.cat.enums import CatAge, CatRank, CatSocial, CatGroup
+from scripts.cat.status import Status
+from scripts.game_structure import constants
+
+if TYPE_CHECKING:
+    from scripts.cat.cats import Cat
+
+AFTERLIFE_IDS = (
+    CatGroup.STARCLAN_ID,
+    CatGroup.UNKNOWN_RESIDENCE_ID,
+    CatGroup.DARK_FOREST_ID,
+)
+
+
+class CatView:
+    """The cats of a single population view, kept in the order they were added to the registry"""
+
+    def __init__(self, order: Dict[str, int]):
+        """
+        :param order: the registry's insertion number of each cat ID
+        """
+        self.order = order
+        self.members: Dict[str, Cat] = {}
+        self.last_order = -1
+        self.unordered = False
+        """True if a cat was added out of registry order, the members get re-sorted on the next read"""
+
+    def add(self, cat: Cat):
+        self.members[cat.ID] = cat
+        if self.order[cat.ID] < self.last_order:
+            self.unordered = True
+        else:
+            self.last_order = self.order[cat.ID]
+
+    def discard(self, cat_ID: str):
+        self.members.pop(cat_ID, None)
+
+    def cats(self) -> List[Cat]:
+        if self.unordered:
+            self.members = dict(
+                sorted(self.members.items(), key=lambda item: self.order[item[0]])
+            )
+            self.unordered = False
+        return list(self.members.values())
+
+
+class NameIndex:
+    """
+    Finds cats by a part of their name, ignoring case. Every name is indexed by the parts of GRAM_LENGTH letters
+    in it, so a search only checks the cats whose names have all those parts of the searched text.
+    Cats whose names may have changed are marked, and their names are only read again on the next search.
+    All names are read again when the language changes.
+    """
+
+    GRAM_LENGTH = 3
+
+    def __init__(self, cats: Dict[str, Cat]):
+        """
+        :param cats: the cats by ID, to find the cats of the indexed names
+        """
+        self.cats = cats
+        self.read_for = None
+        """The language and april fools setting the names were read with"""
+        self.names: Dict[str, str] = {}
+        """The lower-cased name of each cat ID"""
+        self.grams: Dict[str, Set[str]] = defaultdict(set)
+        """The cat IDs whose names contain each part"""
+        self.changed: Dict[str, Cat] = {}
+        """The cats whose names have to be read again"""
+
+    @classmethod
+    def get_grams(cls, text: str) -> Set[str]:
+        return {
+            text[i : i + cls.GRAM_LENGTH]
+            for i in range(len(text) - cls.GRAM_LENGTH + 1)
+        }
+
+    def mark(self, cat: Cat):
+        self.changed[cat.ID] = cat
+
+    def discard(self, cat_ID: str):
+        self.changed.pop(cat_ID, None)
+        name = self.names.pop(cat_ID, None)
+        if name is None:
+            return
+        for gram in self.get_grams(name):
+            self.grams[gram].discard(cat_ID)
+            if not self.grams[gram]:
+                del self.grams[gram]
+
+    def clear(self):
+        self.names.clear()
+        self.grams.clear()
+        self.changed.clear()
+
+    def _read_changed(self):
+        read_for = (
+            i18n.config.get("locale"),
+            constants.CONFIG["fun"]["april_fools"],
+        )
+        if read_for != self.read_for:
+            # the suffixes of the names can differ
+            self.read_for = read_for
+            for cat_ID in self.names:
+                if cat_ID in self.cats:
+                    self.changed[cat_ID] = self.cats[cat_ID]
+
+        changed, self.changed = self.changed, {}
+        for cat_ID, cat in changed.items():
+            name = str(cat.name).lower()
+            if self.names.get(cat_ID) == name:
+                continue
+            self.discard(cat_ID)
+            self.names[cat_ID] = name
+            for gram in self.get_grams(name):
+                self.grams[gram].add(cat_ID)
+
+    def search(self, text: str, within: Optional[Set[str]] = None) -> Set[str]:
+        """
+        Returns the IDs of the cats whose name contains the text, ignoring case.
+
+        :param text: the part of the name to look for
+        :param within: only these cat IDs are checked, such as the result of searching a part of the text
+        """
+        self._read_changed()
+        text = text.lower()
+        candidates = self.names.keys() if within is None else within
+        if len(text) >= self.GRAM_LENGTH:
+            fewest = min(
+                (self.grams.get(gram, set()) for gram in self.get_grams(text)), key=len
+            )
+            if len(fewest) < len(candidates):
+                candidates = fewest if within is None else fewest.intersection(within)
+        return {cat_ID for cat_ID in candidates if text in self.names.get(cat_ID, "")}
+
+
+class CatRegistry(dict):
+    """
+    Dict of all cats by ID. It keeps live views of the living cats, the living Clan cats by rank and age,
+    the living outsiders and the dead cats by afterlife, so reading a view only costs as much as the cats in it.
+    The views are updated when cats are added or removed, and through refresh() whenever a cat's status or age changes.
+    All views list their cats in the same order as the registry does.
+    The names of the cats are indexed for search_names(), which is told about new names through name_changed().
+    The sort keys of the cats are kept for get_sort_key() until sort_key_changed() or refresh() is called for the cat.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__()
+        self.order: Dict[str, int] = {}
+        """Insertion number of each cat ID, matching the order of the dict"""
+        self.insertion_counter = itertools.count()
+        self.cat_views: Dict[str, tuple] = {}
+        """The view keys each cat ID is currently listed under"""
+        self.views: Dict[tuple, CatView] = {}
+        self.name_index = NameIndex(self)
+        self.sort_keys: Dict[str, Dict[str, Any]] = {}
+        """The kept sort key of each cat ID, by sort type"""
+        self.update(*args, **kwargs)
+
+    @staticmethod
+    def get_view_keys(cat: Cat) -> tuple:
+        """
+        Returns the keys of all views the cat belongs to with its current status and age.
+        """
+        group_ID = cat.status.group_ID
+        if group_ID in AFTERLIFE_IDS:
+            return (("afterlife", group_ID),)
+
+        rank = cat.status.rank
+        view_keys = [("living",)]
+        if group_ID == CatGroup.PLAYER_CLAN_ID:
+            view_keys.extend((("clan",), ("rank", rank), ("age", cat.age)))
+        if Status.social_lookup[rank] != CatSocial.CLANCAT:
+            view_keys.append(("outsider",))
+        return tuple(view_keys)
+
+    def _move_views(self, cat: Cat, view_keys: tuple):
+        """Lists the cat under the given view keys only"""
+        old_view_keys = self.cat_views.get(cat.ID, ())
+        for key in old_view_keys:
+            if key not in view_keys:
+                self.views[key].discard(cat.ID)
+        for key in view_keys:
+            if key in old_view_keys:
+                continue
+            if key not in self.views:
+                self.views[key] = CatView(self.order)
+            self.views[key].add(cat)
+        self.cat_views[cat.ID] = view_keys
+
+    def _remove_from_views(self, cat_ID: str):
+        for key in self.cat_views.pop(cat_ID, ()):
+            self.views[key].discard(cat_ID)
+
+    def refresh(self, cat: Cat):
+        """
+        Moves the cat to the views that match its current status and age. Cats that aren't in the registry are ignored.
+        """
+        if dict.get(self, cat.ID) is not cat:
+            return
+        # the suffix of a name and the sort keys depend on the status
+        self.name_index.mark(cat)
+        self._drop_sort_keys(cat.ID)
+        view_keys = self.get_view_keys(cat)
+        if view_keys != self.cat_views.get(cat.ID):
+            self._move_views(cat, view_keys)
+
+    def name_changed(self, cat: Cat):
+        """
+        Reads the name of the cat again on the next search. Cats that aren't in the registry are ignored.
+        """
+        if dict.get(self, cat.ID) is cat:
+            self.name_index.mark(cat)
+
+    def sort_key_changed(self, cat: Cat):
+        """
+        Makes the sort keys of the cat again the next time they're needed.
+        """
+        self._drop_sort_keys(cat.ID)
+
+    def _drop_sort_keys(self, cat_ID: str):
+        for keys in self.sort_keys.values():
+            keys.pop(cat_ID, None)
+
+    # DICT CHANGES
+    def __setitem__(self, cat_ID: str, cat: Cat):
+        if cat_ID not in self:
+            self.order[cat_ID] = next(self.insertion_counter)
+        elif dict.__getitem__(self, cat_ID) is cat:
+            self.refresh(cat)
+            return
+        else:
+            self._remove_from_views(cat_ID)
+            self._drop_sort_keys(cat_ID)
+        super().__setitem__(cat_ID, cat)
+        self._move_views(cat, self.get_view_keys(cat))
+        self.name_index.mark(cat)
+
+    def __delitem__(self, cat_ID: str):
+        super().__delitem__(cat_ID)
+        self._remove_from_views(cat_ID)
+        self.name_index.discard(cat_ID)
+        self._drop_sort_keys(cat_ID)
+        del self.order[cat_ID]
+
+    def pop(self, cat_ID: str, *default):
+        if cat_ID not in self:
+            return super().pop(cat_ID, *default)
+        cat = self[cat_ID]
+        del self[cat_ID]
+        return cat
+
+    def popitem(self):
+        cat_ID, cat = super().popitem()
+        self._remove_from_views(cat_ID)
+        self.name_index.discard(cat_ID)
+        self._drop_sort_keys(cat_ID)
+        del self.order[cat_ID]
+        return cat_ID, cat
+
+    def setdefault(self, cat_ID: str, default: Cat = None):
+        if cat_ID not in self:
+            self[cat_ID] = default
+        return self[cat_ID]
+
+    def update(self, *args, **kwargs):
+        for cat_ID, cat in dict(*args, **kwargs).items():
+            self[cat_ID] = cat
+
+    def clear(self):
+        super().clear()
+        self.order.clear()
+        self.cat_views.clear()
+        self.views.clear()
+        self.name_index.clear()
+        self.sort_keys.clear()
+
+    # VIEWS
+    def _get_cats(self, view_keys: Iterable[tuple]) -> List[Cat]:
+        views = [self.views[key] for key in view_keys if key in self.views]
+        if not views:
+            return []
+        if len(views) == 1:
+            return views[0].cats()
+        return sorted(
+            itertools.chain.from_iterable(view.members.values() for view in views),
+            key=lambda cat: self.order[cat.ID],
+        )
+
+    def living(self) -> List[Cat]:
+        """Returns all living cats, in and outside the player Clan."""
+        return self._get_cats((("living",),))
+
+    def clan(self) -> List[Cat]:
+        """Returns all living cats of the player Clan."""
+        return self._get_cats((("clan",),))
+
+    def with_rank(self, ranks: Iterable[CatRank]) -> List[Cat]:
+        """Returns the living cats of the player Clan that hold one of the given ranks."""
+        return self._get_cats(("rank", rank) for rank in set(ranks))
+
+    def of_age(self, ages: Iterable[CatAge]) -> List[Cat]:
+        """Returns the living cats of the player Clan that are one of the given ages."""
+        return self._get_cats(("age", age) for age in set(ages))
+
+    def outsiders(self) -> List[Cat]:
+        """Returns all living cats that aren't clancats."""
+        return self._get_cats((("outsider",),))
+
+    def in_afterlife(self, group_IDs: Iterable[str] = AFTERLIFE_IDS) -> List[Cat]:
+        """Returns the dead cats in the given afterlife groups, all afterlives by default."""
+        return self._get_cats(("afterlife", group_ID) for group_ID in set(group_IDs))
+
+    # NAMES
+    def search_names(self, text: str, within: Optional[Set[str]] = None) -> Set[str]:
+        """
+        Returns the IDs of the cats whose name contains the text, ignoring case.
+
+        :param text: the part of the name to look for
+        :param within: only these cat IDs are checked, such as the result of searching a part of the text
+        """
+        return self.name_index.search(text, within)
+
+    # SORTING
+    def get_sort_key(
+        self, sort_type: str, make_key: Callable[[Cat, str], Any]
+    ) -> Callable[[Cat], Any]:
+        """
+        Returns the key function to sort cats with. The key of a cat in the registry is only made again after it may
+        have changed, so a list that was sorted before is sorted again in one pass without making every key again.
+
+        :param sort_type: the sort type the keys are made for
+        :param make_key: makes the key of a cat for a sort type
+        """
+        keys = self.sort_keys.setdefault(sort_type, {})
+
+        def sort_key(cat: Cat):
+            key = keys.get(cat.ID)
+            if key is None or dict.get(self, cat.ID) is not cat:
+                key = make_key(cat, sort_type)
+                if dict.get(self, cat.ID) is cat:
+                    keys[cat.ID] = key
+            return key
+
+        return sort_key
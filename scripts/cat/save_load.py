@@ -4,7 +4,8 @@ from typing import TYPE_CHECKING, Type, List
 
 import ujson
 
-from scripts.game_structure.game.save_load import safe_save
+from scripts.game_structure import constants
+from scripts.game_structure.game.save_load import safe_save, get_clan_storage
 from scripts.game_structure.game.settings.settings import game_setting_get
 from scripts.housekeeping.datadir import get_save_dir
 
@@ -18,40 +19,167 @@ faded_ids = []
 cat_to_fade = []
 """Cats who have been faded since the last save"""
 
+changed_relationships = set()
+"""IDs of cats whose relationships changed since they were last saved or loaded"""
 
-def save_cats(clanname, cat_class: Type["Cat"], game: "Game"):
-    """Save the cat data."""
+saved_clan = None
+"""Name of the clan the saved state below belongs to"""
 
-    directory = Path(get_save_dir()) / clanname
-    history_dir = directory / "history"
-    relationships_dir = directory / "relationships"
+saved_cats = {}
+"""ID: (serialized save dict, indented json block) of each cat as written to clan_cats.json"""
 
-    if not directory.exists():
-        directory.mkdir(parents=True)
+saved_conditions = {}
+"""ID: serialized conditions of each cat as written to its condition file"""
 
-    # Delete all existing relationship files
-    if not relationships_dir.exists():
-        relationships_dir.mkdir()
-    for f in relationships_dir.glob("*.json"):
-        f.unlink()
+saved_histories = {}
+"""ID: serialized history of each cat as written to its history file"""
 
-    save_faded_cats(clanname, cat_class, game)  # Fades cat and saves them, if needed
+loaded_cats = {}
+"""IDs of the cats outside the living Clan whose relationships or history were loaded on demand,
+least recently loaded first. Only these get unloaded again, living Clan cats always stay loaded."""
+
+
+def reset_save_state(clanname=None):
+    """Forget what the previous saves wrote, e.g. because a clan was loaded.
+    Relationships loaded from the files of clanname are marked as unchanged while loading.
+
+    :param clanname: the clan whose files match the cats in memory, if any
+    """
+    global saved_clan
+    saved_clan = clanname
+    saved_cats.clear()
+    saved_conditions.clear()
+    saved_histories.clear()
+    changed_relationships.clear()
+    loaded_cats.clear()
+
+
+def mark_loaded(cat_id: str):
+    """Note that the relationships or history of a cat outside the living Clan were just loaded."""
+    loaded_cats.pop(cat_id, None)
+    loaded_cats[cat_id] = None
 
-    clan_cats = []
-    for inter_cat in cat_class.all_cats.values():
-        cat_data = inter_cat.get_save_dict()
-        clan_cats.append(cat_data)
 
-        inter_cat.save_condition()
+def unload_cats(cat_class: Type["Cat"], budget: int):
+    """Unload the relationships and histories of the cats outside the living Clan, least recently loaded first,
+    until only budget of them are left loaded. They are loaded again from the save when they are needed.
+    Only data that matches the save is unloaded, so this is meant to be called right after saving.
+    """
+    loaded = []
+    for cat_id in list(loaded_cats):
+        cat = cat_class.all_cats.get(cat_id)
+        if cat is None or cat.status.alive_in_player_clan:
+            # living Clan cats stay loaded, so there is no need to keep track of them
+            loaded_cats.pop(cat_id)
+        else:
+            loaded.append(cat)
+
+    for cat in loaded[: max(len(loaded) - budget, 0)]:
+        if cat._history is not None:
+            history = ujson.dumps(cat._history.make_dict())
+            if saved_histories.get(cat.ID) == history:
+                cat.history = None
+        if cat._relationships is not None and cat.ID not in changed_relationships:
+            for relationship in cat._relationships.values():
+                # the other side can't keep linking to a relationship object that is gone
+                other_relationships = relationship.cat_to._relationships
+                if other_relationships is not None:
+                    back = other_relationships.get(cat.ID)
+                    if back is not None and back.opposite_relationship is relationship:
+                        back.opposite_relationship = None
+            cat.relationships = None
+        # the relationships of dead cats aren't saved, so they can't be loaded again
+        if cat._history is None and (cat._relationships is None or cat.dead):
+            loaded_cats.pop(cat.ID)
+
+
+def save_cats(clanname, cat_class: Type["Cat"], game: "Game"):
+    """Save the cat data. Only the cats that changed since the last save are written,
+    all in one transaction of the clan's storage."""
 
-        if inter_cat.history:
-            inter_cat.save_history(history_dir)
-            # after saving, dump the history info
-            inter_cat.history = None
-        if not inter_cat.dead:
-            inter_cat.save_relationship_of_cat(relationships_dir)
+    storage = get_clan_storage(clanname)
 
-    safe_save(f"{get_save_dir()}/{clanname}/clan_cats.json", clan_cats)
+    # saving into another clan than the one in memory, nothing on disk can be trusted
+    if clanname != saved_clan:
+        reset_save_state(clanname)
+        changed_relationships.update(cat_class.all_cats.keys())
+
+    save_faded_cats(clanname, cat_class, game)  # Fades cat and saves them, if needed
+
+    try:
+        with storage.transaction():
+            changed_cats = set()
+            living_cats = set()
+            for inter_cat in cat_class.all_cats.values():
+                cat_data = inter_cat.get_save_dict()
+                serialized = ujson.dumps(cat_data)
+                if (
+                    inter_cat.ID not in saved_cats
+                    or saved_cats[inter_cat.ID][0] != serialized
+                ):
+                    saved_cats[inter_cat.ID] = (
+                        serialized,
+                        ujson.dumps(cat_data, indent=4),
+                    )
+                    changed_cats.add(inter_cat.ID)
+
+                conditions = inter_cat.get_conditions_save_dict()
+                conditions = ujson.dumps(conditions) if conditions is not None else None
+                if (
+                    inter_cat.ID not in saved_conditions
+                    or saved_conditions[inter_cat.ID] != conditions
+                ):
+                    inter_cat.save_condition(storage)
+                    saved_conditions[inter_cat.ID] = conditions
+
+                # only loaded histories can have changed
+                if inter_cat._history:
+                    history = ujson.dumps(inter_cat.history.make_dict())
+                    if saved_histories.get(inter_cat.ID) != history:
+                        inter_cat.save_history(storage)
+                        saved_histories[inter_cat.ID] = history
+
+                # e.g. cats that died or left since they were loaded
+                if (
+                    not inter_cat.status.alive_in_player_clan
+                    and inter_cat.ID not in loaded_cats
+                    and (
+                        inter_cat._history
+                        or inter_cat._relationships is not None
+                        and not inter_cat.dead
+                    )
+                ):
+                    mark_loaded(inter_cat.ID)
+
+                if not inter_cat.dead:
+                    living_cats.add(inter_cat.ID)
+                    if inter_cat.ID in changed_relationships:
+                        inter_cat.save_relationship_of_cat(storage)
+
+            # only living cats keep their relationships
+            storage.keep_relationships(living_cats)
+
+            order_changed = list(saved_cats.keys()) != list(cat_class.all_cats.keys())
+            for cat_id in set(saved_cats) - set(cat_class.all_cats):
+                saved_cats.pop(cat_id)
+                saved_conditions.pop(cat_id, None)
+                saved_histories.pop(cat_id, None)
+
+            if changed_cats or order_changed:
+                storage.write_cats(
+                    {cat_id: saved_cats[cat_id] for cat_id in cat_class.all_cats},
+                    changed_cats,
+                )
+    except:
+        reset_save_state()
+        raise
+
+    # the relationships of dead cats were removed, they have to be written again if the cat comes back
+    changed_relationships.clear()
+    changed_relationships.update(set(cat_class.all_cats) - living_cats)
+
+    # everything outside the living Clan now matches the save and can be loaded again when needed
+    unload_cats(cat_class, constants.CONFIG["save_load"]["loaded_outside_cats"])
 
 
 def save_faded_cats(clanname, cat_class: Type["Cat"], game: "Game"):
@@ -1,6 +1,9 @@
+import hashlib
 import logging
 import os
+import zlib
 from copy import copy
+from itertools import accumulate
 
 import pygame
 import ujson
@@ -8,10 +11,45 @@ import ujson
 from scripts.cat.enums import CatGroup
 from scripts.game_structure import constants, image_cache
 from scripts.game_structure.game.settings import game_setting_get
+from scripts.housekeeping.datadir import get_cache_dir
 from scripts.special_dates import SpecialDate, is_today
 
 logger = logging.getLogger(__name__)
 
+ATLAS_VERSION = 1
+"""Bump this when the way sprites are made from the spritesheets changes, so old atlases get rebuilt"""
+
+
+class LazySprites(dict):
+    """
+    Sprite dict that only cuts (and recolors) a sprite from its spritesheet the first time it's looked up.
+    Sprites that were already made are kept, so every later lookup is a plain dict lookup.
+    """
+
+    def __init__(self, make_sprite):
+        """
+        :param make_sprite: function that makes a sprite from its recipe and adds it to this dict
+        """
+        super().__init__()
+        self.make_sprite = make_sprite
+        self.recipes = {}
+        """The make_sprite arguments for each sprite name that can be made"""
+
+    def __missing__(self, name):
+        if name not in self.recipes:
+            raise KeyError(name)
+        self.make_sprite(*self.recipes[name])
+        return dict.__getitem__(self, name)
+
+    def __contains__(self, name):
+        return dict.__contains__(self, name) or name in self.recipes
+
+    def get(self, name, default=None):
+        try:
+            return self[name]
+        except KeyError:
+            return default
+
 
 class Sprites:
     cat_tints = {}
@@ -79,9 +117,15 @@ class Sprites:
         self.symbol_dict = None
         self.size = None
         self.spritesheets = {}
+        self.spritesheet_files = {}
         self.images = {}
         self.sprites = {}
 
+        # Packed sprites of the baked atlas, unpacked on their first lookup
+        self.atlas_slots = b""
+        self.atlas_offsets = []
+        self.convert_atlas_sprites = False
+
         # Shared empty sprite for placeholders
         self.blank_sprite = None
 
@@ -114,6 +158,17 @@ class Sprites:
         """
         self.spritesheets[name] = pygame.image.load(a_file).convert_alpha()
 
+    def get_spritesheet(self, name):
+        """
+        Return the spritesheet called name, loading it first if it isn't loaded yet.
+
+        Parameters:
+        name -- Name of the spritesheet.
+        """
+        if name not in self.spritesheets:
+            self.spritesheet(self.spritesheet_files[name], name)
+        return self.spritesheets[name]
+
     def make_group(
         self,
         spritesheet,
@@ -123,6 +178,7 @@ class Sprites:
         sprites_y=None,
         no_index=False,
         palettes: list = None,
+        preload=False,
     ):  # pos = ex. (2, 3), no single pixels
         """
         Divide sprites on a spritesheet into groups of sprites that are easily accessible
@@ -133,6 +189,7 @@ class Sprites:
         :param sprites_y: default 7, number of sprites vertically
         :param no_index: default False, set True if sprite name does not require cat pose index:
         :param palettes: list of palette names
+        :param preload: default False, set True to make the sprites right away even when loading lazily
         """
         # pulls the defaults from the pose_sprite_data.json file
         if not sprites_x:
@@ -152,30 +209,69 @@ class Sprites:
                 else:
                     full_name = f"{name}{i}"
 
-                try:
-                    new_sprite = pygame.Surface.subsurface(
-                        self.spritesheets[spritesheet],
-                        group_x_ofs + x * self.size,
-                        group_y_ofs + y * self.size,
-                        self.size,
-                        self.size,
-                    )
-
-                except ValueError:
-                    # Fallback for non-existent sprites
-                    print(f"WARNING: nonexistent sprite - {full_name}")
-                    if not self.blank_sprite:
-                        self.blank_sprite = pygame.Surface(
-                            (self.size, self.size), pygame.HWSURFACE | pygame.SRCALPHA
-                        )
-                    new_sprite = self.blank_sprite
-
-                if palettes:
-                    self.apply_palettes(i, name, new_sprite, palettes)
+                recipe = (
+                    spritesheet,
+                    group_x_ofs + x * self.size,
+                    group_y_ofs + y * self.size,
+                    full_name,
+                    i,
+                    name,
+                    palettes,
+                )
+                if isinstance(self.sprites, LazySprites) and not preload:
+                    # only remember how to make the sprite, it's made on its first lookup
+                    if palettes:
+                        for color_name in palettes:
+                            self.sprites.recipes[f"{name}_{color_name}{i}"] = recipe
+                    else:
+                        self.sprites.recipes[full_name] = recipe
                 else:
-                    self.sprites[full_name] = new_sprite
+                    self.make_sprite(*recipe)
                 i += 1
 
+    def make_sprite(
+        self,
+        spritesheet: str,
+        x: int,
+        y: int,
+        full_name: str,
+        sprite_index: int,
+        name: str,
+        palettes: list = None,
+    ):
+        """
+        Cut a single sprite from a spritesheet and add it (or its palette variations) to the sprites
+        :param spritesheet: name of the spritesheet
+        :param x: pixel offset of the sprite on the spritesheet
+        :param y: pixel offset of the sprite on the spritesheet
+        :param full_name: name of the sprite
+        :param sprite_index: index of the sprite in its group
+        :param name: name of the sprite group
+        :param palettes: list of palette names
+        """
+        try:
+            new_sprite = pygame.Surface.subsurface(
+                self.get_spritesheet(spritesheet),
+                x,
+                y,
+                self.size,
+                self.size,
+            )
+
+        except ValueError:
+            # Fallback for non-existent sprites
+            print(f"WARNING: nonexistent sprite - {full_name}")
+            if not self.blank_sprite:
+                self.blank_sprite = pygame.Surface(
+                    (self.size, self.size), pygame.HWSURFACE | pygame.SRCALPHA
+                )
+            new_sprite = self.blank_sprite
+
+        if palettes:
+            self.apply_palettes(sprite_index, name, new_sprite, palettes)
+        else:
+            self.sprites[full_name] = new_sprite
+
     def apply_palettes(
         self, sprite_index: int, name: str, new_sprite, palette_names: list
     ):
@@ -221,6 +317,12 @@ class Sprites:
         map_array.close()
 
     def load_all(self):
+        # sprites drawn from the previous spritesheets can't be reused
+        image_cache.sprite_cache.clear()
+        lazy = constants.CONFIG["cat_sprites"]["lazy_loading"]
+        self.sprites = LazySprites(self.make_sprite) if lazy else {}
+        self.spritesheets = {}
+
         # get the width and height of the spritesheet
         lineart = pygame.image.load("sprites/lineart.png")
         width, height = lineart.get_size()
@@ -278,25 +380,38 @@ class Sprites:
             else:
                 spritesheets.append(data["spritesheet"])
 
-        for x in spritesheets:
-            if "lineart" in x and (
-                constants.CONFIG["fun"]["april_fools"]
-                or is_today(SpecialDate.APRIL_FOOLS)
-            ):
-                self.spritesheet(f"sprites/{x}_aprilfools.png", x)
-            else:
-                self.spritesheet(f"sprites/{x}.png", x)
+        april_fools = constants.CONFIG["fun"]["april_fools"] or is_today(
+            SpecialDate.APRIL_FOOLS
+        )
+        self.spritesheet_files = {
+            x: (
+                f"sprites/{x}_aprilfools.png"
+                if "lineart" in x and april_fools
+                else f"sprites/{x}.png"
+            )
+            for x in spritesheets
+        }
+
+        # skip the slicing and recoloring if the sprites from these files were baked before.
+        # lazily loaded sprites are cheap to make, so they aren't baked
+        if not lazy:
+            atlas_key = self.get_atlas_key(self.spritesheet_files)
+            if self.load_atlas(atlas_key):
+                return
+            for x, a_file in self.spritesheet_files.items():
+                self.spritesheet(a_file, x)
+        first_symbol = len(self.clan_symbols)
 
         # Line art
         for sheet in self.POSE_DATA["spritesheet"]:
-            self.make_group(sheet, (0, 0), sheet)
+            self.make_group(sheet, (0, 0), sheet, preload=True)
 
         # Fading Fog
         for i in range(0, 3):
-            self.make_group("fademask", (i, 0), f"fademask{i}")
-            self.make_group("fadestarclan", (i, 0), f"fadestarclan{i}")
-            self.make_group("fadedarkforest", (i, 0), f"fadedf{i}")
-            self.make_group("fadeunknownresidence", (i, 0), f"fadeur{i}")
+            self.make_group("fademask", (i, 0), f"fademask{i}", preload=True)
+            self.make_group("fadestarclan", (i, 0), f"fadestarclan{i}", preload=True)
+            self.make_group("fadedarkforest", (i, 0), f"fadedf{i}", preload=True)
+            self.make_group("fadeunknownresidence", (i, 0), f"fadeur{i}", preload=True)
 
         for data in data_jsons:
             # collar accs
@@ -323,6 +438,122 @@ class Sprites:
 
         self.load_symbols()
 
+        if not lazy:
+            self.save_atlas(atlas_key, self.clan_symbols[first_symbol:])
+
+    def get_atlas_key(self, spritesheet_files: dict) -> str:
+        """
+        Hash everything the sprites are made from: the spritesheets, palettes and sprite data,
+        and the sprite size. If any of these change, the baked atlas no longer matches.
+        :param spritesheet_files: dict of spritesheet name to the file it's loaded from
+        """
+        atlas_hash = hashlib.sha1(f"{ATLAS_VERSION}:{self.size}".encode())
+        source_files = sorted(
+            set(spritesheet_files.values())
+            | {
+                f"sprites/palettes/{palette_file}"
+                for palette_file in os.listdir("sprites/palettes")
+            }
+            | {
+                f"sprites/dicts/{data_file}"
+                for data_file in os.listdir("sprites/dicts")
+            }
+        )
+        source_files.append("resources/dicts/clan_symbols.json")
+        for source_file in source_files:
+            atlas_hash.update(source_file.encode())
+            if os.path.isfile(source_file):
+                with open(source_file, "rb") as read_file:
+                    atlas_hash.update(read_file.read())
+
+        return atlas_hash.hexdigest()
+
+    def load_atlas(self, atlas_key: str) -> bool:
+        """
+        Load the sprites from the baked atlas, if there is one for this atlas key.
+        A sprite is only unpacked from the atlas the first time it's looked up.
+        :param atlas_key: the atlas key of the current sprite files
+        :return: True if the sprites were loaded
+        """
+        atlas_path = f"{get_cache_dir()}/sprite_atlas.bin"
+        if not os.path.exists(atlas_path):
+            return False
+
+        try:
+            with open(atlas_path, "rb") as read_file:
+                index = ujson.loads(read_file.readline())
+                if index["key"] != atlas_key:
+                    return False
+                slots = read_file.read()
+            if len(slots) != index["offsets"][-1]:
+                return False
+        except (OSError, ValueError, KeyError, IndexError):
+            print("WARNING: the sprite atlas couldn't be read, rebuilding it")
+            return False
+
+        self.atlas_slots = slots
+        self.atlas_offsets = index["offsets"]
+        # the sprites are usually in the display's format already, so converting them would just copy them
+        self.convert_atlas_sprites = bool(pygame.display.get_surface()) and (
+            pygame.image.frombytes(bytes(4), (1, 1), "BGRA").get_masks()
+            != pygame.Surface((1, 1), pygame.SRCALPHA).convert_alpha().get_masks()
+        )
+
+        self.sprites = LazySprites(self.unpack_sprite)
+        self.sprites.recipes = {
+            name: (name, slot) for name, slot in index["sprites"].items()
+        }
+        self.load_symbol_dict()
+        self.clan_symbols.extend(index["clan_symbols"])
+        return True
+
+    def unpack_sprite(self, name: str, slot: int):
+        """
+        Unpack a sprite from its slot of the baked atlas and add it to self.sprites.
+        :param name: name of the sprite
+        :param slot: the slot of the atlas holding it
+        """
+        size = int(self.size)
+        pixels = zlib.decompress(
+            self.atlas_slots[self.atlas_offsets[slot] : self.atlas_offsets[slot + 1]]
+        )
+        sprite = pygame.image.frombytes(pixels, (size, size), "BGRA")
+        if self.convert_atlas_sprites:
+            sprite = sprite.convert_alpha()
+        self.sprites[name] = sprite
+
+    def save_atlas(self, atlas_key: str, clan_symbols: list):
+        """
+        Bake all loaded sprites into the atlas, so the next startup can skip making them.
+        Identical sprites share a slot of the atlas, and each slot is compressed on its own.
+        :param atlas_key: the atlas key of the current sprite files
+        :param clan_symbols: the clan symbols added by this load
+        """
+        slots = {}
+        sprite_slots = {}
+        for name, sprite in self.sprites.items():
+            pixels = pygame.image.tobytes(sprite, "BGRA")
+            sprite_slots[name] = slots.setdefault(pixels, len(slots))
+        # sprites are mostly transparent, so they shrink to a small part of their size
+        packed = [zlib.compress(pixels, 1) for pixels in slots]
+
+        index = {
+            "key": atlas_key,
+            "sprites": sprite_slots,
+            "offsets": list(accumulate((len(data) for data in packed), initial=0)),
+            "clan_symbols": clan_symbols,
+        }
+        atlas_path = f"{get_cache_dir()}/sprite_atlas.bin"
+        try:
+            os.makedirs(get_cache_dir(), exist_ok=True)
+            # the index is the first line of the atlas, so replacing the file replaces both at once
+            with open(f"{atlas_path}.tmp", "wb") as write_file:
+                write_file.write(ujson.dumps(index).encode() + b"\n")
+                write_file.writelines(packed)
+            os.replace(f"{atlas_path}.tmp", atlas_path)
+        except OSError as e:
+            print(f"WARNING: couldn't save the sprite atlas: {e}")
+
     def load_sheet(self, spritesheet: str, sprite_names: list[list[str]]):
         """
         Loads sheet data and creates sprite groups.
@@ -337,17 +568,20 @@ class Sprites:
                     name=f"{spritesheet}{sprite}",
                 )
 
-    def load_symbols(self):
-        """
-        loads clan symbols
-        """
-
+    def load_symbol_dict(self):
         if os.path.exists("resources/dicts/clan_symbols.json"):
             with open(
                 "resources/dicts/clan_symbols.json", encoding="utf-8"
             ) as read_file:
                 self.symbol_dict = ujson.loads(read_file.read())
 
+    def load_symbols(self):
+        """
+        loads clan symbols
+        """
+
+        self.load_symbol_dict()
+
         # U and X omitted from letter list due to having no prefixes
         letters = [
             "A",
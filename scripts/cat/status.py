@@ -53,6 +53,9 @@ class Status:
         standings with the group. Near is a bool with True indicating the cat is within interact-able distance of that 
         group."""
 
+        self.on_change = None
+        """Called without arguments whenever the current group or rank changes"""
+
         for entry in self.group_history:
             self._convert_old_group_saves(entry)
             # converting strs to enums
@@ -221,6 +224,7 @@ class Status:
                 new_history["rank"] = choice(possible_ranks)
 
         self.group_history = [new_history]
+        self._changed()
 
     def _start_standing(self):
         """
@@ -397,12 +401,23 @@ class Status:
         increment their current moons_as by 1, use increase_current_moons_as()
         """
         self.group_history[-1].update({"moons_as": new_moons_as})
+        self._moons_as_changed()
 
     def increase_current_moons_as(self):
         """
         Use to increment their current group/rank moons_as by 1
         """
         self.group_history[-1]["moons_as"] += 1
+        self._moons_as_changed()
+
+    def _moons_as_changed(self):
+        # the moons spent in an afterlife are how long the cat has been dead for
+        if self.group_history[-1].get("group") in (
+            CatGroup.STARCLAN_ID,
+            CatGroup.UNKNOWN_RESIDENCE_ID,
+            CatGroup.DARK_FOREST_ID,
+        ):
+            self._changed()
 
     def _modify_group(
         self,
@@ -427,6 +442,11 @@ class Status:
 
         # add member standing for new group
         self.change_standing(CatStanding.MEMBER)
+        self._changed()
+
+    def _changed(self):
+        if self.on_change:
+            self.on_change()
 
     def change_standing(self, new_standing: CatStanding, group_ID: str = None):
         """
@@ -574,9 +594,12 @@ class Status:
                 self.group_history.remove(last_entry)
                 last_entry = self.group_history[-1]
             if last_entry["group"] == self.group_ID and last_entry["rank"] == new_rank:
+                # the removed entry may have held a different rank
+                self._changed()
                 return
         group_ID = self.group_ID if not saved_group else saved_group
         self.group_history.append({"group": group_ID, "rank": new_rank, "moons_as": 0})
+        self._changed()
 
     def change_group_nearness(self, group_ID: str):
         """
@@ -12,6 +12,10 @@ from scripts.utility import filter_relationship_type
 if TYPE_CHECKING:
     from scripts.cat.cats import Cat
 
+thought_pools = {}
+"""(file, biome, season, camp): thoughts of that file that fit the clan, in the loaded language"""
+thought_pools_lang = None
+
 
 class Thoughts:
     @staticmethod
@@ -49,6 +53,14 @@ class Thoughts:
         main_cat: "Cat", random_cat: "Cat", thought, game_mode, biome, season, camp
     ) -> bool:
         """Check if the two cats fulfills the thought constraints."""
+        if not Thoughts.thought_fulfill_clan_constraints(thought, biome, season, camp):
+            return False
+
+        return Thoughts.cats_fulfill_cat_constraints(main_cat, random_cat, thought)
+
+    @staticmethod
+    def thought_fulfill_clan_constraints(thought, biome, season, camp) -> bool:
+        """Check the thought constraints that are the same for every cat of the clan."""
 
         # This is for checking biome
         if "biome" in thought:
@@ -65,6 +77,14 @@ class Thoughts:
             if camp not in thought["camp"]:
                 return False
 
+        return True
+
+    @staticmethod
+    def cats_fulfill_cat_constraints(
+        main_cat: "Cat", random_cat: "Cat", thought
+    ) -> bool:
+        """Check if the two cats fulfill the thought constraints that depend on the cats."""
+
         # This is for checking the 'not_working' status
         if "not_working" in thought:
             if thought["not_working"] != main_cat.not_working():
@@ -285,6 +305,38 @@ class Thoughts:
                 created_list.append(inter)
         return created_list
 
+    @staticmethod
+    def get_thought_pool(location, biome, season, camp) -> list:
+        """Get the thoughts of a thought file that fit the clan's biome, season and camp.
+        The pools are kept until the language changes, so each file is only read and filtered once.
+
+        :param location: the thought file, relative to the language folder
+        :exception FileNotFoundError: If the thought file doesn't exist
+        """
+        global thought_pools_lang
+        if thought_pools_lang != i18n.config.get("locale"):
+            thought_pools_lang = i18n.config.get("locale")
+            thought_pools.clear()
+
+        key = (location, biome, season, camp)
+        if key not in thought_pools:
+            thought_pools[key] = [
+                thought
+                for thought in load_lang_resource(location)
+                if Thoughts.thought_fulfill_clan_constraints(
+                    thought, biome, season, camp
+                )
+            ]
+        return thought_pools[key]
+
+    @staticmethod
+    def create_thoughts_from_pool(thought_pool, main_cat, other_cat) -> list:
+        return [
+            thought
+            for thought in thought_pool
+            if Thoughts.cats_fulfill_cat_constraints(main_cat, other_cat, thought)
+        ]
+
     @staticmethod
     def load_thoughts(main_cat, other_cat, game_mode, biome, season, camp):
         rank = main_cat.status.rank
@@ -310,20 +362,20 @@ class Thoughts:
         # newborns only pull from their status thoughts. this is done for convenience
         try:
             if main_cat.age == "newborn":
-                loaded_thoughts = load_lang_resource(
-                    f"thoughts/{life_dir}{spec_dir}/newborn.json"
+                loaded_thoughts = Thoughts.get_thought_pool(
+                    f"thoughts/{life_dir}{spec_dir}/newborn.json", biome, season, camp
                 )
             else:
-                thoughts = load_lang_resource(
-                    f"thoughts/{life_dir}{spec_dir}/{rank}.json"
+                thoughts = Thoughts.get_thought_pool(
+                    f"thoughts/{life_dir}{spec_dir}/{rank}.json", biome, season, camp
                 )
-                genthoughts = load_lang_resource(
-                    f"thoughts/{life_dir}{spec_dir}/general.json"
+                genthoughts = Thoughts.get_thought_pool(
+                    f"thoughts/{life_dir}{spec_dir}/general.json", biome, season, camp
                 )
                 loaded_thoughts = thoughts + genthoughts
 
-            final_thoughts = Thoughts.create_thoughts(
-                loaded_thoughts, main_cat, other_cat, game_mode, biome, season, camp
+            final_thoughts = Thoughts.create_thoughts_from_pool(
+                loaded_thoughts, main_cat, other_cat
             )
             return final_thoughts
         except IOError:
@@ -358,21 +410,16 @@ class Thoughts:
         THOUGHTS: []
         try:
             if main_cat.status.is_leader and lives_left > 0:
-                loaded_thoughts = load_lang_resource(
-                    f"thoughts/on_death/{afterlife}/leader_life.json"
-                )
+                thought_file = f"thoughts/on_death/{afterlife}/leader_life.json"
             elif main_cat.status.is_leader and lives_left == 0:
-                loaded_thoughts = load_lang_resource(
-                    f"thoughts/on_death/{afterlife}/leader_death.json"
-                )
+                thought_file = f"thoughts/on_death/{afterlife}/leader_death.json"
             else:
-                loaded_thoughts = load_lang_resource(
-                    f"thoughts/on_death/{afterlife}/general.json"
-                )
+                thought_file = f"thoughts/on_death/{afterlife}/general.json"
+            loaded_thoughts = Thoughts.get_thought_pool(
+                thought_file, biome, season, camp
+            )
             thought_group = choice(
-                Thoughts.create_thoughts(
-                    loaded_thoughts, main_cat, other_cat, game_mode, biome, season, camp
-                )
+                Thoughts.create_thoughts_from_pool(loaded_thoughts, main_cat, other_cat)
             )
             chosen_thought = choice(thought_group["thoughts"])
             return chosen_thought
@@ -34,6 +34,12 @@ BLOOD_RELATIVE_TYPES = [
 class Inheritance:
     all_inheritances = {}  # ID: object
 
+    # family graph shared by all inheritances, so relatives can be found by walking
+    # the graph instead of scanning every cat
+    children_index = None  # parent ID: {kit ID: None}, built lazily
+    index_order = {}  # cat ID: registration order, keeps results in all_cats order
+    referenced_by = {}  # cat ID: set of IDs whose inheritance lists this cat
+
     def __init__(self, cat, born=False):
         self.need_update = False
         self.mates = None
@@ -51,6 +57,10 @@ class Inheritance:
         self.all_involved = []
         self.all_but_cousins = []
 
+        # carry over the references of the replaced inheritance, so they can be cleaned up
+        previous = self.all_inheritances.get(cat.ID)
+        self.references = previous.references if previous else set()
+
         self.cat = cat
         self.update_inheritance()
 
@@ -81,6 +91,9 @@ class Inheritance:
         # helping variables
         self.need_update = []
 
+        # make sure the current parents of this cat are known to the family graph
+        self.register_cat(self.cat)
+
         # parents
         self.init_parents()
 
@@ -90,10 +103,18 @@ class Inheritance:
         # mates
         self.init_mates()
 
-        for inter_id, inter_cat in self.cat.all_cats.items():
-            if inter_id == self.cat.ID:
-                continue
-
+        # only kits of the cat, its parents, its grandparents and of their kits
+        # can be a kit, sibling, parents_sibling or cousin
+        parents_and_parents_siblings = [
+            inter_id for inter_id, _ in self.get_indexed_children(*self.grand_parents)
+        ]
+        candidates = self.get_indexed_children(
+            self.cat.ID,
+            *self.get_parents(),
+            *self.grand_parents,
+            *parents_and_parents_siblings,
+        )
+        for inter_id, inter_cat in candidates:
             # kits + their mates
             self.init_kits(inter_id, inter_cat)
 
@@ -107,11 +128,7 @@ class Inheritance:
             self.init_cousins(inter_id, inter_cat)
 
         # since grand kits depending on kits, ALL KITS HAVE TO BE SET FIRST!
-        for inter_id, inter_cat in self.cat.all_cats.items():
-            if inter_id == self.cat.ID:
-                continue
-
-            # grand kits
+        for inter_id, inter_cat in self.get_indexed_children(*self.kits):
             self.init_grand_kits(inter_id, inter_cat)
 
         # relations to faded cats - these must occur after all non-faded
@@ -126,6 +143,8 @@ class Inheritance:
 
         self.init_faded_cousins()
 
+        self.update_references()
+
         if len(self.need_update) > 1:
             for update_id in self.need_update:
                 if update_id in self.all_inheritances:
@@ -152,7 +171,10 @@ class Inheritance:
         It renews all inheritances, where this cat is listed as a mate of a kit or sibling.
         """
         self.update_inheritance()
-        for inter_inheritances in self.all_inheritances.values():
+        for inter_id in list(self.referenced_by.get(self.cat.ID, ())):
+            inter_inheritances = self.all_inheritances.get(inter_id)
+            if inter_inheritances is None or inter_inheritances is self:
+                continue
             if (
                 self.cat.ID in inter_inheritances.other_mates
                 or self.cat.ID in inter_inheritances.all_involved
@@ -223,8 +245,74 @@ class Inheritance:
             self.cat.adoptive_parents.append(parent.ID)
         self.all_involved.append(parent.ID)
         self.all_but_cousins.append(parent.ID)
+        self.register_cat(self.cat)
+        self.update_references()
         self.update_all_related_inheritance()
 
+    # ---------------------------------------------------------------------------- #
+    #                                 family graph                                 #
+    # ---------------------------------------------------------------------------- #
+
+    @classmethod
+    def reset_family_index(cls):
+        """Drop the family graph, it will be rebuilt from all_cats when it is needed next.
+        Has to be called when all_cats gets replaced, e.g. when a clan is loaded."""
+        cls.children_index = None
+        cls.index_order = {}
+        cls.referenced_by = {}
+
+    @classmethod
+    def build_family_index(cls, all_cats):
+        """Build the parent -> kits graph with one pass over all cats."""
+        cls.children_index = {}
+        cls.index_order = {}
+        for inter_cat in all_cats.values():
+            cls.register_cat(inter_cat)
+
+    @classmethod
+    def register_cat(cls, cat):
+        """Add the current (blood and adoptive) parents of the cat to the family graph.
+        Removed parents don't have to be unregistered, stale edges are filtered on lookup.
+        """
+        if cls.children_index is None:
+            return
+        if cat.ID not in cls.index_order:
+            cls.index_order[cat.ID] = len(cls.index_order)
+        for parent_id in [cat.parent1, cat.parent2, *cat.adoptive_parents]:
+            if parent_id:
+                cls.children_index.setdefault(parent_id, {})[cat.ID] = None
+
+    def get_indexed_children(self, *parent_ids) -> list:
+        """Returns (id, cat) tuples of all cats in all_cats which are registered as kits
+        of one of the given parents, in the order of all_cats. This cat is never included.
+        """
+        all_cats = self.cat.all_cats
+        if self.children_index is None:
+            self.build_family_index(all_cats)
+
+        kit_ids = set()
+        for parent_id in parent_ids:
+            kit_ids.update(self.children_index.get(parent_id, ()))
+        kit_ids.discard(self.cat.ID)
+
+        return [
+            (kit_id, all_cats[kit_id])
+            for kit_id in sorted(kit_ids, key=lambda i: self.index_order.get(i, -1))
+            if kit_id in all_cats
+        ]
+
+    def update_references(self):
+        """Keep track of which inheritances list which cat, so only those have to be
+        updated if the mates of a cat change."""
+        new_references = set(self.all_involved) | set(self.other_mates)
+        for cat_id in self.references - new_references:
+            owners = self.referenced_by.get(cat_id)
+            if owners:
+                owners.discard(self.cat.ID)
+        for cat_id in new_references - self.references:
+            self.referenced_by.setdefault(cat_id, set()).add(self.cat.ID)
+        self.references = new_references
+
     # ---------------------------------------------------------------------------- #
     #                            different init function                           #
     # ---------------------------------------------------------------------------- #
@@ -495,8 +583,8 @@ class Inheritance:
                 }
                 self.other_mates.append(mate_id)
 
-            # iterate over all cats, to get the children of the sibling
-            for _c in self.cat.all_cats.values():
+            # walk the family graph, to get the children of the sibling
+            for _, _c in self.get_indexed_children(inter_id):
                 _c_parents = self.get_parents(_c)
                 _c_adoptive = self.get_adoptive_parents(_c)
                 if inter_id in _c_parents:
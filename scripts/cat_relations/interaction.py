@@ -1,7 +1,13 @@
 import i18n
 
+from scripts.cat.skills import SkillPath, HiddenSkillEnum
 from scripts.cat_relations.enums import RelType
-from scripts.events_module.event_filters import event_for_cat
+from scripts.events_module.event_filters import (
+    event_for_cat,
+    event_for_location,
+    event_for_season,
+)
+from scripts.game_structure import game
 from scripts.game_structure.localization import load_lang_resource
 
 
@@ -165,6 +171,171 @@ def cats_fulfill_single_interaction_constraints(
     return False
 
 
+class InteractionConstraints:
+    """
+    The cat constraints of a single interaction, compiled down to the checks that actually apply.
+    Gives the same result as cats_fulfill_single_interaction_constraints, without going through
+    every empty constraint list and re-parsing the skill requirements for each pair of cats.
+    The interaction shouldn't be changed after its constraints are compiled.
+    """
+
+    def __init__(self, interaction: SingleInteraction):
+        self.interaction = interaction
+        self.main_checks = self.compile_checks(
+            interaction.main_status_constraint,
+            interaction.main_trait_constraint,
+            interaction.main_skill_constraint,
+            interaction.backstory_constraint.get("m_c"),
+        )
+        self.random_checks = self.compile_checks(
+            interaction.random_status_constraint,
+            interaction.random_trait_constraint,
+            interaction.random_skill_constraint,
+            interaction.backstory_constraint.get("r_c"),
+        )
+        self.relationship_constraint = interaction.relationship_constraint
+        self.main_injuries = (
+            frozenset(interaction.has_injuries["m_c"])
+            if "m_c" in interaction.has_injuries
+            else None
+        )
+        self.random_injuries = (
+            frozenset(interaction.has_injuries["r_c"])
+            if "r_c" in interaction.has_injuries
+            else None
+        )
+
+    @staticmethod
+    def compile_checks(statuses, traits, skills, backstories) -> tuple:
+        """Returns the (check, requirement) pairs for the constraints that aren't empty."""
+        checks = []
+        if statuses and "any" not in statuses:
+            checks.append((InteractionConstraints.check_status, statuses))
+        if traits:
+            checks.append((InteractionConstraints.check_trait, frozenset(traits)))
+        if skills:
+            required_skills = []
+            for _skill in skills:
+                skill_info = _skill.split(",")
+                if len(skill_info) < 2:
+                    print("Cat skill incorrectly formatted", _skill)
+                    continue
+                if skill_info[0] in SkillPath.__members__:
+                    path = SkillPath[skill_info[0]]
+                elif skill_info[0] in HiddenSkillEnum.__members__:
+                    path = HiddenSkillEnum[skill_info[0]]
+                else:
+                    print(f"{skill_info[0]} is not a real skill path")
+                    continue
+                required_skills.append((path, int(skill_info[1])))
+            checks.append((InteractionConstraints.check_skill, tuple(required_skills)))
+        if backstories:
+            checks.append(
+                (InteractionConstraints.check_backstory, frozenset(backstories))
+            )
+        return tuple(checks)
+
+    @staticmethod
+    def check_status(cat, statuses) -> bool:
+        return cat.status.rank in statuses or (
+            "lost" in statuses and cat.status.is_lost()
+        )
+
+    @staticmethod
+    def check_trait(cat, traits) -> bool:
+        return cat.personality.trait in traits
+
+    @staticmethod
+    def check_skill(cat, required_skills) -> bool:
+        return any(
+            cat.skills.meets_skill_requirement(path, tier)
+            for path, tier in required_skills
+        )
+
+    @staticmethod
+    def check_backstory(cat, backstories) -> bool:
+        return cat.backstory in backstories
+
+    def fulfilled_by(self, main_cat, random_cat) -> bool:
+        """Check if the two cats fulfill the interaction constraints."""
+        if self.main_injuries is not None and self.main_injuries.isdisjoint(
+            main_cat.injuries
+        ):
+            return False
+        if self.random_injuries is not None and self.random_injuries.isdisjoint(
+            random_cat.injuries
+        ):
+            return False
+
+        for check, requirement in self.main_checks:
+            if not check(main_cat, requirement):
+                return False
+        for check, requirement in self.random_checks:
+            if not check(random_cat, requirement):
+                return False
+
+        if self.relationship_constraint:
+            return event_for_cat(
+                {"relationship_status": self.relationship_constraint},
+                main_cat,
+                [main_cat, random_cat],
+                event_id=self.interaction.id,
+            )
+        return True
+
+
+class InteractionTable:
+    """
+    A list of interactions, partitioned by intensity for the location and season of the clan.
+    The partitions are made the first time a clan setting is asked for and kept, so filtering
+    an interaction for a pair of cats is a lookup plus the compiled cat constraints.
+    """
+
+    def __init__(self, interactions: list):
+        self.interactions = interactions
+        self.constraints = [
+            InteractionConstraints(interaction) for interaction in interactions
+        ]
+        self.partitions = {}
+        """(biome, override biome, camp, season): (constraints of all intensities, {intensity: constraints})"""
+
+    def __len__(self):
+        return len(self.interactions)
+
+    def get_candidates(self, intensity: str = None) -> list:
+        """
+        Returns the constraints of the interactions that fit the clan's location, season
+        and the given intensity, in their original order.
+        """
+        key = (
+            game.clan.biome,
+            game.clan.override_biome,
+            game.clan.camp_bg,
+            game.clan.current_season,
+        )
+        if key not in self.partitions:
+            all_intensities = []
+            by_intensity = {}
+            for constraints in self.constraints:
+                interaction = constraints.interaction
+                if not event_for_location(interaction.biome):
+                    continue
+                if not event_for_season(interaction.season):
+                    continue
+                all_intensities.append(constraints)
+                # a badly formatted intensity can't match any intensity that's asked for
+                if isinstance(interaction.intensity, str):
+                    by_intensity.setdefault(interaction.intensity, []).append(
+                        constraints
+                    )
+            self.partitions[key] = (all_intensities, by_intensity)
+
+        all_intensities, by_intensity = self.partitions[key]
+        if intensity is None:
+            return all_intensities
+        return by_intensity.get(intensity, [])
+
+
 # ---------------------------------------------------------------------------- #
 #                            BUILD MASTER DICTIONARY                           #
 # ---------------------------------------------------------------------------- #
@@ -242,6 +413,9 @@ def create_group_interaction(inter_list) -> list:
 
 INTERACTION_MASTER_DICT = {x: {} for x in [*RelType]}
 
+INTERACTION_TABLES = {x: {} for x in [*RelType]}
+"""The interactions of INTERACTION_MASTER_DICT as InteractionTables"""
+
 relationship_lang = None
 
 
@@ -249,6 +423,7 @@ def rebuild_relationship_dicts():
     global INTERACTION_MASTER_DICT, relationship_lang
     if relationship_lang == i18n.config.get("locale"):
         return
+    relationship_lang = i18n.config.get("locale")
 
     for rel in [*RelType]:
         INTERACTION_MASTER_DICT[rel]["increase"] = create_interaction(
@@ -261,3 +436,7 @@ def rebuild_relationship_dicts():
                 f"events/relationship_events/normal_interactions/{rel}/decrease.json"
             )
         )
+        for value_change in ("increase", "decrease"):
+            INTERACTION_TABLES[rel][value_change] = InteractionTable(
+                INTERACTION_MASTER_DICT[rel][value_change]
+            )
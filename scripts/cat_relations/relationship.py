@@ -1,12 +1,14 @@
 import random
 from random import choice
-from typing import Optional
+from typing import Optional, Union
 
 import i18n
 
+from scripts.cat import save_load
 from scripts.cat.enums import CatCompatibility
 from scripts.game_structure import constants
 from scripts.cat_relations.interaction import (
+    InteractionTable,
     cats_fulfill_single_interaction_constraints,
     rebuild_relationship_dicts,
 )
@@ -24,7 +26,25 @@ import scripts.cat_relations.interaction as interactions
 
 
 class Relationship:
-    used_interaction_ids = []
+    # every cat has a relationship to every other cat, so they are kept small
+    __slots__ = (
+        "cat_from",
+        "cat_to",
+        "_mates",
+        "_family",
+        "opposite_relationship",
+        "chosen_interaction",
+        "_log",
+        "_romance",
+        "_like",
+        "_respect",
+        "_trust",
+        "_comfort",
+        "_used_interaction_ids",
+    )
+
+    shared_interaction_ids = []
+    """Ids of the recently used interactions, for relationships that didn't reset their own"""
     currently_loaded_lang = None
 
     def __init__(
@@ -48,12 +68,8 @@ class Relationship:
         self.opposite_relationship = (
             None  # link to opposite relationship will be created later
         )
-        self.interaction_str = ""
-        self.triggered_event = False
-        if log:
-            self.log = log
-        else:
-            self.log = []
+        # most relationships never get a log entry, so the list is only made when needed
+        self._log = log or None
 
         # romance operates on a 0-100 scale, 0 is no romantic interest and 100 is full romantic interest
         self.romance = romance
@@ -65,6 +81,53 @@ class Relationship:
         self.trust = trust
         self.comfort = comfort
 
+    @property
+    def mates(self) -> bool:
+        return self._mates
+
+    @mates.setter
+    def mates(self, value: bool):
+        self._mates = value
+        self.mark_changed()
+
+    @property
+    def family(self) -> bool:
+        return self._family
+
+    @family.setter
+    def family(self, value: bool):
+        self._family = value
+        self.mark_changed()
+
+    @property
+    def log(self) -> list:
+        if self._log is None:
+            self._log = []
+        return self._log
+
+    @log.setter
+    def log(self, value: list):
+        self._log = value
+
+    @property
+    def used_interaction_ids(self) -> list:
+        return getattr(
+            self, "_used_interaction_ids", Relationship.shared_interaction_ids
+        )
+
+    @used_interaction_ids.setter
+    def used_interaction_ids(self, value: list):
+        self._used_interaction_ids = value
+
+    def mark_changed(self):
+        """Flag the relationships of cat_from, so they are written on the next save."""
+        save_load.changed_relationships.add(self.cat_from.ID)
+
+    def add_log(self, text: str):
+        """Add an entry to the relationship log."""
+        self.log.append(text)
+        self.mark_changed()
+
     def to_dict(self):
         return {
             "cat_from_id": self.cat_from.ID,
@@ -76,7 +139,7 @@ class Relationship:
             "respect": self.respect,
             "comfort": self.comfort,
             "trust": self.trust,
-            "log": self.log,
+            "log": self._log or [],
         }
 
     def link_relationship(self):
@@ -118,9 +181,9 @@ class Relationship:
         # choose any type of intensity
         intensity = random.choices(("low", "medium", "high"), weights=[4, 3, 2])[0]
 
-        all_interactions = interactions.INTERACTION_MASTER_DICT[rel_type][
+        all_interactions = interactions.INTERACTION_TABLES[rel_type][
             "increase" if positive else "decrease"
-        ].copy()
+        ]
 
         possible_interactions = self.get_relevant_interactions(
             all_interactions, intensity
@@ -216,7 +279,7 @@ class Relationship:
             effect = i18n.t(f"relationships.negative_postscript_{intensity}")
 
         interaction_str = interaction_str + effect
-        self.log.append(
+        self.add_log(
             interaction_str
             + i18n.t(
                 "relationships.age_postscript",
@@ -448,7 +511,7 @@ class Relationship:
 
     def get_relevant_interactions(
         self,
-        possible_interactions: list,
+        possible_interactions: Union[list, InteractionTable],
         intensity: str = None,
     ) -> list:
         """
@@ -456,7 +519,7 @@ class Relationship:
 
             Parameters
             ----------
-            possible_interactions : list
+            possible_interactions : list or InteractionTable
                 the interactions which need to be filtered
             intensity : str
                 the intensity of the interactions
@@ -473,6 +536,13 @@ class Relationship:
                 f"No possible relationship interactions found for cat_from: {self.cat_from.ID} and cat_to: {self.cat_to.ID}"
             )
 
+        if isinstance(possible_interactions, InteractionTable):
+            return [
+                constraints.interaction
+                for constraints in possible_interactions.get_candidates(intensity)
+                if constraints.fulfilled_by(self.cat_from, self.cat_to)
+            ]
+
         for interact in possible_interactions:
             if not event_for_location(interact.biome):
                 continue
@@ -571,6 +641,7 @@ class Relationship:
         elif value < 0:
             value = 0
         self._romance = value
+        self.mark_changed()
 
     @property
     def romance_tier(self) -> Optional[RelTier]:
@@ -596,6 +667,7 @@ class Relationship:
         elif value < -100:
             value = -100
         self._like = value
+        self.mark_changed()
 
     @property
     def like_tier(self) -> Optional[RelTier]:
@@ -627,6 +699,7 @@ class Relationship:
         elif value < -100:
             value = -100
         self._respect = value
+        self.mark_changed()
 
     @property
     def respect_tier(self) -> Optional[RelTier]:
@@ -658,6 +731,7 @@ class Relationship:
         elif value < -100:
             value = -100
         self._comfort = value
+        self.mark_changed()
 
     @property
     def comfort_tier(self) -> Optional[RelTier]:
@@ -689,6 +763,7 @@ class Relationship:
         elif value < -100:
             value = -100
         self._trust = value
+        self.mark_changed()
 
     @property
     def trust_tier(self) -> Optional[RelTier]:
@@ -31,7 +31,12 @@ from scripts.clan_resources.herb.herb_supply import HerbSupply
 from scripts.events_module.future.future_event import FutureEvent
 from scripts.events_module.generate_events import OngoingEvent
 from scripts.game_structure import constants
-from scripts.game_structure.game.save_load import safe_save, save_clanlist, read_clans
+from scripts.game_structure.game.save_load import (
+    safe_save,
+    save_clanlist,
+    read_clans,
+    get_clan_storage,
+)
 from scripts.game_structure.game.switches import (
     switch_set_value,
     switch_get_value,
@@ -465,7 +470,8 @@ class Clan:
         if game.clan.game_mode in ("expanded", "cruel season"):
             self.save_freshkill_pile(game.clan)
 
-        safe_save(f"{get_save_dir()}/{self.name}clan.json", clan_data)
+        with get_clan_storage(self.name).transaction() as storage:
+            storage.write_clan(clan_data)
 
         if os.path.exists(get_save_dir() + f"/{self.name}clan.txt") & (
             self.name != "current"
@@ -478,9 +484,7 @@ class Clan:
         """
 
         version_info = None
-        if os.path.exists(
-            get_save_dir() + "/" + switch_get_value(Switch.clan_list)[0] + "clan.json"
-        ):
+        if get_clan_storage(switch_get_value(Switch.clan_list)[0]).has_clan():
             version_info = self.load_clan_json()
         elif os.path.exists(
             get_save_dir() + "/" + switch_get_value(Switch.clan_list)[0] + "clan.txt"
@@ -691,12 +695,7 @@ class Clan:
         switch_set_value(
             Switch.error_message, "There was an error loading the clan.json"
         )
-        with open(
-            get_save_dir() + "/" + switch_get_value(Switch.clan_list)[0] + "clan.json",
-            "r",
-            encoding="utf-8",
-        ) as read_file:  # pylint: disable=redefined-outer-name
-            clan_data = ujson.loads(read_file.read())
+        clan_data = get_clan_storage(switch_get_value(Switch.clan_list)[0]).read_clan()
 
         if clan_data["leader"]:
             leader = Cat.all_cats[clan_data["leader"]]
@@ -237,9 +237,7 @@ class FreshkillPile:
 
         :return int|float needed_prey: The amount of prey the Clan needs
         """
-        living_cats = [
-            cat for cat in Cat.all_cats.values() if cat.status.alive_in_player_clan
-        ]
+        living_cats = Cat.living_clan_cats()
         self._update_needed_food(living_cats)
         return self.needed_prey
 
@@ -5,10 +5,12 @@ from scripts.debug_commands.cat_pregnancy import PregnanciesCommand
 from scripts.debug_commands.command import Command
 from scripts.debug_commands.eval import EvalCommand, UnderstandRisksCommand
 from scripts.debug_commands.fps import FpsCommand
+from scripts.debug_commands.frames import FramesCommand
 from scripts.debug_commands.help import HelpCommand
 from scripts.debug_commands.settings import ToggleCommand, SetCommand, GetCommand
 from scripts.debug_commands.cat_pregnancy import PregnanciesCommand
 from scripts.debug_commands.clan import ClanCommand
+from scripts.debug_commands.timing import TimingCommand
 
 arbitrary_assignation = "to prevent optimizers from moving BiomeCommand to the top of the list and crashing the game"
 # for some reason if this is at the top of the list, it crashes.
@@ -21,9 +23,11 @@ commandList: List[Command] = [
     EvalCommand(),
     BiomeCommand(),
     FpsCommand(),
+    FramesCommand(),
     CatsCommand(),
     ClanCommand(),
     PregnanciesCommand(),
+    TimingCommand(),
 ]
 
 helpCommand = HelpCommand(commandList)
@@ -0,0 +1,104 @@
+from typing import List
+
+from scripts.debug_commands.command import Command
+from scripts.debug_commands.utils import (
+    add_output_line_to_log,
+    add_multiple_lines_to_log,
+)
+from scripts.game_structure.frame_profiler import frame_profiler, STAGES
+
+
+class FramesOnCommand(Command):
+    name = "on"
+    description = "Start profiling frames and show the frame-time graph"
+
+    def callback(self, args: List[str]):
+        frame_profiler.set_enabled(True)
+        add_output_line_to_log("Frame profiler enabled")
+
+
+class FramesOffCommand(Command):
+    name = "off"
+    description = "Stop profiling frames, keeping the frames so far"
+
+    def callback(self, args: List[str]):
+        frame_profiler.set_enabled(False)
+        add_output_line_to_log("Frame profiler disabled")
+
+
+class FramesShowCommand(Command):
+    name = "show"
+    description = "Show a percentile of each stage over the recorded frames"
+    aliases = ["s"]
+
+    usage = "[percentile]"
+
+    def callback(self, args: List[str]):
+        try:
+            percentile = float(args[0]) if args else 99
+        except ValueError:
+            add_output_line_to_log(f"Invalid percentile, {args[0]}")
+            return
+        if not 0 <= percentile <= 100:
+            add_output_line_to_log("The percentile must be between 0 and 100")
+            return
+
+        percentiles = frame_profiler.get_stage_percentiles(percentile)
+        if not percentiles:
+            add_output_line_to_log("No frames recorded")
+            return
+        frame_times = sorted(frame_profiler.get_frame_times())
+        frame_time = frame_times[round((len(frame_times) - 1) * percentile / 100)]
+        add_multiple_lines_to_log(
+            f"p{percentile:g} over {len(frame_times)} frames: {frame_time * 1000:.2f}ms\n"
+            + "\n".join(
+                f"{stage}: {percentiles[stage] * 1000:.2f}ms"
+                for stage in STAGES
+                if stage in percentiles
+            )
+        )
+
+
+class FramesResetCommand(Command):
+    name = "reset"
+    description = "Forget the recorded frames"
+    aliases = ["r"]
+
+    def callback(self, args: List[str]):
+        frame_profiler.clear()
+        add_output_line_to_log("Recorded frames cleared")
+
+
+class FramesDumpCommand(Command):
+    name = "dump"
+    description = "Write the recorded frames to a Chrome trace JSON file"
+    aliases = ["d"]
+
+    usage = "[file path]"
+
+    def callback(self, args: List[str]):
+        try:
+            path = frame_profiler.dump_chrome_trace(args[0] if args else None)
+        except OSError as e:
+            add_output_line_to_log(f"Could not write the frames: {e}")
+            return
+        add_output_line_to_log(f"Frames written to {path}")
+
+
+class FramesCommand(Command):
+    name = "frames"
+    description = "Profile the stages of each frame"
+    aliases = ["frame"]
+
+    sub_commands = [
+        FramesOnCommand(),
+        FramesOffCommand(),
+        FramesShowCommand(),
+        FramesResetCommand(),
+        FramesDumpCommand(),
+    ]
+
+    def callback(self, args: List[str]):
+        add_output_line_to_log(
+            f"Frame profiler is {'enabled' if frame_profiler.enabled else 'disabled'}, please specify a subcommand"
+        )
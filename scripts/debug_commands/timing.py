@@ -0,0 +1,97 @@
+from typing import List
+
+from scripts.debug_commands.command import Command
+from scripts.debug_commands.utils import (
+    add_output_line_to_log,
+    add_multiple_lines_to_log,
+)
+from scripts.game_structure import timing
+
+
+class TimingOnCommand(Command):
+    name = "on"
+    description = "Start timing the moon skip"
+
+    def callback(self, args: List[str]):
+        timing.set_enabled(True)
+        add_output_line_to_log("Timing enabled")
+
+
+class TimingOffCommand(Command):
+    name = "off"
+    description = "Stop timing the moon skip, keeping the timings so far"
+
+    def callback(self, args: List[str]):
+        timing.set_enabled(False)
+        add_output_line_to_log("Timing disabled")
+
+
+class TimingShowCommand(Command):
+    name = "show"
+    description = "Show the timings so far"
+    aliases = ["s"]
+
+    usage = "[amount of spans]"
+
+    def callback(self, args: List[str]):
+        report = timing.get_report()
+        if not report:
+            add_output_line_to_log(
+                "Nothing timed yet" if timing.enabled else "Timing is disabled"
+            )
+            return
+        if args and args[0].isnumeric():
+            report = report[: int(args[0])]
+        add_multiple_lines_to_log(
+            "\n".join(
+                f"{span['name']}: {span['total']:.3f}s total, {span['calls']} calls, "
+                f"{span['mean'] * 1000:.2f}ms mean, {span['max'] * 1000:.2f}ms max"
+                + (f" ({span['max_cat_ID']})" if span["max_cat_ID"] else "")
+                for span in report
+            )
+        )
+
+
+class TimingResetCommand(Command):
+    name = "reset"
+    description = "Forget the timings so far"
+    aliases = ["r"]
+
+    def callback(self, args: List[str]):
+        timing.reset()
+        add_output_line_to_log("Timings reset")
+
+
+class TimingDumpCommand(Command):
+    name = "dump"
+    description = "Write the timings so far to a JSON file"
+    aliases = ["d"]
+
+    usage = "[file path]"
+
+    def callback(self, args: List[str]):
+        try:
+            path = timing.dump_report(args[0] if args else None)
+        except OSError as e:
+            add_output_line_to_log(f"Could not write the timings: {e}")
+            return
+        add_output_line_to_log(f"Timings written to {path}")
+
+
+class TimingCommand(Command):
+    name = "timing"
+    description = "Time the parts of the moon skip"
+    aliases = ["time"]
+
+    sub_commands = [
+        TimingOnCommand(),
+        TimingOffCommand(),
+        TimingShowCommand(),
+        TimingResetCommand(),
+        TimingDumpCommand(),
+    ]
+
+    def callback(self, args: List[str]):
+        add_output_line_to_log(
+            f"Timing is {'enabled' if timing.enabled else 'disabled'}, please specify a subcommand"
+        )
@@ -7,10 +7,12 @@ import pygame_gui
 import html
 
 from pygame_gui.elements import UIWindow, UITextBox, UITextEntryLine
-from scripts.utility import ui_scale
+from scripts.utility import ui_scale, ui_scale_value
 from scripts.debug_commands import commandList
 from scripts.debug_commands.utils import set_debug_class
 from scripts.game_structure import game
+from scripts.game_structure.frame_profiler import frame_profiler
+from scripts.game_structure.game.switches import switch_get_value, Switch
 from scripts.game_structure.screen_settings import MANAGER, offset, screen_scale
 from scripts.utility import get_text_box_theme
 
@@ -159,6 +161,10 @@ class DebugMode:
     debug_menu: DebugMenu = None
     coords_display = None
     fps_display = None
+    frame_display = None
+    frame_graph_rect = None
+    frame_display_refresh = 30
+    """The worst stage is recalculated every this many frames"""
 
     def __init__(self):
         self.rebuild_console()
@@ -193,6 +199,22 @@ class DebugMode:
             pygame.Rect((0, 0), (-1, -1)), "0 fps", object_id=get_text_box_theme()
         )
 
+        self.frame_graph_rect = ui_scale(pygame.Rect((0, 0), (300, 80)))
+        self.frame_graph_rect.bottomleft = (
+            0,
+            pygame.display.get_surface().get_height(),
+        )
+        self.frame_display = pygame_gui.elements.UILabel(
+            pygame.Rect((0, 0), (-1, -1)),
+            "p99 worst stage: -",
+            object_id=get_text_box_theme(),
+        )
+        self.frame_display.change_layer(9000)
+        self.frame_display.set_position(
+            (self.frame_graph_rect.left, self.frame_graph_rect.top - ui_scale_value(30))
+        )
+        self.frame_display.hide()
+
         self.debug_menu = DebugMenu(
             pygame.Rect(
                 (0, 0),
@@ -237,6 +259,20 @@ class DebugMode:
                 self.fps_display.hide()
                 self.fps_display.set_text("(0, 0)")
 
+        # Frame profiler
+        if frame_profiler.enabled:
+            if self.frame_display.visible == 0:
+                self.frame_display.show()
+            if frame_profiler.frame_count % self.frame_display_refresh == 0:
+                worst = frame_profiler.get_worst_stage(99)
+                self.frame_display.set_text(
+                    f"p99 worst stage: {worst[0]} {worst[1] * 1000:.1f}ms"
+                    if worst
+                    else "p99 worst stage: -"
+                )
+        elif self.frame_display.visible == 1:
+            self.frame_display.hide()
+
         # Showbounds
 
         # visual_debug_mode
@@ -262,6 +298,34 @@ class DebugMode:
                     pygame.draw.rect(screen, (0, 255, 0), rect, 1)
                 else:
                     pygame.draw.rect(screen, (255, 0, 0), rect, 1)
+        if frame_profiler.enabled:
+            self.draw_frame_graph(screen)
+
+    def draw_frame_graph(self, screen):
+        """
+        Draws the time of the last recorded frames as a graph, with a line at the frame budget of the fps cap.
+        """
+        rect = self.frame_graph_rect
+        pygame.draw.rect(screen, (0, 0, 0), rect)
+        frame_times = frame_profiler.get_frame_times()[-rect.width :]
+        fps_cap = switch_get_value(Switch.fps)
+        budget = 1 / fps_cap if fps_cap else 1 / 60
+        # the graph goes up to twice the budget, slower frames are cut off at the top
+        scale = rect.height / (2 * budget)
+
+        budget_y = rect.bottom - budget * scale
+        pygame.draw.line(
+            screen, (0, 160, 0), (rect.left, budget_y), (rect.right - 1, budget_y)
+        )
+        if len(frame_times) > 1:
+            points = [
+                (
+                    rect.right - len(frame_times) + i,
+                    max(rect.bottom - frame_time * scale, rect.top),
+                )
+                for i, frame_time in enumerate(frame_times)
+            ]
+            pygame.draw.lines(screen, (255, 255, 0), False, points)
 
 
 debug_mode = DebugMode()
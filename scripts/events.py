@@ -39,7 +39,7 @@ from scripts.game_structure.game.switches import (
     switch_get_value,
     switch_set_value,
 )
-from scripts.game_structure import game
+from scripts.game_structure import game, timing
 from scripts.game_structure.localization import load_lang_resource
 from scripts.game_structure.windows import SaveError
 from scripts.utility import (
@@ -68,6 +68,7 @@ war_lang = None
 ceremony_id_by_tag = {}
 
 
+@timing.timed("one_moon")
 def one_moon():
     """
     Handles the moon skipping of the whole Clan.
@@ -75,6 +76,8 @@ def one_moon():
 
     global new_cat_invited
 
+    # the events of the last moon are kept in the event log, until the next save writes them
+    game.get_event_log().add_moon(game.clan.age, game.cur_events_list)
     game.cur_events_list = []
     game.herb_events_list = []
     game.freshkill_events_list = []
@@ -86,10 +89,7 @@ def one_moon():
     game.patrolled.clear()
     game.just_died.clear()
 
-    if any(
-        cat.status.rank.is_active_clan_rank() and cat.status.alive_in_player_clan
-        for cat in Cat.all_cats.values()
-    ):
+    if any(cat.status.rank.is_active_clan_rank() for cat in Cat.living_clan_cats()):
         # todo: this links nowhere, can it be removed?
         switch_set_value(Switch.no_able_left, False)
 
@@ -101,15 +101,11 @@ def one_moon():
 
     if game.clan.game_mode in ("expanded", "cruel season") and game.clan.freshkill_pile:
         # feed the cats and update the nutrient status
-        relevant_cats = list(
-            filter(
-                lambda _cat: _cat.status.alive_in_player_clan,
-                Cat.all_cats.values(),
-            )
-        )
-        game.clan.freshkill_pile.time_skip(relevant_cats, game.freshkill_event_list)
-        # get the moonskip freshkill
-        get_moon_freshkill()
+        with timing.span("freshkill"):
+            relevant_cats = Cat.living_clan_cats()
+            game.clan.freshkill_pile.time_skip(relevant_cats, game.freshkill_event_list)
+            # get the moonskip freshkill
+            get_moon_freshkill()
 
     # Adding in any potential lead den events that have been saved
     if get_clan_setting("lead_den_interaction"):
@@ -178,11 +174,7 @@ def one_moon():
             )
 
             if len(ghost_names) > 2:
-                alive_cats = [
-                    kitty
-                    for kitty in Cat.all_cats.values()
-                    if kitty.status.alive_in_player_clan
-                ]
+                alive_cats = Cat.living_clan_cats()
 
                 # finds a percentage of the living Clan to become shaken
 
@@ -247,15 +239,16 @@ def one_moon():
     handle_focus()
 
     # handle the herb supply for the moon
-    game.clan.herb_supply.handle_moon(
-        clan_size=get_living_clan_cat_count(Cat),
-        clan_cats=Cat.all_cats_list,
-        med_cats=find_alive_cats_with_rank(
-            Cat,
-            ranks=[CatRank.MEDICINE_CAT, CatRank.MEDICINE_APPRENTICE],
-            working=True,
-        ),
-    )
+    with timing.span("herbs"):
+        game.clan.herb_supply.handle_moon(
+            clan_size=get_living_clan_cat_count(Cat),
+            clan_cats=Cat.all_cats_list,
+            med_cats=find_alive_cats_with_rank(
+                Cat,
+                ranks=[CatRank.MEDICINE_CAT, CatRank.MEDICINE_APPRENTICE],
+                working=True,
+            ),
+        )
 
     if game.clan.game_mode in ("expanded", "cruel season"):
         amount_per_med = get_amount_cat_for_one_medic(game.clan)
@@ -268,8 +261,7 @@ def one_moon():
             game.cur_events_list.insert(0, Single_Event(string, "health"))
     else:
         has_med = any(
-            cat.status.rank.is_any_medicine_rank() and cat.status.alive_in_player_clan
-            for cat in Cat.all_cats.values()
+            cat.status.rank.is_any_medicine_rank() for cat in Cat.living_clan_cats()
         )
         if not has_med:
             string = i18n.t("defaults.warn_no_medcats")
@@ -292,10 +284,11 @@ def one_moon():
     # autosave
     if get_clan_setting("autosave") and game.clan.age % 5 == 0:
         try:
-            save_cats(switch_get_value(Switch.clan_name), Cat, game)
-            game.clan.save_clan()
-            game.clan.save_pregnancy(game.clan)
-            game.save_events()
+            with timing.span("autosave"):
+                save_cats(switch_get_value(Switch.clan_name), Cat, game)
+                game.clan.save_clan()
+                game.clan.save_pregnancy(game.clan)
+                game.save_events()
         except:
             SaveError(traceback.format_exc())
 
@@ -768,8 +761,8 @@ def handle_lost_cats_return(predetermined_cat_IDs: list = None):
     if not predetermined_cat_IDs:
         eligible_cats = [
             cat
-            for cat in Cat.all_cats.values()
-            if not cat.dead and cat.status.is_lost(CatGroup.PLAYER_CLAN_ID)
+            for cat in Cat.living_cats()
+            if cat.status.is_lost(CatGroup.PLAYER_CLAN_ID)
         ]
 
         if not eligible_cats:
@@ -868,6 +861,7 @@ def handle_fading(cat):
             cat.set_faded()
 
 
+@timing.timed("one_moon_outside_cat", per_cat=True)
 def one_moon_outside_cat(cat, other_clan_cats: list = None):
     """
     exiled cat events
@@ -885,6 +879,7 @@ def one_moon_outside_cat(cat, other_clan_cats: list = None):
         OutsiderEvents.killing_outsiders(cat)
 
 
+@timing.timed("one_moon_cat", per_cat=True)
 def one_moon_cat(cat):
     """
     Triggers various moon events for a cat.
@@ -1111,13 +1106,13 @@ def check_war():
         return
 
     if not game.clan.leader or not game.clan.deputy or not game.clan.medicine_cat:
-        for event in war_events:
-            if not game.clan.leader and "lead_name" in event:
-                war_events.remove(event)
-            if not game.clan.deputy and "dep_name" in event:
-                war_events.remove(event)
-            if not game.clan.medicine_cat and "med_name" in event:
-                war_events.remove(event)
+        war_events = [
+            event
+            for event in war_events
+            if (game.clan.leader or "lead_name" not in event)
+            and (game.clan.deputy or "dep_name" not in event)
+            and (game.clan.medicine_cat or "med_name" not in event)
+        ]
 
     # grab our war "notice" for this moon
     event = random.choice(war_events)
@@ -1127,6 +1122,7 @@ def check_war():
     game.cur_events_list.append(Single_Event(event, "other_clans"))
 
 
+@timing.timed("ceremonies", per_cat=True)
 def perform_ceremonies(cat):
     """
     ceremonies
@@ -1869,6 +1865,7 @@ def other_interactions(cat):
     )
 
 
+@timing.timed("deaths", per_cat=True)
 def handle_injuries_or_general_death(cat):
     """
     decide if cat dies
@@ -2072,6 +2069,7 @@ def handle_murder(cat):
             )
 
 
+@timing.timed("deaths", per_cat=True)
 def handle_illnesses_or_illness_deaths(cat):
     """
     This function will handle:
@@ -2088,6 +2086,7 @@ def handle_illnesses_or_illness_deaths(cat):
     return triggered_death
 
 
+@timing.timed("outbreaks", per_cat=True)
 def handle_outbreaks(cat):
     """Try to infect some cats."""
     # check if the cat is ill,
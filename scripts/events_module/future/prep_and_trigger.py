@@ -52,9 +52,7 @@ def _collect_involved_cats(cat_dict: dict, future_info: dict) -> dict:
         future_info["involved_cats"]["r_c"] = {}
 
     # we're just keeping this to living cats within the clan for now, more complexity can come later
-    possible_cats = [
-        kitty for kitty in Cat.all_cats.values() if kitty.status.alive_in_player_clan
-    ]
+    possible_cats = Cat.living_clan_cats()
 
     for new_role, cat_involved in future_info["involved_cats"].items():
         # grab any cats that need to be newly gathered
@@ -8,6 +8,7 @@ from os.path import exists as path_exists
 from random import choice, randint, choices
 from typing import List, Tuple, Optional, Union
 
+import i18n
 import pygame
 
 from scripts.cat.cats import Cat
@@ -65,7 +66,7 @@ class Patrol:
         # False if no debug patrol set, value if one is set
         self.debug_patrol: Union[bool, str] = False
 
-        # the patrols
+        # the patrol files
         self.HUNTING_SZN = None
         self.HUNTING = None
         self.TRAINING_SZN = None
@@ -289,7 +290,7 @@ class Patrol:
         biome_dir = f"{biome}/"
         self.update_resources(biome_dir, leaf)
 
-        possible_patrols = []
+        patrol_files = []
         # This is for debugging purposes, load-in *ALL* the possible patrols when debug_override_patrol_stat_requirements is true. (May require longer loading time)
         if constants.CONFIG["patrol_generation"][
             "debug_override_patrol_stat_requirements"
@@ -299,51 +300,25 @@ class Patrol:
                 for leaf in leaves:
                     biome_dir = f"{biome.lower()}/"
                     self.update_resources(biome_dir, leaf)
-                    possible_patrols.extend(self.generate_patrol_events(self.HUNTING))
-                    possible_patrols.extend(
-                        self.generate_patrol_events(self.HUNTING_SZN)
-                    )
-                    possible_patrols.extend(self.generate_patrol_events(self.BORDER))
-                    possible_patrols.extend(
-                        self.generate_patrol_events(self.BORDER_SZN)
-                    )
-                    possible_patrols.extend(self.generate_patrol_events(self.TRAINING))
-                    possible_patrols.extend(
-                        self.generate_patrol_events(self.TRAINING_SZN)
-                    )
-                    possible_patrols.extend(self.generate_patrol_events(self.MEDCAT))
-                    possible_patrols.extend(
-                        self.generate_patrol_events(self.MEDCAT_SZN)
-                    )
-                    possible_patrols.extend(
-                        self.generate_patrol_events(self.HUNTING_GEN)
-                    )
-                    possible_patrols.extend(
-                        self.generate_patrol_events(self.BORDER_GEN)
-                    )
-                    possible_patrols.extend(
-                        self.generate_patrol_events(self.TRAINING_GEN)
-                    )
-                    possible_patrols.extend(
-                        self.generate_patrol_events(self.MEDCAT_GEN)
-                    )
-                    possible_patrols.extend(self.generate_patrol_events(self.DISASTER))
-                    possible_patrols.extend(self.generate_patrol_events(self.NEW_CAT))
-                    possible_patrols.extend(
-                        self.generate_patrol_events(self.NEW_CAT_WELCOMING)
-                    )
-                    possible_patrols.extend(
-                        self.generate_patrol_events(self.NEW_CAT_HOSTILE)
-                    )
-                    possible_patrols.extend(
-                        self.generate_patrol_events(self.OTHER_CLAN)
-                    )
-                    possible_patrols.extend(
-                        self.generate_patrol_events(self.OTHER_CLAN_ALLIES)
-                    )
-                    possible_patrols.extend(
-                        self.generate_patrol_events(self.OTHER_CLAN_HOSTILE)
-                    )
+                    patrol_files.append(self.HUNTING)
+                    patrol_files.append(self.HUNTING_SZN)
+                    patrol_files.append(self.BORDER)
+                    patrol_files.append(self.BORDER_SZN)
+                    patrol_files.append(self.TRAINING)
+                    patrol_files.append(self.TRAINING_SZN)
+                    patrol_files.append(self.MEDCAT)
+                    patrol_files.append(self.MEDCAT_SZN)
+                    patrol_files.append(self.HUNTING_GEN)
+                    patrol_files.append(self.BORDER_GEN)
+                    patrol_files.append(self.TRAINING_GEN)
+                    patrol_files.append(self.MEDCAT_GEN)
+                    patrol_files.append(self.DISASTER)
+                    patrol_files.append(self.NEW_CAT)
+                    patrol_files.append(self.NEW_CAT_WELCOMING)
+                    patrol_files.append(self.NEW_CAT_HOSTILE)
+                    patrol_files.append(self.OTHER_CLAN)
+                    patrol_files.append(self.OTHER_CLAN_ALLIES)
+                    patrol_files.append(self.OTHER_CLAN_HOSTILE)
 
         # this next one is needed for Classic specifically
         patrol_type = (
@@ -398,49 +373,46 @@ class Patrol:
             welcoming_rep = True
             chance = welcoming_chance
 
-        possible_patrols.extend(self.generate_patrol_events(self.HUNTING))
-        possible_patrols.extend(self.generate_patrol_events(self.HUNTING_SZN))
-        possible_patrols.extend(self.generate_patrol_events(self.BORDER))
-        possible_patrols.extend(self.generate_patrol_events(self.BORDER_SZN))
-        possible_patrols.extend(self.generate_patrol_events(self.TRAINING))
-        possible_patrols.extend(self.generate_patrol_events(self.TRAINING_SZN))
-        possible_patrols.extend(self.generate_patrol_events(self.MEDCAT))
-        possible_patrols.extend(self.generate_patrol_events(self.MEDCAT_SZN))
-        possible_patrols.extend(self.generate_patrol_events(self.HUNTING_GEN))
-        possible_patrols.extend(self.generate_patrol_events(self.BORDER_GEN))
-        possible_patrols.extend(self.generate_patrol_events(self.TRAINING_GEN))
-        possible_patrols.extend(self.generate_patrol_events(self.MEDCAT_GEN))
+        patrol_files.append(self.HUNTING)
+        patrol_files.append(self.HUNTING_SZN)
+        patrol_files.append(self.BORDER)
+        patrol_files.append(self.BORDER_SZN)
+        patrol_files.append(self.TRAINING)
+        patrol_files.append(self.TRAINING_SZN)
+        patrol_files.append(self.MEDCAT)
+        patrol_files.append(self.MEDCAT_SZN)
+        patrol_files.append(self.HUNTING_GEN)
+        patrol_files.append(self.BORDER_GEN)
+        patrol_files.append(self.TRAINING_GEN)
+        patrol_files.append(self.MEDCAT_GEN)
 
         if game_setting_disaster:
             dis_chance = int(random.getrandbits(3))  # disaster patrol chance
             if dis_chance == 1:
-                possible_patrols.extend(self.generate_patrol_events(self.DISASTER))
+                patrol_files.append(self.DISASTER)
 
         # new cat patrols
         if chance == 1:
             if welcoming_rep:
-                possible_patrols.extend(
-                    self.generate_patrol_events(self.NEW_CAT_WELCOMING)
-                )
+                patrol_files.append(self.NEW_CAT_WELCOMING)
             elif neutral_rep:
-                possible_patrols.extend(self.generate_patrol_events(self.NEW_CAT))
+                patrol_files.append(self.NEW_CAT)
             elif hostile_rep:
-                possible_patrols.extend(
-                    self.generate_patrol_events(self.NEW_CAT_HOSTILE)
-                )
+                patrol_files.append(self.NEW_CAT_HOSTILE)
 
         # other Clan patrols
         if other_clan_chance == 1:
             if clan_neutral:
-                possible_patrols.extend(self.generate_patrol_events(self.OTHER_CLAN))
+                patrol_files.append(self.OTHER_CLAN)
             elif clan_allies:
-                possible_patrols.extend(
-                    self.generate_patrol_events(self.OTHER_CLAN_ALLIES)
-                )
+                patrol_files.append(self.OTHER_CLAN_ALLIES)
             elif clan_hostile:
-                possible_patrols.extend(
-                    self.generate_patrol_events(self.OTHER_CLAN_HOSTILE)
-                )
+                patrol_files.append(self.OTHER_CLAN_HOSTILE)
+        possible_patrols = [
+            patrol
+            for patrol_file in patrol_files
+            for patrol in patrol_index.get_patrols(patrol_file)
+        ]
         patrol_ids = [patrol.patrol_id for patrol in possible_patrols]
         if self.debug_patrol and self.debug_patrol not in patrol_ids:
             print(
@@ -448,7 +420,7 @@ class Patrol:
             )
 
         final_patrols, final_romance_patrols = self.get_filtered_patrols(
-            possible_patrols, biome, camp, current_season, patrol_type
+            possible_patrols, biome, camp, current_season, patrol_type, patrol_files
         )
 
         # This is a debug option, this allows you to remove any constraints of a patrol regarding location, session, biomes, etc.
@@ -576,7 +548,14 @@ class Patrol:
         camp: str,
         current_season: str,
         patrol_type: str,
+        patrol_files: List[str] = None,
     ):
+        """
+        Filters the possible patrols down to the ones this patrol can go on.
+        :param patrol_files: the files the possible patrols were loaded from, in the same order.
+            If given, only the patrols that fit the biome, camp, season, type and patrol cats
+            are checked further
+        """
         filtered_patrols = []
         romantic_patrols = []
         # This make sure general only gets hunting, border, or training patrols
@@ -584,6 +563,22 @@ class Patrol:
         if patrol_type == "general":
             patrol_type = random.choice(["hunting", "border", "training"])
 
+        # a requested patrol is checked one by one, so we can tell why it's missing
+        if patrol_files is not None and not self.debug_patrol:
+            possible_patrols = [
+                patrol
+                for patrol_file in patrol_files
+                for patrol in patrol_index.get_bucket(
+                    patrol_file,
+                    biome,
+                    camp,
+                    current_season,
+                    patrol_type,
+                    len(self.patrol_cats),
+                    self.patrol_statuses,
+                )
+            ]
+
         app_number_mentor_checks = {}
         for i in range(1, 7):
             app_number_mentor_checks[f"app{i}_mentored"] = (
@@ -687,10 +682,16 @@ class Patrol:
         return filtered_patrols, romantic_patrols
 
     def get_filtered_patrols(
-        self, possible_patrols, biome, camp, current_season, patrol_type
+        self,
+        possible_patrols,
+        biome,
+        camp,
+        current_season,
+        patrol_type,
+        patrol_files: List[str] = None,
     ):
         filtered_patrols, romantic_patrols = self._filter_patrols(
-            possible_patrols, biome, camp, current_season, patrol_type
+            possible_patrols, biome, camp, current_season, patrol_type, patrol_files
         )
 
         if patrol_type == "herb_gathering":
@@ -732,7 +733,7 @@ class Patrol:
             self.used_patrols.clear()
             print("used patrols cleared", self.used_patrols)
             filtered_patrols, romantic_patrols = self._filter_patrols(
-                possible_patrols, biome, camp, current_season, patrol_type
+                possible_patrols, biome, camp, current_season, patrol_type, patrol_files
             )
 
             if not filtered_patrols:
@@ -742,7 +743,8 @@ class Patrol:
 
         return filtered_patrols, romantic_patrols
 
-    def generate_patrol_events(self, patrol_dict):
+    @staticmethod
+    def generate_patrol_events(patrol_dict):
         all_patrol_events = []
         for patrol in patrol_dict:
             patrol_event = PatrolEvent(
@@ -915,12 +917,7 @@ class Patrol:
             ("DISASTER", "disaster.json"),
         ]
         for patrol_property, location in resources:
-            try:
-                setattr(
-                    self, patrol_property, load_lang_resource(f"patrols/{location}")
-                )
-            except:
-                raise Exception("Something went wrong loading patrols!")
+            setattr(self, patrol_property, f"patrols/{location}")
 
     def balance_hunting(self, possible_patrols: list):
         """Filter the incoming hunting patrol list to balance the different kinds of hunting patrols.
@@ -1181,6 +1178,124 @@ class Patrol:
 PATROL_WEIGHT_ADAPTION = game.prey_config["patrol_weight_adaption"]
 PATROL_BALANCE = game.prey_config["patrol_balance"]
 
+# ---------------------------------------------------------------------------- #
+#                                 PATROL INDEX                                 #
+# ---------------------------------------------------------------------------- #
+
+
+class PatrolIndex:
+    """
+    The patrols of the loaded language, created once per patrol file and kept between patrols.
+    Each file is split into buckets by what is the same for every patrol with the same setup:
+    biome, camp, season, patrol type, number of cats and the ranks on the patrol.
+    """
+
+    patrol_type_tags = {
+        "hunting": "hunting",
+        "border": "border",
+        "training": "training",
+        "med": "herb_gathering",
+    }
+
+    def __init__(self):
+        self.lang = None
+        self.patrols = {}
+        """patrol file: patrol events of the file"""
+        self.buckets = {}
+        """(patrol file, biome, camp, season, type, size, ranks): patrol events that fit"""
+
+    def clear(self):
+        self.patrols.clear()
+        self.buckets.clear()
+
+    def get_patrols(self, patrol_file: str) -> List[PatrolEvent]:
+        """Get the patrol events of a file, creating them if needed."""
+        if self.lang != i18n.config.get("locale"):
+            self.clear()
+            self.lang = i18n.config.get("locale")
+
+        if patrol_file not in self.patrols:
+            try:
+                patrol_dicts = load_lang_resource(patrol_file)
+            except:
+                raise Exception("Something went wrong loading patrols!")
+            self.patrols[patrol_file] = Patrol.generate_patrol_events(patrol_dicts)
+
+        return self.patrols[patrol_file]
+
+    def get_bucket(
+        self,
+        patrol_file: str,
+        biome: str,
+        camp: str,
+        current_season: str,
+        patrol_type: str,
+        patrol_size: int,
+        patrol_statuses: dict,
+    ) -> List[PatrolEvent]:
+        """Get the patrol events of a file that fit a patrol, in file order."""
+        patrols = self.get_patrols(patrol_file)
+        key = (
+            patrol_file,
+            biome,
+            camp,
+            current_season,
+            patrol_type,
+            patrol_size,
+            frozenset(patrol_statuses.items()),
+        )
+        if key not in self.buckets:
+            self.buckets[key] = [
+                patrol
+                for patrol in patrols
+                if self.patrol_fits(
+                    patrol,
+                    biome,
+                    camp,
+                    current_season,
+                    patrol_type,
+                    patrol_size,
+                    patrol_statuses,
+                )
+            ]
+        return self.buckets[key]
+
+    @staticmethod
+    def patrol_fits(
+        patrol: PatrolEvent,
+        biome: str,
+        camp: str,
+        current_season: str,
+        patrol_type: str,
+        patrol_size: int,
+        patrol_statuses: dict,
+    ) -> bool:
+        """Check the constraints of a patrol that don't depend on which cats are on it."""
+        if not (patrol.min_cats <= patrol_size <= patrol.max_cats):
+            return False
+
+        for sta, num in patrol.min_max_status.items():
+            if len(num) != 2:
+                continue
+            if not (num[0] <= patrol_statuses.get(sta, -1) <= num[1]):
+                return False
+
+        if biome not in patrol.biome and "any" not in patrol.biome:
+            return False
+        if camp not in patrol.camp and "any" not in patrol.camp:
+            return False
+        if current_season not in patrol.season and "any" not in patrol.season:
+            return False
+
+        type_tag = PatrolIndex.patrol_type_tags.get(patrol_type)
+        if type_tag and type_tag not in patrol.types:
+            return False
+
+        return True
+
+
+patrol_index = PatrolIndex()
+
 # ---------------------------------------------------------------------------- #
 #                              GENERAL INFORMATION                             #
 # ---------------------------------------------------------------------------- #
@@ -354,6 +354,9 @@ class PatrolOutcome:
     def _get_stat_cat(self, patrol: "Patrol"):
         """Sets the stat cat. Returns true if a stat cat was found, and False if a stat cat was not found"""
 
+        # outcomes are kept between patrols, so don't let an old stat cat stick around
+        self.stat_cat = None
+
         print("---")
         print(
             f"Finding stat cat. Outcome Type: Success = {self.success}, Antag = {self.antagonize}"
@@ -4,7 +4,7 @@ from random import choice, randint
 
 import ujson
 
-from scripts.game_structure import constants
+from scripts.game_structure import constants, timing
 from scripts.cat.cats import Cat
 from scripts.cat.enums import CatRank
 from scripts.events_module.relationship.group_events import GroupEvents
@@ -32,6 +32,7 @@ class Relation_Events:
     del base_path
 
     @staticmethod
+    @timing.timed("relationships.events", per_cat=True)
     def handle_relationships(cat: Cat):
         """Checks the relationships of the cat and trigger additional events if possible.
 
@@ -181,12 +182,7 @@ class Relation_Events:
 
         if cat.status.is_leader:
             chosen_type = "all"
-        possible_interaction_cats = list(
-            filter(
-                lambda cat: (cat.status.alive_in_player_clan),
-                Cat.all_cats.values(),
-            )
-        )
+        possible_interaction_cats = Cat.living_clan_cats()
         if cat in possible_interaction_cats:
             possible_interaction_cats.remove(cat)
 
@@ -227,9 +223,7 @@ class Relation_Events:
 
         for new_cat in new_cats:
             same_age_cats = get_cats_same_age(Cat, new_cat)
-            alive_cats = [
-                i for i in new_cat.all_cats.values() if i.status.alive_in_player_clan
-            ]
+            alive_cats = new_cat.living_clan_cats()
             number = constants.CONFIG["new_cat"]["cat_amount_welcoming"]
 
             if len(alive_cats) == 0:
@@ -270,12 +264,7 @@ class Relation_Events:
     @staticmethod
     def cats_with_relationship_constraints(main_cat, constraint):
         """Returns a list of cats, where the relationship from main_cat towards the cat fulfill the given constraints."""
-        cat_list = list(
-            filter(
-                lambda cat: cat.status.alive_in_player_clan,
-                Cat.all_cats.values(),
-            )
-        )
+        cat_list = Cat.living_clan_cats()
         cat_list.remove(main_cat)
         filtered_cat_list = []
 
@@ -1,5 +1,4 @@
 import random
-from copy import deepcopy
 from random import choice
 from typing import Dict, List
 
@@ -36,8 +35,8 @@ class RomanticEvents:
     POLY_MATE_DICTS = {}
     current_loaded_lang = None
     ROMANTIC_EVENTS: Dict = {}
-    ROMANTIC_INTERACTIONS: Dict = {}
-    MATE_INTERACTIONS: Dict[str, List] = {}
+    ROMANTIC_INTERACTIONS: Dict[str, "interactions.InteractionTable"] = {}
+    MATE_INTERACTIONS: Dict[str, "interactions.InteractionTable"] = {}
     MATE_RELEVANT_INTERACTIONS: Dict[str, Dict[str, List]] = {}
     ROMANTIC_RELEVANT_INTERACTIONS: Dict[str, Dict[str, List]] = {}
 
@@ -101,6 +100,10 @@ class RomanticEvents:
         for val_type, dictionary in cls.MATE_RELEVANT_INTERACTIONS.items():
             cls.MATE_INTERACTIONS["positive"].extend(dictionary["increase"])
             cls.MATE_INTERACTIONS["negative"].extend(dictionary["decrease"])
+        cls.MATE_INTERACTIONS = {
+            key: interactions.InteractionTable(value)
+            for key, value in cls.MATE_INTERACTIONS.items()
+        }
 
         # ---------------------------------------------------------------------------- #
         #                                   ROMANTIC                                   #
@@ -140,6 +143,10 @@ class RomanticEvents:
         for val_type, dictionary in cls.ROMANTIC_RELEVANT_INTERACTIONS.items():
             cls.ROMANTIC_INTERACTIONS["positive"].extend(dictionary["increase"])
             cls.ROMANTIC_INTERACTIONS["negative"].extend(dictionary["decrease"])
+        cls.ROMANTIC_INTERACTIONS = {
+            key: interactions.InteractionTable(value)
+            for key, value in cls.ROMANTIC_INTERACTIONS.items()
+        }
 
     @staticmethod
     def start_interaction(cat_from, cat_to):
@@ -157,9 +164,9 @@ class RomanticEvents:
             RomanticEvents.rebuild_dicts()
             RomanticEvents.current_loaded_lang = i18n.config.get("locale")
 
-        relevant_dict = deepcopy(RomanticEvents.ROMANTIC_INTERACTIONS)
+        relevant_dict = RomanticEvents.ROMANTIC_INTERACTIONS
         if cat_to.ID in cat_from.mate and not cat_to.dead:
-            relevant_dict = deepcopy(RomanticEvents.MATE_INTERACTIONS)
+            relevant_dict = RomanticEvents.MATE_INTERACTIONS
 
         # check if it should be a positive or negative interaction
         relationship = cat_from.relationships[cat_to.ID]
@@ -285,7 +292,7 @@ class RomanticEvents:
         )
 
         # now add the age of the cats before the string is sent to the cats' relationship logs
-        relationship.log.append(
+        relationship.add_log(
             interaction_str
             + i18n.t(
                 "relationships.age_postscript", name=cat_from.name, count=cat_from.moons
@@ -294,7 +301,7 @@ class RomanticEvents:
 
         if not relationship.opposite_relationship and cat_from.ID != cat_to.ID:
             relationship.link_relationship()
-            relationship.opposite_relationship.log.append(
+            relationship.opposite_relationship.add_log(
                 interaction_str
                 + i18n.t(
                     "relationships.age_postscript",
@@ -28,7 +28,7 @@ from scripts.game_structure.game.switches import (
     switch_set_value,
     switch_append_list_value,
 )
-from scripts.game_structure import game
+from scripts.game_structure import game, timing
 from scripts.game_structure.localization import load_lang_resource
 from scripts.utility import (
     event_text_adjust,
@@ -129,6 +129,7 @@ class Condition_Events:
         cls.current_loaded_lang = i18n.config.get("locale")
 
     @staticmethod
+    @timing.timed("conditions.nutrient", per_cat=True)
     def handle_nutrient(cat: Cat, nutrition_info: dict) -> None:
         """
         Handles gaining conditions or death for cats with low nutrient.
@@ -254,6 +255,7 @@ class Condition_Events:
             )
 
     @staticmethod
+    @timing.timed("conditions.illnesses", per_cat=True)
     def handle_illnesses(cat, season=None):
         """
         This function handles the illnesses overall by randomly making cat ill (or not).
@@ -347,6 +349,7 @@ class Condition_Events:
         return triggered
 
     @staticmethod
+    @timing.timed("conditions.injuries", per_cat=True)
     def handle_injuries(cat, random_cat=None):
         """
         This function handles injuries overall by randomly injuring cat (or not).
@@ -843,6 +846,7 @@ class Condition_Events:
         return triggered
 
     @staticmethod
+    @timing.timed("conditions.disabled", per_cat=True)
     def handle_already_disabled(cat):
         """
         this function handles what happens if the cat already has a permanent condition.
@@ -595,7 +595,7 @@ class ShortEvent:
         cats that will die are added to self.dead_cats
         """
         # gather living clan cats except leader bc leader lives would be frustrating to handle in these
-        alive_cats = [i for i in Cat.all_cats.values() if i.status.alive_in_player_clan]
+        alive_cats = Cat.living_clan_cats()
 
         # make sure all cats in the pool fit the event requirements
         requirements = self.m_c
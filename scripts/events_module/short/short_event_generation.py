@@ -26,7 +26,6 @@ from scripts.game_structure import constants, game
 from scripts.game_structure.game.switches import switch_get_value, Switch
 from scripts.utility import get_living_clan_cat_count, get_warring_clan
 
-loaded_events = {}
 used_events = set()
 
 
@@ -121,6 +120,7 @@ def create_short_event(
         events = find_needed_events(
             frequency,
             event_type,
+            (None if future_event and future_event.negate_subtyping else sub_types),
         )
 
         chosen_event, random_cat = filter_events(
@@ -164,11 +164,12 @@ def create_short_event(
         return
 
 
-def find_needed_events(frequency, event_type=None) -> list:
+def find_needed_events(frequency, event_type=None, sub_types: list = None) -> list:
     """
     Handles detecting the biome and collecting all events possible for biome and type
     :param frequency: The event frequency to look for
     :param event_type: The type of event to pull
+    :param sub_types: if given, only events with exactly these subtypes are collected
     """
     event_list = []
 
@@ -184,11 +185,27 @@ def find_needed_events(frequency, event_type=None) -> list:
 
     biome = temp_biome.lower()
 
+    # events that can't happen to this clan right now are left out, unless requirements are overridden
+    clan_filtered = not constants.CONFIG["event_generation"][
+        "debug_override_requirements"
+    ]
+    if not clan_filtered:
+        # overriding the requirements skips the subtype check as well
+        sub_types = None
+
     # biome specific events
-    event_list.extend(generate_event_objects(event_type, biome, frequency))
+    event_list.extend(
+        short_event_catalog.get_events(
+            event_type, biome, frequency, sub_types, clan_filtered
+        )
+    )
 
     # any biome events
-    event_list.extend(generate_event_objects(event_type, "general", frequency))
+    event_list.extend(
+        short_event_catalog.get_events(
+            event_type, "general", frequency, sub_types, clan_filtered
+        )
+    )
 
     return event_list
 
@@ -218,81 +235,177 @@ def get_event_dicts(file_path) -> list:
     return events
 
 
-def generate_event_objects(event_triggered, biome, frequency) -> list:
+def generate_event_objects(event_triggered, biome) -> list:
     """
     Gets the event dicts for the given args and creates the short event objects for each entry in the dict.
     :param event_triggered: The type of event triggered
     :param biome: The biome to pull events for
-    :param frequency: The frequency to pull events for
+    :return: list of (frequency, short event) for every event of the file
     """
     file_path = f"{event_triggered}/{biome}.json"
-    load_name = f"{file_path}_{frequency}"
 
     try:
-        if file_path in loaded_events:
-            return loaded_events[file_path]
-        if load_name in loaded_events:
-            return loaded_events[load_name]
-        else:
-            events_dict = get_event_dicts(file_path)
+        events_dict = get_event_dicts(file_path)
 
-            event_list = []
-            if not events_dict:
-                return event_list
-            for event in events_dict:
-                event_text = event["event_text"] if "event_text" in event else None
-                event_frequency = event["frequency"] if "frequency" in event else 4
-
-                if not event_text:
-                    event_text = event["death_text"] if "death_text" in event else None
+        event_list = []
+        if not events_dict:
+            return event_list
+        for event in events_dict:
+            event_text = event["event_text"] if "event_text" in event else None
+            event_frequency = event["frequency"] if "frequency" in event else 4
 
-                if not event_text:
-                    print(
-                        f"WARNING: some events resources which are used in generate_events have no 'event_text'."
-                    )
-                if frequency != event_frequency:
-                    continue
+            if not event_text:
+                event_text = event["death_text"] if "death_text" in event else None
 
-                event = ShortEvent(
-                    event_id=event["event_id"] if "event_id" in event else "",
-                    location=event["location"] if "location" in event else ["any"],
-                    season=event["season"] if "season" in event else ["any"],
-                    sub_type=event["sub_type"] if "sub_type" in event else [],
-                    tags=event["tags"] if "tags" in event else [],
-                    text=event_text,
-                    new_accessory=(
-                        event["new_accessory"] if "new_accessory" in event else []
-                    ),
-                    m_c=event["m_c"] if "m_c" in event else {},
-                    r_c=event["r_c"] if "r_c" in event else {},
-                    new_cat=event["new_cat"] if "new_cat" in event else [],
-                    injury=event["injury"] if "injury" in event else [],
-                    exclude_involved=(
-                        event["exclude_involved"] if "exclude_involved" in event else []
-                    ),
-                    history=event["history"] if "history" in event else [],
-                    relationships=(
-                        event["relationships"] if "relationships" in event else []
-                    ),
-                    outsider=event["outsider"] if "outsider" in event else {},
-                    other_clan=event["other_clan"] if "other_clan" in event else {},
-                    supplies=event["supplies"] if "supplies" in event else [],
-                    new_gender=event["new_gender"] if "new_gender" in event else [],
-                    future_event=event["future_event"]
-                    if "future_event" in event
-                    else {},
+            if not event_text:
+                print(
+                    f"WARNING: some events resources which are used in generate_events have no 'event_text'."
                 )
-                event_list.append(event)
 
-            # Add to loaded events.
-            loaded_events[load_name] = event_list
-            return event_list
+            event = ShortEvent(
+                event_id=event["event_id"] if "event_id" in event else "",
+                location=event["location"] if "location" in event else ["any"],
+                season=event["season"] if "season" in event else ["any"],
+                sub_type=event["sub_type"] if "sub_type" in event else [],
+                tags=event["tags"] if "tags" in event else [],
+                text=event_text,
+                new_accessory=(
+                    event["new_accessory"] if "new_accessory" in event else []
+                ),
+                m_c=event["m_c"] if "m_c" in event else {},
+                r_c=event["r_c"] if "r_c" in event else {},
+                new_cat=event["new_cat"] if "new_cat" in event else [],
+                injury=event["injury"] if "injury" in event else [],
+                exclude_involved=(
+                    event["exclude_involved"] if "exclude_involved" in event else []
+                ),
+                history=event["history"] if "history" in event else [],
+                relationships=(
+                    event["relationships"] if "relationships" in event else []
+                ),
+                outsider=event["outsider"] if "outsider" in event else {},
+                other_clan=event["other_clan"] if "other_clan" in event else {},
+                supplies=event["supplies"] if "supplies" in event else [],
+                new_gender=event["new_gender"] if "new_gender" in event else [],
+                future_event=event["future_event"] if "future_event" in event else {},
+            )
+            event_list.append((event_frequency, event))
+
+        return event_list
 
     except ValueError:
         print(f"WARNING: {file_path} was not found, check short event generation")
         return []
 
 
+class ShortEventCatalog:
+    """
+    The short events of the loaded language. Each event file is loaded once and indexed on the
+    fields that are the same for every cat in the clan during a moon: frequency, sub_type, location,
+    season and the game mode tags. filter_events then only has to check the rest on what's left.
+    """
+
+    game_modes = ("classic", "expanded", "cruel_season")
+
+    def __init__(self):
+        self.lang = None
+        self.files = {}
+        """(event type, biome): (events, {field: {value: indexes of the events with that value}})"""
+        self.clan_events = {}
+        """query: events of a file that fit the clan, in file order"""
+
+    def clear(self):
+        self.files.clear()
+        self.clan_events.clear()
+
+    def get_file(self, event_type, biome) -> tuple:
+        """Get the events of a file and their indexes, loading the file if needed."""
+        if self.lang != i18n.config.get("locale"):
+            self.clear()
+            self.lang = i18n.config.get("locale")
+
+        if (event_type, biome) not in self.files:
+            events = []
+            indexes = {
+                "frequency": {},
+                "sub_type": {},
+                "location": {},
+                "season": {},
+                "tags": {},
+            }
+            for i, (frequency, event) in enumerate(
+                generate_event_objects(event_type, biome)
+            ):
+                events.append(event)
+                indexes["frequency"].setdefault(frequency, set()).add(i)
+                indexes["sub_type"].setdefault(frozenset(event.sub_type), set()).add(i)
+                for place in event.location:
+                    indexes["location"].setdefault(place, set()).add(i)
+                for season in event.season:
+                    indexes["season"].setdefault(season, set()).add(i)
+                for tag in event.tags:
+                    indexes["tags"].setdefault(tag, set()).add(i)
+            self.files[(event_type, biome)] = (events, indexes)
+
+        return self.files[(event_type, biome)]
+
+    def get_events(
+        self,
+        event_type,
+        biome,
+        frequency,
+        sub_types: list = None,
+        clan_filtered=True,
+    ) -> list:
+        """
+        Get the events of a file with the given frequency.
+        :param event_type: The type of event to pull
+        :param biome: The biome file to pull events from
+        :param frequency: The event frequency to look for
+        :param sub_types: if given, only events with exactly these subtypes are returned
+        :param clan_filtered: if True, only events that fit the clan's location, season and game mode are returned
+        """
+        events, indexes = self.get_file(event_type, biome)
+        query = (
+            event_type,
+            biome,
+            frequency,
+            frozenset(sub_types) if sub_types is not None else None,
+            clan_filtered,
+            game.clan.current_season.lower(),
+            game.clan.biome,
+            game.clan.override_biome,
+            game.clan.camp_bg,
+            game.clan.game_mode,
+        )
+        if query in self.clan_events:
+            return self.clan_events[query]
+
+        found = set(indexes["frequency"].get(frequency, ()))
+        if sub_types is not None:
+            found &= indexes["sub_type"].get(frozenset(sub_types), set())
+        if clan_filtered:
+            found &= indexes["season"].get("any", set()) | indexes["season"].get(
+                game.clan.current_season.lower(), set()
+            )
+            found &= set().union(
+                *(
+                    places
+                    for place, places in indexes["location"].items()
+                    if event_for_location([place])
+                )
+            )
+            for mode in self.game_modes:
+                if mode != game.clan.game_mode:
+                    found -= indexes["tags"].get(mode, set())
+
+        self.clan_events[query] = [events[i] for i in sorted(found)]
+        return self.clan_events[query]
+
+
+short_event_catalog = ShortEventCatalog()
+
+
 def filter_events(
     possible_events,
     main_cat,
@@ -510,11 +623,7 @@ def filter_events(
     if not final_events:
         return None, None
 
-    cat_list = [
-        c
-        for c in Cat.all_cats.values()
-        if c.status.alive_in_player_clan and c != main_cat
-    ]
+    cat_list = [c for c in Cat.living_clan_cats() if c != main_cat]
     chosen_cat = None
     chosen_event = None
 
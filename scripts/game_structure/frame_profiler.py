@@ -0,0 +1,169 @@
+"""
+Frame profiler for the main loop, for finding out what makes a screen stutter.
+
+While it's enabled, the main loop marks the end of each of its stages and the profiler keeps the
+stage times of the last frames in a ring buffer. The debug overlay draws them as a frame-time graph,
+and they can be dumped as a Chrome trace (open it in chrome://tracing or https://ui.perfetto.dev).
+"""
+
+import os
+import time
+from collections import deque
+from typing import Deque, Dict, List, Optional, Tuple
+
+import ujson
+
+from scripts.housekeeping.datadir import get_log_dir
+
+STAGES = (
+    "on_use",
+    "events",
+    "manager_update",
+    "update_game",
+    "screen_switch",
+    "debug",
+    "draw_ui",
+    "debug_overlay",
+    "display_update",
+)
+"""The stages of a frame, in the order the main loop runs them"""
+
+
+class Frame:
+    """The stage times of a single frame"""
+
+    __slots__ = ("screen", "start", "stages")
+
+    def __init__(self, screen: str, start: float):
+        self.screen = screen
+        self.start = start
+        self.stages: List[Tuple[str, float, float]] = []
+        """Name, start and duration of each stage, in seconds"""
+
+    @property
+    def duration(self) -> float:
+        return sum(stage[2] for stage in self.stages)
+
+
+class FrameProfiler:
+    def __init__(self, size: int = 600):
+        """
+        :param size: amount of frames to keep
+        """
+        self.enabled = False
+        self.frames: Deque[Frame] = deque(maxlen=size)
+        """The last finished frames, oldest first"""
+        self.current: Optional[Frame] = None
+        self.last_mark = 0.0
+        self.frame_count = 0
+        """Amount of frames recorded so far, including the ones that fell out of the buffer"""
+
+    def set_enabled(self, value: bool):
+        self.enabled = value
+        self.current = None
+
+    def begin_frame(self, screen: str):
+        """Starts recording a new frame on the given screen, finishing the one before it."""
+        if self.current is not None:
+            self.frames.append(self.current)
+            self.frame_count += 1
+        if not self.enabled:
+            self.current = None
+            return
+        self.last_mark = time.perf_counter()
+        self.current = Frame(screen, self.last_mark)
+
+    def end_stage(self, stage: str):
+        """Records the time since the previous stage ended (or the frame began) as the given stage."""
+        if self.current is None:
+            return
+        now = time.perf_counter()
+        self.current.stages.append((stage, self.last_mark, now - self.last_mark))
+        self.last_mark = now
+
+    def clear(self):
+        self.frames.clear()
+        self.current = None
+
+    def get_frame_times(self) -> List[float]:
+        """Returns the duration of each recorded frame in seconds, oldest first."""
+        return [frame.duration for frame in self.frames]
+
+    def get_stage_percentiles(self, percentile: float = 99) -> Dict[str, float]:
+        """
+        Returns the given percentile of the duration of each stage over the recorded frames, in seconds.
+        """
+        stage_times: Dict[str, List[float]] = {}
+        for frame in self.frames:
+            for stage, _, duration in frame.stages:
+                stage_times.setdefault(stage, []).append(duration)
+
+        percentiles = {}
+        for stage, durations in stage_times.items():
+            durations.sort()
+            percentiles[stage] = durations[
+                round((len(durations) - 1) * percentile / 100)
+            ]
+        return percentiles
+
+    def get_worst_stage(self, percentile: float = 99) -> Optional[Tuple[str, float]]:
+        """
+        Returns the stage with the highest duration at the given percentile, and that duration in seconds.
+        """
+        percentiles = self.get_stage_percentiles(percentile)
+        if not percentiles:
+            return None
+        return max(percentiles.items(), key=lambda item: item[1])
+
+    def get_chrome_trace(self) -> dict:
+        """
+        Returns the recorded frames in the Chrome trace event format. Each frame is an event with its stages nested in it.
+        """
+        if not self.frames:
+            return {"traceEvents": [], "displayTimeUnit": "ms"}
+
+        origin = self.frames[0].start
+        events = []
+        for frame in self.frames:
+            events.append(
+                {
+                    "name": frame.screen,
+                    "cat": "frame",
+                    "ph": "X",
+                    "ts": (frame.start - origin) * 1e6,
+                    "dur": frame.duration * 1e6,
+                    "pid": 1,
+                    "tid": 1,
+                }
+            )
+            events.extend(
+                {
+                    "name": stage,
+                    "cat": "stage",
+                    "ph": "X",
+                    "ts": (start - origin) * 1e6,
+                    "dur": duration * 1e6,
+                    "pid": 1,
+                    "tid": 1,
+                    "args": {"screen": frame.screen},
+                }
+                for stage, start, duration in frame.stages
+            )
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def dump_chrome_trace(self, path: str = None) -> str:
+        """
+        Writes the recorded frames to a Chrome trace JSON file.
+        :param path: file to write to, by default a new file in the log directory
+        :return: the path of the written file
+        """
+        if path is None:
+            path = os.path.join(
+                get_log_dir(), f"frames_{time.strftime('%Y%m%d_%H%M%S')}.json"
+            )
+        with open(path, "w", encoding="utf-8") as write_file:
+            write_file.write(ujson.dumps(self.get_chrome_trace()))
+        return path
+
+
+frame_profiler = FrameProfiler()
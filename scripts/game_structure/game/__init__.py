@@ -1,3 +1,4 @@
+from pathlib import Path
 from typing import Optional, TYPE_CHECKING, Any
 
 import pygame
@@ -12,6 +13,7 @@ from scripts.game_structure.screen_settings import toggle_fullscreen
 from . import save_load, settings, switches
 
 from .save_load import safe_save
+from .save_load.event_log import EventLog
 from .settings import game_setting_get
 from .switches import switch_get_value, Switch
 from ...screens.enums import GameScreen
@@ -86,6 +88,7 @@ debug_settings = {
 # CLAN
 clan: Optional["Clan"] = None
 cat_class = None
+event_log: Optional[EventLog] = None
 with open(f"resources/prey_config.json", "r", encoding="utf-8") as read_file:
     prey_config = ujson.loads(read_file.read())
 
@@ -162,13 +165,37 @@ def update_game():
 
 def save_events():
     """
-    Save current events list to events.json
+    Save current events list to events.json, and append the moons since the last save to the event log
     """
     events_list = []
     for event in cur_events_list:
         events_list.append(event.to_dict())
     safe_save(f"{get_save_dir()}/{clan.name}/events.json", events_list)
 
+    log = get_event_log()
+    log.add_moon(clan.age, cur_events_list)
+    log.flush()
+
+
+def get_event_log() -> EventLog:
+    """
+    Get the event log of the current clan, see scripts/game_structure/game/save_load/event_log.py
+    """
+    global event_log
+
+    directory = Path(get_save_dir()) / clan.name / "event_log"
+    if event_log is None or event_log.directory != directory:
+        event_log = EventLog(directory, cat_class)
+    return event_log
+
+
+def close_event_log():
+    """
+    Forget the moons of the event log that weren't saved, such as when a clan is loaded again
+    """
+    global event_log
+    event_log = None
+
 
 def add_faded_offspring_to_faded_cat(parent, offspring):
     """In order to siblings to work correctly, and not to lose relation info on fading, we have to keep track of
@@ -204,6 +231,7 @@ def load_events():
 
     global clan
 
+    close_event_log()
     clanname = clan.name
     events_path = f"{get_save_dir()}/{clanname}/events.json"
     events_list = []
@@ -1,5 +1,11 @@
 from scripts.game_structure.game.save_load.save_load import (
     safe_save,
+    SaveBatch,
     save_clanlist,
     read_clans,
 )
+from scripts.game_structure.game.save_load.storage import (
+    get_clan_storage,
+    close_clan_storage,
+    copy_clan_storage,
+)
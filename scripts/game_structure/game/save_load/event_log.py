@@ -0,0 +1,307 @@
+"""
+The event log of a clan: every event of every moon, kept next to the save.
+
+events.json only holds the events of the current moon. The log keeps the older ones in json lines
+files in the event_log folder of the clan, one file for every SEGMENT_MOONS moons. Files are only
+ever appended to, so saving writes the new events and nothing else.
+
+The moons the player skips through are buffered with add_moon and written when the clan is
+saved, so the log never holds moons the save doesn't. Queries are answered from an index by cat,
+event type and moon, which is built from the files on the first query and kept up to date after.
+"""
+
+from bisect import bisect_left, bisect_right
+from collections import Counter, defaultdict
+from math import ceil
+from pathlib import Path
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+import ujson
+
+from scripts.event_class import Single_Event
+
+SEGMENT_MOONS = 50
+"""Amount of moons whose events share one file"""
+
+
+class EventLogPage(NamedTuple):
+    events: List[Tuple[int, Single_Event]]
+    """The events on the page, as (moon, event)"""
+    page: int
+    page_count: int
+
+
+class EventLog:
+    """Reads and appends the event log of one clan."""
+
+    def __init__(self, directory: Path, cat_class=None):
+        """
+        :param directory: the event_log folder of the clan
+        :param cat_class: the Cat class, to find the cats of the events that are read
+        """
+        self.directory = Path(directory)
+        self.cat_class = cat_class
+
+        self._pending: List[Tuple[int, str]] = []
+        """Lines of the moons that were added but not written yet, as (moon, line)"""
+        self._tail_moon: Optional[int] = None
+        self._tail_lines: Counter = Counter()
+        """The written lines of the last written moon, to tell which events were written already"""
+        self._tail_read = False
+
+        self._indexed = False
+        self._moons: List[int] = []
+        """Moon of each written event, in the order they were written"""
+        self._locations: List[Tuple[int, int]] = []
+        """(segment, byte offset) of each written event"""
+        self._types: List[Tuple[str, ...]] = []
+        self._by_cat: Dict[str, List[int]] = defaultdict(list)
+        self._by_type: Dict[str, List[int]] = defaultdict(list)
+
+    @staticmethod
+    def segment_of(moon: int) -> int:
+        return moon // SEGMENT_MOONS * SEGMENT_MOONS
+
+    def segment_path(self, segment: int) -> Path:
+        return self.directory / f"moons_{segment}-{segment + SEGMENT_MOONS - 1}.jsonl"
+
+    def segments(self) -> List[int]:
+        """The first moon of each file of the log, in order"""
+        if not self.directory.exists():
+            return []
+        segments = []
+        for path in self.directory.glob("moons_*.jsonl"):
+            try:
+                segments.append(int(path.stem[6:].split("-")[0]))
+            except ValueError:
+                continue
+        return sorted(segments)
+
+    @staticmethod
+    def to_line(moon: int, event: Single_Event) -> str:
+        return ujson.dumps({"moon": moon, **event.to_dict()}, ensure_ascii=False)
+
+    def add_moon(self, moon: int, events: Iterable[Single_Event]):
+        """Adds the events of a moon, to be written on the next flush.
+        Adding a moon again replaces it, and the events that were already written are left out.
+
+        :param moon: the moon the events happened in
+        :param events: the events of that moon
+        """
+        self._read_tail()
+        self._pending = [entry for entry in self._pending if entry[0] < moon]
+        if self._tail_moon is not None and moon < self._tail_moon:
+            return
+
+        written = self._tail_lines.copy() if moon == self._tail_moon else Counter()
+        for event in events:
+            line = self.to_line(moon, event)
+            if written[line]:
+                written[line] -= 1
+                continue
+            self._pending.append((moon, line))
+
+    def flush(self):
+        """Appends the added events to the files of the log."""
+        if not self._pending:
+            return
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+        by_segment: Dict[int, List[Tuple[int, str]]] = defaultdict(list)
+        for moon, line in self._pending:
+            by_segment[self.segment_of(moon)].append((moon, line))
+
+        for segment, entries in by_segment.items():
+            with open(self.segment_path(segment), "ab") as write_file:
+                for moon, line in entries:
+                    offset = write_file.tell()
+                    write_file.write(line.encode("utf-8") + b"\n")
+                    if self._indexed:
+                        self._index_line(moon, segment, offset, ujson.loads(line))
+
+        for moon, line in self._pending:
+            if moon != self._tail_moon:
+                self._tail_moon = moon
+                self._tail_lines = Counter()
+            self._tail_lines[line] += 1
+        self._pending = []
+
+    def _read_tail(self):
+        """Finds the last written moon, and cuts off a line that was only partly written."""
+        if self._tail_read:
+            return
+        self._tail_read = True
+
+        segments = self.segments()
+        if not segments:
+            return
+        path = self.segment_path(segments[-1])
+        with open(path, "rb+") as log_file:
+            data = log_file.read()
+            end = data.rfind(b"\n") + 1
+            if end != len(data):
+                log_file.truncate(end)
+
+        for raw_line in data[:end].splitlines():
+            try:
+                moon = ujson.loads(raw_line)["moon"]
+            except (ValueError, KeyError, TypeError):
+                continue
+            if moon != self._tail_moon:
+                self._tail_moon = moon
+                self._tail_lines = Counter()
+            self._tail_lines[raw_line.decode("utf-8")] += 1
+
+    def _index_line(self, moon: int, segment: int, offset: int, event_dict: dict):
+        index = len(self._moons)
+        self._moons.append(moon)
+        self._locations.append((segment, offset))
+        types = tuple(event_dict.get("types") or ())
+        self._types.append(types)
+        for event_type in types:
+            self._by_type[event_type].append(index)
+        for cat_id in dict.fromkeys(event_dict.get("cats_involved") or ()):
+            self._by_cat[cat_id].append(index)
+
+    def _build_index(self):
+        if self._indexed:
+            return
+        self._read_tail()
+        self._indexed = True
+        for segment in self.segments():
+            offset = 0
+            with open(self.segment_path(segment), "rb") as read_file:
+                for raw_line in read_file:
+                    try:
+                        event_dict = ujson.loads(raw_line)
+                        moon = event_dict["moon"]
+                    except (ValueError, KeyError, TypeError):
+                        event_dict = None
+                    if event_dict is not None:
+                        self._index_line(moon, segment, offset, event_dict)
+                    offset += len(raw_line)
+
+    def moon_range(self) -> Optional[Tuple[int, int]]:
+        """The first and the last moon in the log, including the moons that weren't written yet"""
+        self._read_tail()
+        moons = [entry[0] for entry in self._pending[:1] + self._pending[-1:]]
+        if self._tail_moon is not None:
+            moons.append(self._tail_moon)
+            with open(self.segment_path(self.segments()[0]), "rb") as read_file:
+                for raw_line in read_file:
+                    try:
+                        moons.append(ujson.loads(raw_line)["moon"])
+                        break
+                    except (ValueError, KeyError, TypeError):
+                        continue
+        if not moons:
+            return None
+        return min(moons), max(moons)
+
+    def query(
+        self,
+        cat_id: str = None,
+        event_type: str = None,
+        first_moon: int = None,
+        last_moon: int = None,
+        page: int = 0,
+        page_size: int = 20,
+        newest_first: bool = True,
+    ) -> EventLogPage:
+        """Finds the events that match all the given filters, a page at a time.
+        Events of the same moon stay in the order they happened in.
+
+        :param cat_id: only the events this cat was involved in
+        :param event_type: only the events of this type, such as "birth_death"
+        :param first_moon: only the events of this moon and later
+        :param last_moon: only the events of this moon and earlier
+        :param page: which page to get, clamped to the pages there are
+        :param page_size: amount of events on a page
+        :param newest_first: whether the latest moons come first
+        """
+        self._build_index()
+
+        # the moons of the written events only go up, so a range of moons is a range of indexes
+        start = 0 if first_moon is None else bisect_left(self._moons, first_moon)
+        end = (
+            len(self._moons)
+            if last_moon is None
+            else bisect_right(self._moons, last_moon)
+        )
+
+        if cat_id is not None:
+            candidates = self._by_cat.get(cat_id, [])
+        elif event_type is not None:
+            candidates = self._by_type.get(event_type, [])
+        else:
+            candidates = range(len(self._moons))
+        candidates = candidates[
+            bisect_left(candidates, start) : bisect_left(candidates, end)
+        ]
+        if cat_id is not None and event_type is not None:
+            candidates = [i for i in candidates if event_type in self._types[i]]
+
+        # the moons that weren't written yet come after the written ones
+        matches: List[Tuple[int, object]] = [(self._moons[i], i) for i in candidates]
+        for moon, line in self._pending:
+            if (first_moon is not None and moon < first_moon) or (
+                last_moon is not None and moon > last_moon
+            ):
+                continue
+            event_dict = ujson.loads(line)
+            if cat_id is not None and cat_id not in (
+                event_dict.get("cats_involved") or ()
+            ):
+                continue
+            if event_type is not None and event_type not in (
+                event_dict.get("types") or ()
+            ):
+                continue
+            matches.append((moon, event_dict))
+
+        if newest_first:
+            # sorting is stable, so the events of a moon keep their order
+            matches.sort(key=lambda match: -match[0])
+
+        page_count = max(1, ceil(len(matches) / page_size))
+        page = max(0, min(page, page_count - 1))
+        shown = matches[page * page_size : (page + 1) * page_size]
+        events = list(
+            zip(
+                [moon for moon, _ in shown],
+                self._read_events([entry for _, entry in shown]),
+            )
+        )
+        return EventLogPage(events, page, page_count)
+
+    def moon_events(self, moon: int) -> List[Single_Event]:
+        """All the events of one moon, in the order they happened in."""
+        self._build_index()
+        start = bisect_left(self._moons, moon)
+        end = bisect_right(self._moons, moon)
+        entries = list(range(start, end))
+        entries.extend(
+            ujson.loads(line)
+            for entry_moon, line in self._pending
+            if entry_moon == moon
+        )
+        return self._read_events(entries)
+
+    def _read_events(self, entries: list) -> List[Single_Event]:
+        """Makes the events of indexes into the written events, or of event dicts."""
+        event_dicts = list(entries)
+        by_segment = defaultdict(list)
+        for position, entry in enumerate(entries):
+            if isinstance(entry, int):
+                by_segment[self._locations[entry][0]].append(position)
+
+        for segment, positions in by_segment.items():
+            with open(self.segment_path(segment), "rb") as read_file:
+                for position in positions:
+                    read_file.seek(self._locations[entries[position]][1])
+                    event_dicts[position] = ujson.loads(read_file.readline())
+
+        return [
+            Single_Event.from_dict(event_dict, self.cat_class)
+            for event_dict in event_dicts
+        ]
@@ -66,6 +66,57 @@ def safe_save(
             os.fsync(write_file.fileno())
 
 
+class SaveBatch:
+    """Collects the files of one save, so they can all be moved into place in a single commit step.
+    Each file is written and synced to a temporary file next to its target first, so a crash before
+    the commit leaves the previous save untouched."""
+
+    def __init__(self):
+        self._written: List[Path] = []
+        self._removed: List[Path] = []
+
+    def write(self, path: Union[str, Path], write_data):
+        """Write the data to a temporary file, which replaces path on commit.
+        If write_data is not a string, assumes you want this in json format."""
+        if type(write_data) is not str:
+            write_data = ujson.dumps(write_data, indent=4)
+
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self._get_temp_path(path), "w", encoding="utf-8") as write_file:
+            write_file.write(write_data)
+            write_file.flush()
+            os.fsync(write_file.fileno())
+        self._written.append(path)
+
+    def remove(self, path: Union[str, Path]):
+        """Remove the file on commit, if it exists."""
+        self._removed.append(Path(path))
+
+    def commit(self):
+        """Move all written files into place and remove the deleted ones."""
+        for path in self._written:
+            os.replace(self._get_temp_path(path), path)
+        for path in self._removed:
+            if path.exists():
+                path.unlink()
+        self._written = []
+        self._removed = []
+
+    def discard(self):
+        """Throw away all written files, leaving the previous save as it was."""
+        for path in self._written:
+            temp_path = self._get_temp_path(path)
+            if temp_path.exists():
+                temp_path.unlink()
+        self._written = []
+        self._removed = []
+
+    @staticmethod
+    def _get_temp_path(path: Path) -> Path:
+        return path.with_name(path.name + ".tmp")
+
+
 def save_clanlist(loaded_clan=None, only_switch=False):
     """
     Save clanlist to file
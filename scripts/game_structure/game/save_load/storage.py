@@ -0,0 +1,594 @@
+"""
+Storage backends for the cats and the clan data of a save.
+
+A clan is stored either in the JSON directory layout (clan_cats.json and one file per cat in
+relationships/, history/ and conditions/, plus <clanname>clan.json next to the clan folder) or in a
+single SQLite database, clan.db, inside the clan folder. Which one is used depends only on
+whether the database exists, so a clan can be converted with copy_clan_storage at any time.
+
+Everything else in the clan folder (faded cats, events, disasters, ...) is a plain file for both.
+"""
+
+import os
+import sqlite3
+from abc import ABC, abstractmethod
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import ujson
+
+from scripts.game_structure.game.save_load.save_load import SaveBatch
+from scripts.housekeeping.datadir import get_save_dir
+
+SQLITE_FILE_NAME = "clan.db"
+
+_storages: Dict[Tuple[str, bool], "ClanStorage"] = {}
+"""Open storage of each clan, keyed by (clanname, uses sqlite)"""
+
+
+def get_clan_storage(clanname: str) -> "ClanStorage":
+    """Get the storage the given clan is saved in.
+
+    :param clanname: name of the clan
+    :return: the SQLite storage if the clan has a database, the JSON storage otherwise
+    """
+    uses_sqlite = (Path(get_save_dir()) / clanname / SQLITE_FILE_NAME).exists()
+    key = (clanname, uses_sqlite)
+    if key not in _storages:
+        _storages[key] = (
+            SqliteClanStorage(clanname) if uses_sqlite else JsonClanStorage(clanname)
+        )
+    return _storages[key]
+
+
+def close_clan_storage(clanname: str = None):
+    """Close the open storage of a clan, or of all clans if no clanname is given."""
+    for key in list(_storages):
+        if clanname is None or key[0] == clanname:
+            _storages.pop(key).close()
+
+
+class ClanStorage(ABC):
+    """Reads and writes the cats and the clan data of one clan.
+    Reads return the data as it was saved, or None if nothing was saved for that cat.
+    Writes must happen inside transaction(), and only become visible once it ends without error.
+
+    A storage can be used from several threads: a transaction holds the lock of the storage until it
+    ends, so the transaction of another thread waits for it instead of mixing its writes in.
+    """
+
+    def __init__(self, clanname: str):
+        self.clanname = clanname
+        self.directory = Path(get_save_dir()) / clanname
+        self._lock = threading.RLock()
+        self._prefetched: Dict[str, Dict[str, Future]] = {
+            "relationships": {},
+            "conditions": {},
+        }
+        """Reads started by prefetch that weren't picked up yet, by kind of data and cat ID"""
+
+    def close(self):
+        """Release anything the storage holds on to."""
+        self.clear_prefetched()
+
+    def prefetch(
+        self,
+        relationship_ids: Iterable[str],
+        condition_ids: Iterable[str],
+        workers: int = 4,
+    ):
+        """Start reading the relationships and conditions of the given cats in the background,
+        so that the reads of a whole clan overlap. read_relationships and read_conditions then
+        return the prefetched data of a cat once, and read from the save again after that.
+
+        :param relationship_ids: IDs of the cats to read the relationships of
+        :param condition_ids: IDs of the cats to read the conditions of
+        :param workers: amount of reading threads, 0 to not prefetch at all
+        """
+
+    def _get_prefetched(self, kind: str, cat_id: str) -> Optional[Future]:
+        if kind not in self._prefetched:
+            return None
+        return self._prefetched[kind].pop(cat_id, None)
+
+    def clear_prefetched(self):
+        """Forget all prefetched data that wasn't read yet."""
+        for futures in self._prefetched.values():
+            for future in futures.values():
+                future.cancel()
+            futures.clear()
+
+    @contextmanager
+    def transaction(self):
+        """Group writes, so that either all of them or none of them are saved."""
+        with self._lock:
+            # prefetched data would be outdated by the writes
+            self.clear_prefetched()
+            self.begin()
+            try:
+                yield self
+            except:
+                self.discard()
+                raise
+            self.commit()
+
+    @abstractmethod
+    def begin(self):
+        """Start a transaction."""
+
+    @abstractmethod
+    def commit(self):
+        """Save the writes of the transaction."""
+
+    @abstractmethod
+    def discard(self):
+        """Drop the writes of the transaction."""
+
+    @abstractmethod
+    def has_clan(self) -> bool:
+        """Whether the clan data was saved."""
+
+    @abstractmethod
+    def read_clan(self) -> Optional[dict]:
+        """Get the saved clan data, or None if it wasn't saved."""
+
+    @abstractmethod
+    def write_clan(self, clan_data: dict):
+        """Save the clan data."""
+
+    @abstractmethod
+    def read_cats(self) -> List[dict]:
+        """Get the save dicts of all cats, in the order they were saved.
+        Raises FileNotFoundError if no cats were saved."""
+
+    @abstractmethod
+    def write_cats(self, cats: Dict[str, Tuple[str, str]], changed: Iterable[str]):
+        """Save the cats.
+
+        :param cats: ID: (compact json, indented json) of the save dict of every cat, in save order
+        :param changed: IDs of the cats whose save dict changed since it was last written
+        """
+
+    @abstractmethod
+    def has_relationships(self) -> bool:
+        """Whether relationships were saved for this clan at all."""
+
+    @abstractmethod
+    def read_relationships(self, cat_id: str) -> Optional[list]:
+        """Get the saved relationships of a cat."""
+
+    @abstractmethod
+    def write_relationships(self, cat_id: str, relationships: list):
+        """Save the relationships of a cat."""
+
+    @abstractmethod
+    def keep_relationships(self, cat_ids: Iterable[str]):
+        """Remove the saved relationships of every cat not in cat_ids."""
+
+    @abstractmethod
+    def read_history(self, cat_id: str) -> Optional[dict]:
+        """Get the saved history of a cat."""
+
+    @abstractmethod
+    def write_history(self, cat_id: str, history: Optional[dict]):
+        """Save the history of a cat, or remove it if history is None."""
+
+    @abstractmethod
+    def read_conditions(self, cat_id: str) -> Optional[dict]:
+        """Get the saved conditions of a cat."""
+
+    @abstractmethod
+    def write_conditions(self, cat_id: str, conditions: Optional[dict]):
+        """Save the conditions of a cat, or remove them if conditions is None."""
+
+    @abstractmethod
+    def dump(self) -> dict:
+        """Get everything this storage holds, used to copy it into another storage."""
+
+    @abstractmethod
+    def remove_all(self):
+        """Remove everything this storage holds from disk."""
+
+
+class JsonClanStorage(ClanStorage):
+    """The original layout, one json file per cat and kind of data."""
+
+    def __init__(self, clanname: str):
+        super().__init__(clanname)
+        self.clan_path = Path(get_save_dir()) / f"{clanname}clan.json"
+        self.cats_path = self.directory / "clan_cats.json"
+        self.relationships_dir = self.directory / "relationships"
+        self.history_dir = self.directory / "history"
+        self.conditions_dir = self.directory / "conditions"
+        self._batch: Optional[SaveBatch] = None
+
+    def begin(self):
+        self._batch = SaveBatch()
+
+    def commit(self):
+        self._batch.commit()
+        self._batch = None
+
+    def discard(self):
+        self._batch.discard()
+        self._batch = None
+
+    @staticmethod
+    def _read(path: Path):
+        if not path.exists():
+            return None
+        with open(path, "r", encoding="utf-8") as read_file:
+            return ujson.loads(read_file.read())
+
+    def prefetch(
+        self,
+        relationship_ids: Iterable[str],
+        condition_ids: Iterable[str],
+        workers: int = 4,
+    ):
+        if workers <= 0:
+            return
+        self.clear_prefetched()
+        executor = ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="prefetch"
+        )
+        for cat_id in condition_ids:
+            self._prefetched["conditions"][cat_id] = executor.submit(
+                self._read, self.conditions_dir / f"{cat_id}_conditions.json"
+            )
+        for cat_id in relationship_ids:
+            self._prefetched["relationships"][cat_id] = executor.submit(
+                self._read, self.relationships_dir / f"{cat_id}_relations.json"
+            )
+        # the threads finish the submitted reads and then exit
+        executor.shutdown(wait=False)
+
+    @staticmethod
+    def _read_dir(directory: Path, suffix: str) -> dict:
+        if not directory.exists():
+            return {}
+        data = {}
+        for path in sorted(directory.glob(f"*{suffix}")):
+            with open(path, "r", encoding="utf-8") as read_file:
+                data[path.name.removesuffix(suffix)] = ujson.loads(read_file.read())
+        return data
+
+    def has_clan(self) -> bool:
+        return self.clan_path.exists()
+
+    def read_clan(self) -> Optional[dict]:
+        return self._read(self.clan_path)
+
+    def write_clan(self, clan_data: dict):
+        self._batch.write(self.clan_path, clan_data)
+
+    def read_cats(self) -> List[dict]:
+        with open(self.cats_path, "r", encoding="utf-8") as read_file:
+            return ujson.loads(read_file.read())
+
+    def write_cats(self, cats: Dict[str, Tuple[str, str]], changed: Iterable[str]):
+        self._batch.write(
+            self.cats_path,
+            "[\n" + ",\n".join(indented for _, indented in cats.values()) + "\n]",
+        )
+
+    def has_relationships(self) -> bool:
+        return self.relationships_dir.exists()
+
+    def read_relationships(self, cat_id: str) -> Optional[list]:
+        prefetched = self._get_prefetched("relationships", cat_id)
+        if prefetched is not None:
+            return prefetched.result()
+        return self._read(self.relationships_dir / f"{cat_id}_relations.json")
+
+    def write_relationships(self, cat_id: str, relationships: list):
+        self._batch.write(
+            self.relationships_dir / f"{cat_id}_relations.json", relationships
+        )
+
+    def keep_relationships(self, cat_ids: Iterable[str]):
+        cat_ids = set(cat_ids)
+        self.relationships_dir.mkdir(parents=True, exist_ok=True)
+        for path in self.relationships_dir.glob("*_relations.json"):
+            if path.name.removesuffix("_relations.json") not in cat_ids:
+                self._batch.remove(path)
+
+    def read_history(self, cat_id: str) -> Optional[dict]:
+        return self._read(self.history_dir / f"{cat_id}_history.json")
+
+    def write_history(self, cat_id: str, history: Optional[dict]):
+        path = self.history_dir / f"{cat_id}_history.json"
+        if history is None:
+            self._batch.remove(path)
+        else:
+            self._batch.write(path, history)
+
+    def read_conditions(self, cat_id: str) -> Optional[dict]:
+        prefetched = self._get_prefetched("conditions", cat_id)
+        if prefetched is not None:
+            return prefetched.result()
+        return self._read(self.conditions_dir / f"{cat_id}_conditions.json")
+
+    def write_conditions(self, cat_id: str, conditions: Optional[dict]):
+        path = self.conditions_dir / f"{cat_id}_conditions.json"
+        if conditions is None:
+            self._batch.remove(path)
+        else:
+            self._batch.write(path, conditions)
+
+    def dump(self) -> dict:
+        return {
+            "clan": self.read_clan(),
+            "cats": self.read_cats() if self.cats_path.exists() else [],
+            "relationships": self._read_dir(self.relationships_dir, "_relations.json"),
+            "histories": self._read_dir(self.history_dir, "_history.json"),
+            "conditions": self._read_dir(self.conditions_dir, "_conditions.json"),
+        }
+
+    def remove_all(self):
+        for path in (self.clan_path, self.cats_path):
+            if path.exists():
+                path.unlink()
+        for directory in (
+            self.relationships_dir,
+            self.history_dir,
+            self.conditions_dir,
+        ):
+            if not directory.exists():
+                continue
+            for path in directory.glob("*.json"):
+                path.unlink()
+            if not any(directory.iterdir()):
+                directory.rmdir()
+
+
+class SqliteClanStorage(ClanStorage):
+    """Everything in one SQLite database, with one row per cat and kind of data.
+    Rows hold the same json the files of the JSON layout hold, so the two convert losslessly.
+
+    The clan is loaded on the loading thread, saved on the main thread and autosaved on the timeskip
+    thread, so the one connection is shared between threads. Every query holds the lock of the
+    storage, so the queries of other threads also wait until a transaction ends.
+    """
+
+    def __init__(self, clanname: str):
+        super().__init__(clanname)
+        self.path = self.directory / SQLITE_FILE_NAME
+        self._connection: Optional[sqlite3.Connection] = None
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        with self._lock:
+            if self._connection is None:
+                self._connection = self._connect()
+            return self._connection
+
+    def _connect(self) -> sqlite3.Connection:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        # transactions are handled by begin/commit/discard
+        connection = sqlite3.connect(
+            self.path, isolation_level=None, check_same_thread=False
+        )
+        connection.executescript(
+            """
+                CREATE TABLE IF NOT EXISTS clan (
+                    id INTEGER PRIMARY KEY CHECK (id = 0),
+                    data TEXT NOT NULL
+                );
+                CREATE TABLE IF NOT EXISTS cats (
+                    id TEXT PRIMARY KEY,
+                    position INTEGER NOT NULL,
+                    data TEXT NOT NULL
+                );
+                CREATE INDEX IF NOT EXISTS cats_position ON cats (position);
+                CREATE TABLE IF NOT EXISTS relationships (
+                    cat_id TEXT PRIMARY KEY,
+                    data TEXT NOT NULL
+                );
+                CREATE TABLE IF NOT EXISTS histories (
+                    cat_id TEXT PRIMARY KEY,
+                    data TEXT NOT NULL
+                );
+                CREATE TABLE IF NOT EXISTS conditions (
+                    cat_id TEXT PRIMARY KEY,
+                    data TEXT NOT NULL
+                );
+                """
+        )
+        return connection
+
+    def _execute(self, sql: str, parameters: tuple = ()) -> list:
+        """Run one query and return all of its rows."""
+        with self._lock:
+            return self.connection.execute(sql, parameters).fetchall()
+
+    def _executemany(self, sql: str, parameters: Iterable[tuple]):
+        with self._lock:
+            self.connection.executemany(sql, parameters)
+
+    def close(self):
+        with self._lock:
+            super().close()
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def begin(self):
+        self._execute("BEGIN")
+
+    def commit(self):
+        self._execute("COMMIT")
+
+    def discard(self):
+        self._execute("ROLLBACK")
+
+    def prefetch(
+        self,
+        relationship_ids: Iterable[str],
+        condition_ids: Iterable[str],
+        workers: int = 4,
+    ):
+        # queries hold the lock of the storage, so reading in parallel would only make them wait
+        # for each other. Each table is read in one query instead of one query per cat
+        if workers <= 0:
+            return
+        self.clear_prefetched()
+        for table, cat_ids in (
+            ("relationships", relationship_ids),
+            ("conditions", condition_ids),
+        ):
+            rows = dict(self._execute(f"SELECT cat_id, data FROM {table}"))
+            for cat_id in cat_ids:
+                future = Future()
+                future.set_result(rows.get(cat_id))
+                self._prefetched[table][cat_id] = future
+
+    def _read(self, table: str, cat_id: str):
+        prefetched = self._get_prefetched(table, cat_id)
+        if prefetched is not None:
+            data = prefetched.result()
+            return ujson.loads(data) if data is not None else None
+        rows = self._execute(f"SELECT data FROM {table} WHERE cat_id = ?", (cat_id,))
+        return ujson.loads(rows[0][0]) if rows else None
+
+    def _write(self, table: str, cat_id: str, data):
+        self._execute(
+            f"INSERT OR REPLACE INTO {table} (cat_id, data) VALUES (?, ?)",
+            (cat_id, ujson.dumps(data)),
+        )
+
+    def _read_table(self, table: str) -> dict:
+        return {
+            cat_id: ujson.loads(data)
+            for cat_id, data in self._execute(
+                f"SELECT cat_id, data FROM {table} ORDER BY cat_id"
+            )
+        }
+
+    def has_clan(self) -> bool:
+        return self.read_clan() is not None
+
+    def read_clan(self) -> Optional[dict]:
+        rows = self._execute("SELECT data FROM clan")
+        return ujson.loads(rows[0][0]) if rows else None
+
+    def write_clan(self, clan_data: dict):
+        self._execute(
+            "INSERT OR REPLACE INTO clan (id, data) VALUES (0, ?)",
+            (ujson.dumps(clan_data),),
+        )
+
+    def read_cats(self) -> List[dict]:
+        return [
+            ujson.loads(data)
+            for data, in self._execute("SELECT data FROM cats ORDER BY position")
+        ]
+
+    def write_cats(self, cats: Dict[str, Tuple[str, str]], changed: Iterable[str]):
+        positions = {cat_id: i for i, cat_id in enumerate(cats)}
+        removed = [
+            (cat_id,)
+            for cat_id, in self._execute("SELECT id FROM cats")
+            if cat_id not in positions
+        ]
+        self._executemany("DELETE FROM cats WHERE id = ?", removed)
+        self._executemany(
+            "INSERT OR REPLACE INTO cats (id, position, data) VALUES (?, ?, ?)",
+            ((cat_id, positions[cat_id], cats[cat_id][0]) for cat_id in changed),
+        )
+        self._executemany(
+            "UPDATE cats SET position = ? WHERE id = ? AND position != ?",
+            ((i, cat_id, i) for cat_id, i in positions.items()),
+        )
+
+    def has_relationships(self) -> bool:
+        return True
+
+    def read_relationships(self, cat_id: str) -> Optional[list]:
+        return self._read("relationships", cat_id)
+
+    def write_relationships(self, cat_id: str, relationships: list):
+        self._write("relationships", cat_id, relationships)
+
+    def keep_relationships(self, cat_ids: Iterable[str]):
+        cat_ids = set(cat_ids)
+        self._executemany(
+            "DELETE FROM relationships WHERE cat_id = ?",
+            [
+                (cat_id,)
+                for cat_id, in self._execute("SELECT cat_id FROM relationships")
+                if cat_id not in cat_ids
+            ],
+        )
+
+    def read_history(self, cat_id: str) -> Optional[dict]:
+        return self._read("histories", cat_id)
+
+    def write_history(self, cat_id: str, history: Optional[dict]):
+        if history is None:
+            self._execute("DELETE FROM histories WHERE cat_id = ?", (cat_id,))
+        else:
+            self._write("histories", cat_id, history)
+
+    def read_conditions(self, cat_id: str) -> Optional[dict]:
+        return self._read("conditions", cat_id)
+
+    def write_conditions(self, cat_id: str, conditions: Optional[dict]):
+        if conditions is None:
+            self._execute("DELETE FROM conditions WHERE cat_id = ?", (cat_id,))
+        else:
+            self._write("conditions", cat_id, conditions)
+
+    def dump(self) -> dict:
+        return {
+            "clan": self.read_clan(),
+            "cats": self.read_cats(),
+            "relationships": self._read_table("relationships"),
+            "histories": self._read_table("histories"),
+            "conditions": self._read_table("conditions"),
+        }
+
+    def remove_all(self):
+        with self._lock:
+            self.close()
+            if self.path.exists():
+                os.remove(self.path)
+
+
+def copy_clan_storage(source: ClanStorage, target: ClanStorage):
+    """Copy everything from one storage into another, replacing what the target held:
+    cats, relationships, histories and conditions the source doesn't have are removed from the target.
+    Raises ValueError if the target does not hold exactly the same data afterwards.
+
+    :param source: storage to copy from
+    :param target: storage to copy into
+    """
+    data = source.dump()
+    held = target.dump()
+    with target.transaction():
+        if data["clan"] is not None:
+            target.write_clan(data["clan"])
+        cats = {
+            cat["ID"]: (ujson.dumps(cat), ujson.dumps(cat, indent=4))
+            for cat in data["cats"]
+        }
+        target.write_cats(cats, cats.keys())
+        target.keep_relationships(data["relationships"])
+        for cat_id, relationships in data["relationships"].items():
+            target.write_relationships(cat_id, relationships)
+        for cat_id in held["histories"].keys() - data["histories"].keys():
+            target.write_history(cat_id, None)
+        for cat_id in held["conditions"].keys() - data["conditions"].keys():
+            target.write_conditions(cat_id, None)
+        for cat_id, history in data["histories"].items():
+            target.write_history(cat_id, history)
+        for cat_id, conditions in data["conditions"].items():
+            target.write_conditions(cat_id, conditions)
+
+    if target.dump() != data:
+        raise ValueError(
+            f"Copying the save of {source.clanname} did not give the same data"
+        )
@@ -1,3 +1,7 @@
+from collections import OrderedDict
+from typing import Hashable, Optional
+from weakref import WeakKeyDictionary
+
 import pygame
 
 _images = {}
@@ -11,3 +15,64 @@ def load_image(path):
     if path not in _images:
         _images[path] = pygame.image.load(path).convert_alpha()
     return _images[path]
+
+
+class SpriteCache:
+    """
+    Least recently used cache for composited cat sprites, bounded by the memory used by the surfaces.
+    The surfaces are shared between all cats with the same appearance, so they must never be drawn on.
+    """
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.used_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._sprites: OrderedDict[Hashable, pygame.Surface] = OrderedDict()
+        # masks of the cached sprites, dropped together with the sprite
+        self._masks: WeakKeyDictionary = WeakKeyDictionary()
+
+    def get(self, key: Hashable) -> Optional[pygame.Surface]:
+        """Returns the cached sprite for the key, or None if it isn't cached."""
+        sprite = self._sprites.get(key)
+        if sprite is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._sprites.move_to_end(key)
+        return sprite
+
+    def add(self, key: Hashable, sprite: pygame.Surface):
+        """Caches the sprite, evicting the least recently used sprites if the cache is full."""
+        if key in self._sprites:
+            self.used_bytes -= self._get_size(self._sprites.pop(key))
+        self._sprites[key] = sprite
+        self.used_bytes += self._get_size(sprite)
+
+        while self.used_bytes > self.max_bytes and len(self._sprites) > 1:
+            _, evicted = self._sprites.popitem(last=False)
+            self.used_bytes -= self._get_size(evicted)
+
+    def get_mask(self, sprite: pygame.Surface, size: tuple) -> Optional[pygame.Mask]:
+        """Returns the cached mask of the sprite in the given size, or None."""
+        return self._masks.get(sprite, {}).get(size)
+
+    def add_mask(self, sprite: pygame.Surface, size: tuple, mask: pygame.Mask):
+        """Caches the mask of the sprite in the given size."""
+        self._masks.setdefault(sprite, {})[size] = mask
+
+    def clear(self):
+        """Removes all sprites, e.g. because the spritesheets were (re)loaded."""
+        self._sprites.clear()
+        self._masks.clear()
+        self.used_bytes = 0
+
+    def __len__(self):
+        return len(self._sprites)
+
+    @staticmethod
+    def _get_size(sprite: pygame.Surface) -> int:
+        return sprite.get_width() * sprite.get_height() * sprite.get_bytesize()
+
+
+sprite_cache = SpriteCache(max_bytes=32 * 1024 * 1024)
@@ -1,15 +1,18 @@
 import logging
 import os
+import sqlite3
 from math import floor
 from random import choice
 
 import i18n
 import ujson
 
+from scripts.cat import save_load
 from scripts.cat.cats import Cat, BACKSTORIES
 from ..cat.enums import CatGroup, CatRank
 from scripts.cat.pelts import Pelt
 from scripts.cat_relations.inheritance import Inheritance
+from scripts.game_structure.game.save_load import get_clan_storage
 from scripts.game_structure.game.switches import (
     switch_get_value,
     switch_set_value,
@@ -43,16 +46,17 @@ def json_load():
     Cat.all_cats.clear()
     Cat.all_cats_list.clear()
     Cat.dead_cats.clear()
+    Inheritance.reset_family_index()
     all_cats = []
     clanname = switch_get_value(Switch.clan_list)[0]
+    save_load.reset_save_state(clanname)
     clan_cats_json_path = f"{get_save_dir()}/{clanname}/clan_cats.json"
     with open(
         f"resources/dicts/conversion_dict.json", "r", encoding="utf-8"
     ) as read_file:
         convert = ujson.loads(read_file.read())
     try:
-        with open(clan_cats_json_path, "r", encoding="utf-8") as read_file:
-            cat_data = ujson.loads(read_file.read())
+        cat_data = get_clan_storage(clanname).read_cats()
     except PermissionError as e:
         switch_set_value(Switch.error_message, f"Can\t open {clan_cats_json_path}!")
         switch_set_value(Switch.traceback, e)
@@ -61,6 +65,10 @@ def json_load():
         switch_set_value(Switch.error_message, f"{clan_cats_json_path} is malformed!")
         switch_set_value(Switch.traceback, e)
         raise
+    except sqlite3.DatabaseError as e:
+        switch_set_value(Switch.error_message, f"The save of {clanname} is malformed!")
+        switch_set_value(Switch.traceback, e)
+        raise
 
     old_tortie_patches = convert["old_tortie_patches"]
 
@@ -314,55 +322,71 @@ def json_load():
             switch_set_value(Switch.traceback, e)
             raise
 
-    # replace cat ids with cat objects and add other needed variables
-    other_clan_cats = [c for c in Cat.all_cats_list if c.status.is_other_clancat]
-    for cat in all_cats:
-        cat.load_conditions()
-
-        # this is here to handle paralyzed cats in old saves
-        if cat.pelt.paralyzed and "paralyzed" not in cat.permanent_condition:
-            cat.get_permanent_condition("paralyzed")
-        elif "paralyzed" in cat.permanent_condition and not cat.pelt.paralyzed:
-            cat.pelt.paralyzed = True
-
-        # load the relationships
-        try:
-            if not cat.dead:
-                cat.load_relationship_of_cat()
-                if cat.relationships is not None and len(cat.relationships) < 1:
-                    cat.init_all_relationships()
-            else:
-                cat.relationships = {}
-        except Exception as e:
-            logger.exception(
-                f"There was an error loading relationships for cat #{cat}."
-            )
-            switch_set_value(
-                Switch.error_message,
-                f"There was an error loading relationships for cat #{cat}.",
-            )
-            switch_set_value(Switch.traceback, e)
-            raise
+    storage = get_clan_storage(clanname)
+    try:
+        # read the files of all cats in the background, while the cats are set up one by one
+        storage.prefetch(
+            relationship_ids=[
+                cat.ID for cat in all_cats if cat.status.alive_in_player_clan
+            ],
+            condition_ids=[cat.ID for cat in all_cats],
+            workers=constants.CONFIG["save_load"]["load_workers"],
+        )
 
-        cat.inheritance = Inheritance(cat)
+        # replace cat ids with cat objects and add other needed variables
+        other_clan_cats = [c for c in Cat.all_cats_list if c.status.is_other_clancat]
+        for cat in all_cats:
+            cat.load_conditions()
+
+            # this is here to handle paralyzed cats in old saves
+            if cat.pelt.paralyzed and "paralyzed" not in cat.permanent_condition:
+                cat.get_permanent_condition("paralyzed")
+            elif "paralyzed" in cat.permanent_condition and not cat.pelt.paralyzed:
+                cat.pelt.paralyzed = True
+
+            # load the relationships, the ones of cats outside the living Clan are loaded when they are needed
+            try:
+                if cat.status.alive_in_player_clan:
+                    cat.load_relationship_of_cat()
+                    if cat.relationships is not None and len(cat.relationships) < 1:
+                        cat.init_all_relationships()
+                elif not cat.dead:
+                    cat.relationships = None
+                else:
+                    cat.relationships = {}
+            except Exception as e:
+                logger.exception(
+                    f"There was an error loading relationships for cat #{cat}."
+                )
+                switch_set_value(
+                    Switch.error_message,
+                    f"There was an error loading relationships for cat #{cat}.",
+                )
+                switch_set_value(Switch.traceback, e)
+                raise
 
-        try:
-            # initialization of thoughts
-            cat.thoughts(other_clan_cats=other_clan_cats)
-        except Exception as e:
-            logger.exception(
-                f"There was an error when thoughts for cat #{cat} are created."
-            )
-            switch_set_value(
-                Switch.error_message,
-                f"There was an error when thoughts for cat #{cat} are created.",
-            )
-            switch_set_value(Switch.traceback, e)
-            raise
+            cat.inheritance = Inheritance(cat)
 
-        # Save integrety checks
-        if constants.CONFIG["save_load"]["load_integrity_checks"]:
-            save_check()
+            try:
+                # initialization of thoughts
+                cat.thoughts(other_clan_cats=other_clan_cats)
+            except Exception as e:
+                logger.exception(
+                    f"There was an error when thoughts for cat #{cat} are created."
+                )
+                switch_set_value(
+                    Switch.error_message,
+                    f"There was an error when thoughts for cat #{cat} are created.",
+                )
+                switch_set_value(Switch.traceback, e)
+                raise
+
+            # Save integrety checks
+            if constants.CONFIG["save_load"]["load_integrity_checks"]:
+                save_check()
+    finally:
+        # a cat that failed to load would leave data behind for the next load
+        storage.clear_prefetched()
 
 
 def csv_load(all_cats):
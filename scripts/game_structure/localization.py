@@ -1,4 +1,6 @@
 import os.path
+from collections import OrderedDict
+from copy import deepcopy
 from typing import List, Dict, Union, Optional
 
 import i18n
@@ -17,6 +19,90 @@ default_pronouns: Dict[str, Dict[str, Dict[str, Union[str, int]]]] = {}
 additional_lang_list: Optional[Dict] = None
 
 
+def _read_only(self, *args, **kwargs):
+    raise TypeError(
+        "Resources from load_lang_resource are shared, copy them before changing them"
+    )
+
+
+class ReadOnlyDict(dict):
+    """A dict from load_lang_resource. It is shared by all callers, so it can't be changed,
+    but copy() and deepcopy() give a normal dict that can."""
+
+    __setitem__ = __delitem__ = __ior__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+
+    def __copy__(self):
+        return dict(self)
+
+    def __deepcopy__(self, memo):
+        return {key: deepcopy(value, memo) for key, value in self.items()}
+
+
+class ReadOnlyList(list):
+    """A list from load_lang_resource. It is shared by all callers, so it can't be changed,
+    but copy() and deepcopy() give a normal list that can."""
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _read_only
+    append = clear = extend = insert = pop = remove = reverse = sort = _read_only
+
+    def __copy__(self):
+        return list(self)
+
+    def __deepcopy__(self, memo):
+        return [deepcopy(value, memo) for value in self]
+
+
+def _make_read_only(data):
+    if isinstance(data, dict):
+        return ReadOnlyDict(
+            (key, _make_read_only(value)) for key, value in data.items()
+        )
+    if isinstance(data, list):
+        return ReadOnlyList(_make_read_only(value) for value in data)
+    return data
+
+
+class ResourceCache:
+    """Keeps the most recently loaded language resources, up to max_entries of them.
+    Everything is dropped when the language changes."""
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self.locale = None
+        self.hits = 0
+        self.misses = 0
+        self._resources = OrderedDict()
+
+    def get(self, key):
+        """Get a cached resource, or None if it isn't cached."""
+        if self.locale != i18n.config.get("locale"):
+            self.clear()
+            self.locale = i18n.config.get("locale")
+
+        resource = self._resources.get(key)
+        if resource is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._resources.move_to_end(key)
+        return resource
+
+    def add(self, key, resource):
+        self._resources[key] = resource
+        while len(self._resources) > self.max_entries:
+            self._resources.popitem(last=False)
+
+    def clear(self):
+        self._resources.clear()
+
+    def __len__(self):
+        return len(self._resources)
+
+
+resource_cache = ResourceCache(max_entries=512)
+
+
 def get_new_pronouns(genderalign: str) -> List[Dict[str, Union[str, int]]]:
     """
     Handles getting the right pronoun set for the language.
@@ -74,30 +160,40 @@ def load_lang_resource(location: str, *, root_directory=None):
     :param location: If the language code is required, substitute `{lang}`. Relative location
     from the resources/lang/[language]/ folder. Don't include a slash.
     :param root_directory: for testing only.
-    :return: Whatever resource was there, from either the locale or fallback
+    :return: Whatever resource was there, from either the locale or fallback. Dicts and lists are
+    shared between callers and can't be changed, copy them first if you need to.
     :exception FileNotFoundError: If requested resource doesn't exist in selected locale or fallback
     """
     location = os.path.normpath(location)
     locale, fallback = str(i18n.config.get("locale")), str(i18n.config.get("fallback"))
     if root_directory is None:
         root_directory = os.path.join("resources", "lang")
+    location = location.lstrip("\\/")  # just in case someone is an egg and does add it
+
+    key = (locale, fallback, root_directory, location)
+    resource = resource_cache.get(key)
+    if resource is not None:
+        return resource
+
     resource_directory = os.path.join(root_directory, locale)
     fallback_directory = os.path.join(root_directory, fallback)
-    location = location.lstrip("\\/")  # just in case someone is an egg and does add it
     try:
         with open(
             os.path.join(resource_directory, location.replace("{lang}", locale)),
             "r",
             encoding="utf-8",
         ) as string_file:
-            return ujson.loads(string_file.read())
+            resource = _make_read_only(ujson.loads(string_file.read()))
     except FileNotFoundError:
         with open(
             os.path.join(fallback_directory, location.replace("{lang}", fallback)),
             "r",
             encoding="utf-8",
         ) as string_file:
-            return ujson.loads(string_file.read())
+            resource = _make_read_only(ujson.loads(string_file.read()))
+
+    resource_cache.add(key, resource)
+    return resource
 
 
 def get_lang_config() -> Dict:
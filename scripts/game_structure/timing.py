@@ -0,0 +1,136 @@
+"""
+Named timing spans for finding out which parts of the moon skip are slow.
+
+Timing is off by default and can be switched on at runtime, e.g. with the "timing" debug command.
+While it's off, a span only costs a check of `enabled`. While it's on, each span keeps its number
+of calls, the total time spent in it and its slowest call, along with the cat that call was for.
+"""
+
+import os
+import time
+from functools import wraps
+from typing import Dict, List, Optional
+
+import ujson
+
+from scripts.housekeeping.datadir import get_log_dir
+
+enabled = False
+"""Whether spans are currently being timed"""
+
+
+class SpanStats:
+    """The timings of a single span"""
+
+    __slots__ = ("calls", "total", "max", "max_cat_ID", "depth")
+
+    def __init__(self):
+        self.calls = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.max_cat_ID: Optional[str] = None
+        """ID of the cat of the slowest call, if the span is timed per cat"""
+        self.depth = 0
+        """How deep we currently are in the span, so nested calls aren't counted twice"""
+
+
+spans: Dict[str, SpanStats] = {}
+
+
+class span:
+    """
+    Context manager that adds the time spent in it to the span of the given name.
+    If a cat is given, the span also remembers which cat its slowest call was for.
+    """
+
+    __slots__ = ("stats", "cat", "start")
+
+    def __init__(self, name: str, cat=None):
+        self.stats = None
+        if not enabled:
+            return
+        self.stats = spans.get(name)
+        if self.stats is None:
+            self.stats = spans[name] = SpanStats()
+        self.cat = cat
+
+    def __enter__(self):
+        if self.stats is None:
+            return self
+        self.stats.depth += 1
+        self.start = time.perf_counter() if self.stats.depth == 1 else None
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if self.stats is None:
+            return
+        self.stats.depth -= 1
+        if self.start is None:
+            return
+        duration = time.perf_counter() - self.start
+        self.stats.calls += 1
+        self.stats.total += duration
+        if duration > self.stats.max:
+            self.stats.max = duration
+            self.stats.max_cat_ID = self.cat.ID if self.cat is not None else None
+
+
+def timed(name: str, per_cat: bool = False):
+    """
+    Decorator that times every call of the function under the span of the given name.
+    :param name: name of the span
+    :param per_cat: True if the first argument of the function is a cat, to remember the slowest cat
+    """
+
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if not enabled:
+                return func(*args, **kwargs)
+            with span(name, args[0] if per_cat and args else None):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def set_enabled(value: bool):
+    global enabled
+    enabled = value
+
+
+def reset():
+    """Forgets all timings so far."""
+    spans.clear()
+
+
+def get_report() -> List[dict]:
+    """Returns the timings of all spans, the one with the most total time first."""
+    return [
+        {
+            "name": name,
+            "calls": stats.calls,
+            "total": stats.total,
+            "mean": stats.total / stats.calls,
+            "max": stats.max,
+            "max_cat_ID": stats.max_cat_ID,
+        }
+        for name, stats in sorted(spans.items(), key=lambda item: -item[1].total)
+        if stats.calls
+    ]
+
+
+def dump_report(path: str = None) -> str:
+    """
+    Writes the timings of all spans to a JSON file.
+    :param path: file to write to, by default a new file in the log directory
+    :return: the path of the written file
+    """
+    if path is None:
+        path = os.path.join(
+            get_log_dir(), f"timing_{time.strftime('%Y%m%d_%H%M%S')}.json"
+        )
+    with open(path, "w", encoding="utf-8") as write_file:
+        write_file.write(ujson.dumps({"spans": get_report()}, indent=4))
+    return path
@@ -2,6 +2,7 @@ import html
 import math
 from functools import lru_cache
 from math import ceil
+from time import perf_counter
 from typing import (
     Tuple,
     Optional,
@@ -826,6 +827,18 @@ class UIModifiedHorizScrollBar(pygame_gui.elements.UIHorizontalScrollBar):
         self.rebuild()
 
 
+def scale_cat_sprite(sprite: pygame.Surface, size) -> pygame.Surface:
+    """Scales a cat sprite to the size it's shown at."""
+    input_sprite = sprite.premul_alpha()
+    # if it's going to be small on the screen, smoothscale out the crunch
+    if (
+        size[1] <= ui_scale_value(sprite.get_height())
+        or size[0] <= ui_scale_value(sprite.get_height())
+    ) and not game_setting_get("no sprite antialiasing"):
+        return pygame.transform.smoothscale(input_sprite, size)
+    return pygame.transform.scale(input_sprite, size)
+
+
 class UISpriteButton:
     """This is for use with the cat sprites. It wraps together a UIImage and Transparent Button.
     For most functions, this can be used exactly like other pygame_gui elements."""
@@ -869,19 +882,7 @@ class UISpriteButton:
             mask=mask,
             mask_padding=mask_padding,
         )
-        input_sprite = sprite.premul_alpha()
-        # if it's going to be small on the screen, smoothscale out the crunch
-        input_sprite = (
-            pygame.transform.smoothscale(input_sprite, relative_rect.size)
-            if (
-                (
-                    relative_rect.height <= ui_scale_value(sprite.get_height())
-                    or relative_rect.width <= ui_scale_value(sprite.get_height())
-                )
-                and not game_setting_get("no sprite antialiasing")
-            )
-            else pygame.transform.scale(input_sprite, relative_rect.size)
-        )
+        input_sprite = scale_cat_sprite(sprite, relative_rect.size)
         self.image = pygame_gui.elements.UIImage(
             relative_rect,
             input_sprite,
@@ -927,6 +928,10 @@ class UISpriteButton:
     def set_image(self, new_image):
         self.image.set_image(new_image)
 
+    def set_cat(self, cat_id, cat_object=None):
+        self.button.cat_id = cat_id
+        self.button.cat_object = cat_object
+
     """This is to simplify event handling. Rather that writing 
             'if event.ui_element = cat_sprite_object.button'
             you can treat is as any other single pygame UI element and write:
@@ -1560,6 +1565,19 @@ class UICheckbox(UIImageButton):
         self.change_object_id("@unchecked_checkbox")
 
 
+PREFETCH_TIME_PER_FRAME = 0.004
+"""Seconds a UICatListDisplay spends each frame on the sprites of the next and previous pages"""
+
+
+@lru_cache(maxsize=4096)
+def fit_cat_list_name(name: str, scale_key: int) -> str:
+    """The name shortened to fit under a sprite of a UICatListDisplay.
+    Measuring the name is slow, so the short names are kept. shorten_text_to_fit scales the width itself,
+    so scale_key (the scaled width of a cell) is only part of the cache key: the kept names are made again
+    when the screen scale changes."""
+    return shorten_text_to_fit(name, 220, 30)
+
+
 class UICatListDisplay(UIContainer):
     def __init__(
         self,
@@ -1639,6 +1657,13 @@ class UICatListDisplay(UIContainer):
         self.cat_chunks = []
         self.boxes = []
 
+        # the widgets of each cell are made once and then reused for the cats of every page
+        self._scaled_sprites: Dict[str, Tuple[pygame.Surface, pygame.Surface]] = {}
+        """The scaled sprite of the cats of the pages around the current one, by ID, with the sprite it was made from"""
+        self._prefetch_queue: List = []
+        """Cats of the pages next to the current one whose sprites weren't made yet, popped from the end"""
+        self._names_theme = text_theme
+
         self.show_names = show_names
 
         self._favor_circle = pygame.transform.scale(
@@ -1705,6 +1730,11 @@ class UICatListDisplay(UIContainer):
         [sprite.kill() for sprite in self.cat_sprites.values()]
         [name.kill() for name in self.cat_names.values()]
         [favor.kill() for favor in self.favor_indicator.values()]
+        self.cat_sprites = {}
+        self.cat_names = {}
+        self.favor_indicator = {}
+        self._scaled_sprites = {}
+        self._prefetch_queue = []
         self.next_button = None
         self.prev_button = None
         self.first_button = None
@@ -1745,31 +1775,98 @@ class UICatListDisplay(UIContainer):
             self.total_pages = len(self.cat_chunks)
             display_cats = self.cat_chunks[self.current_page - 1]
 
-        [sprite.kill() for sprite in self.cat_sprites.values()]
-        [name.kill() for name in self.cat_names.values()]
-        [favor.kill() for favor in self.favor_indicator.values()]
-
         show_fav = get_clan_setting("show fav")
-
-        # FAVOURITE ICON
-        if show_fav:
-            fav_indexes = [
-                display_cats.index(cat) for cat in display_cats if cat.favourite
-            ]
-            [self.create_favor_indicator(i, self.boxes[i]) for i in fav_indexes]
-
-        # CAT SPRITE
-        [
-            self.create_cat_button(i, kitty, self.boxes[i])
-            for i, kitty in enumerate(display_cats)
+        if self.show_names and self.text_theme != self._names_theme:
+            self._names_theme = self.text_theme
+            [name.change_object_id(self.text_theme) for name in self.cat_names.values()]
+
+        for i, kitty in enumerate(display_cats):
+            self.show_cat(i, kitty, self.boxes[i], show_fav)
+        for i in range(len(display_cats), self.cats_displayed):
+            self.hide_cell(i)
+
+        self._prefetch_pages()
+
+    def show_cat(self, i, kitty, container, show_fav):
+        """Shows the cat in the cell, making the widgets of the cell if it never had any."""
+        sprite = self.cat_sprites.get(f"sprite{i}")
+        if sprite is None:
+            # the favourite indicator is made first, so it stays behind the sprite
+            self.create_favor_indicator(i, container)
+            self.create_cat_button(i, kitty, container)
+            if self.show_names:
+                self.create_name(i, kitty, container)
+        else:
+            sprite.set_image(self.get_scaled_sprite(kitty, sprite.image.rect.size))
+            sprite.set_cat(kitty.ID, kitty)
+            if self.tool_tip_name:
+                sprite.button.set_tooltip(str(kitty.name))
+            sprite.show()
+            if self.show_names:
+                name = self.cat_names[f"name{i}"]
+                name.set_text(fit_cat_list_name(str(kitty.name), ui_scale_value(220)))
+                name.show()
+
+        favor = self.favor_indicator[f"favor{i}"]
+        if show_fav and kitty.favourite:
+            favor.show()
+        else:
+            favor.hide()
+
+    def hide_cell(self, i):
+        """Hides the widgets of a cell that has no cat on this page."""
+        for widget in (
+            self.cat_sprites.get(f"sprite{i}"),
+            self.cat_names.get(f"name{i}"),
+            self.favor_indicator.get(f"favor{i}"),
+        ):
+            if widget is not None:
+                widget.hide()
+
+    def get_scaled_sprite(self, kitty, size) -> pygame.Surface:
+        """The sprite of the cat at the size of a cell, made again only if the cat's sprite changed."""
+        sprite = kitty.sprite
+        scaled = self._scaled_sprites.get(kitty.ID)
+        if scaled is None or scaled[0] is not sprite or scaled[1].get_size() != size:
+            scaled = (sprite, scale_cat_sprite(sprite, size))
+            self._scaled_sprites[kitty.ID] = scaled
+        return scaled[1]
+
+    def _prefetch_pages(self):
+        """Queues the cats of the pages next to the current one, and forgets the sprites of the other pages."""
+        page = self.current_page - 1
+        nearby = [
+            kitty
+            for chunk in self.cat_chunks[max(0, page - 1) : page + 2]
+            for kitty in chunk
+        ]
+        nearby_ids = {kitty.ID for kitty in nearby}
+        for cat_id in [i for i in self._scaled_sprites if i not in nearby_ids]:
+            del self._scaled_sprites[cat_id]
+
+        # the next page is the likeliest to be opened, so its cats go last
+        upcoming = (
+            self.cat_chunks[max(0, page - 1) : page]
+            + self.cat_chunks[page + 1 : page + 2]
+        )
+        self._prefetch_queue = [
+            kitty
+            for chunk in upcoming
+            for kitty in reversed(chunk)
+            if kitty.ID not in self._scaled_sprites
         ]
 
-        # CAT NAME
-        if self.show_names:
-            [
-                self.create_name(i, kitty, self.boxes[i])
-                for i, kitty in enumerate(display_cats)
-            ]
+    def update(self, time_delta: float):
+        super().update(time_delta)
+        if not self._prefetch_queue or not self.cat_sprites:
+            return
+        size = next(iter(self.cat_sprites.values())).image.rect.size
+        start = perf_counter()
+        while self._prefetch_queue and perf_counter() - start < PREFETCH_TIME_PER_FRAME:
+            kitty = self._prefetch_queue.pop()
+            self.get_scaled_sprite(kitty, size)
+            if self.show_names:
+                fit_cat_list_name(str(kitty.name), ui_scale_value(220))
 
     def create_cat_button(self, i, kitty, container):
         self.cat_sprites[f"sprite{i}"] = UISpriteButton(
@@ -1788,7 +1885,7 @@ class UICatListDisplay(UIContainer):
     def create_name(self, i, kitty, container):
         self.cat_names[f"name{i}"] = pygame_gui.elements.UILabel(
             pygame.Rect((0, 0), (container.rect[2], ui_scale_value(30))),
-            shorten_text_to_fit(str(kitty.name), 220, 30),
+            fit_cat_list_name(str(kitty.name), ui_scale_value(220)),
             container=container,
             object_id=self.text_theme,
             anchors={
@@ -22,6 +22,7 @@ from scripts.cat.history import History
 from scripts.cat.names import Name
 from scripts.cat.save_load import save_cats
 from scripts.game_structure import image_cache
+from scripts.game_structure.game.save_load import close_clan_storage
 from scripts.game_structure.game.switches import (
     Switch,
     switch_get_value,
@@ -536,6 +537,7 @@ class DeleteCheck(UIWindow):
         if event.type == pygame_gui.UI_BUTTON_START_PRESS:
             if event.ui_element == self.delete_it_button:
                 rempath = get_save_dir() + "/" + self.clan_name
+                close_clan_storage(self.clan_name)
                 shutil.rmtree(rempath)
                 if os.path.exists(rempath + "clan.json"):
                     os.remove(rempath + "clan.json")
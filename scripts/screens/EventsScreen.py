@@ -29,6 +29,7 @@ from scripts.screens.enums import GameScreen
 from scripts.ui.generate_box import BoxStyles, get_box
 from scripts.ui.generate_button import get_button_dict, ButtonStyles
 from scripts.ui.icon import Icon
+from scripts.ui.virtual_list import VirtualList
 from scripts.utility import (
     ui_scale,
     clan_symbol_sprite,
@@ -41,6 +42,17 @@ from scripts.utility import (
 )
 
 
+class EventRow:
+    """The widgets that show one event in the event display, reused for other events as the display scrolls"""
+
+    def __init__(self, panel, text_box, colour):
+        self.panel = panel
+        self.text_box = text_box
+        self.colour = colour
+        """The panel colour from the theme, for the rows that aren't alternate coloured"""
+        self.involved_cat_button = None
+
+
 class EventsScreen(Screens):
     current_display = "all events"
     selected_display = "all events"
@@ -73,6 +85,10 @@ class EventsScreen(Screens):
         self.event_screen_container = None
         self.clan_info = {}
         self.timeskip_button = None
+        self.previous_moon_button = None
+        self.next_moon_button = None
+        self.shown_moon = None
+        """The earlier moon whose events are shown from the event log, None for the current moon"""
 
         self.full_event_display_container = None
         self.events_frame = None
@@ -80,8 +96,14 @@ class EventsScreen(Screens):
         self.alert = {}
 
         self.event_display = None
-        self.event_display_containers = []
-        self.event_display_boxes = []
+        self.event_list = None
+        self.event_rows = {}
+        """The built rows of the event display, by index in display_events"""
+        self.spare_event_rows = []
+        self.event_row_heights = {}
+        """Measured row height of each event, until the events or the screen scale change"""
+        self.event_row_rect = None
+        self.event_scroll_top = None
         self.cat_profile_buttons = []
         self.involved_cat_container = None
         self.involved_cat_buttons = []
@@ -135,7 +157,15 @@ class EventsScreen(Screens):
                 if self.events_thread is not None and self.events_thread.is_alive():
                     return
                 self.timeskip_button.disable()
+                self.previous_moon_button.disable()
+                self.next_moon_button.disable()
                 self.events_thread = self.loading_screen_start_work(events.one_moon)
+            elif element == self.previous_moon_button:
+                moon = game.clan.age if self.shown_moon is None else self.shown_moon
+                self.show_moon(moon - 1)
+            elif element == self.next_moon_button:
+                moon = self.shown_moon + 1
+                self.show_moon(moon if moon < game.clan.age else None)
             elif element in self.involved_cat_buttons:
                 self.make_cat_buttons(element)
             elif element in self.cat_profile_buttons:
@@ -300,6 +330,26 @@ class EventsScreen(Screens):
             manager=MANAGER,
             sound_id="timeskip",
         )
+        self.previous_moon_button = UISurfaceImageButton(
+            ui_scale(pygame.Rect((274, 218), (30, 30))),
+            Icon.ARROW_LEFT,
+            get_button_dict(ButtonStyles.ICON, (30, 30)),
+            object_id="@buttonstyles_icon",
+            tool_tip_text="screens.events.previous_moon_tooltip",
+            starting_height=1,
+            container=self.event_screen_container,
+            manager=MANAGER,
+        )
+        self.next_moon_button = UISurfaceImageButton(
+            ui_scale(pygame.Rect((496, 218), (30, 30))),
+            Icon.ARROW_RIGHT,
+            get_button_dict(ButtonStyles.ICON, (30, 30)),
+            object_id="@buttonstyles_icon",
+            tool_tip_text="screens.events.next_moon_tooltip",
+            starting_height=1,
+            container=self.event_screen_container,
+            manager=MANAGER,
+        )
 
         self.full_event_display_container = pygame_gui.core.UIContainer(
             ui_scale(pygame.Rect((45, 266), (700, 700))),
@@ -360,6 +410,7 @@ class EventsScreen(Screens):
         variable_dict = super().display_change_save()
 
         variable_dict["current_display"] = self.current_display
+        variable_dict["shown_moon"] = self.shown_moon
 
         return variable_dict
 
@@ -372,6 +423,10 @@ class EventsScreen(Screens):
             except KeyError:
                 continue
 
+        # the rows have a different height at another screen scale
+        self.event_row_heights = {}
+        # the lists were made for the current moon, before shown_moon was set again
+        self.update_display_events_lists()
         self.handle_tab_switch(self.current_display, is_rescale=True)
         MANAGER.update(1)
 
@@ -399,6 +454,8 @@ class EventsScreen(Screens):
             starting_height=1,
             manager=MANAGER,
             allow_scroll_y=True,
+            # only some rows are built, so the height is set from all the rows there are
+            should_grow_automatically=False,
         )
         self.events_frame.join_focus_sets(self.event_display)
 
@@ -426,6 +483,7 @@ class EventsScreen(Screens):
             for ele in self.cat_profile_buttons:
                 ele.kill()
             self.cat_profile_buttons = []
+            self.update_event_row_positions()
             return
         # now check if the involved cat display is already open somewhere
         # if so, shrink that back to original size
@@ -534,38 +592,79 @@ class EventsScreen(Screens):
                 self.event_display.get_relative_rect()[3],
             )
         )
+        self.update_event_row_positions()
+
+    def close_cat_buttons(self):
+        """Removes the open cat profile buttons, without resizing their event row."""
+        self.open_involved_cat_button = None
+        if self.involved_cat_container:
+            self.involved_cat_container.kill()
+            self.involved_cat_container = None
+        for ele in self.cat_profile_buttons:
+            ele.kill()
+        self.cat_profile_buttons = []
 
     def exit_screen(self):
         self.event_display.kill()  # event display isn't put in the screen container due to lag issues
         self.event_screen_container.kill()
 
+        # the screen opens on the current moon again, which may be the moon of another clan by then
+        if self.shown_moon is not None:
+            self.shown_moon = None
+            switch_set_value(Switch.saved_scroll_positions, {})
+            self.event_row_heights = {}
+
     def update_display_events_lists(self):
         """
-        Categorize events from game.cur_events_list into display categories for screen
+        Categorize events from game.cur_events_list, or from the event log for an earlier moon, into display
+        categories for screen
         """
+        if self.shown_moon is None:
+            events_list = game.cur_events_list
+        else:
+            events_list = game.get_event_log().moon_events(self.shown_moon)
+
+        self.all_events = [x for x in events_list if "interaction" not in x.types]
+        self.ceremony_events = [x for x in events_list if "ceremony" in x.types]
+        self.birth_death_events = [x for x in events_list if "birth_death" in x.types]
+        self.relation_events = [x for x in events_list if "relation" in x.types]
+        self.health_events = [x for x in events_list if "health" in x.types]
+        self.other_clans_events = [x for x in events_list if "other_clans" in x.types]
+        self.misc_events = [x for x in events_list if "misc" in x.types]
 
-        self.all_events = [
-            x for x in game.cur_events_list if "interaction" not in x.types
-        ]
-        self.ceremony_events = [
-            x for x in game.cur_events_list if "ceremony" in x.types
-        ]
-        self.birth_death_events = [
-            x for x in game.cur_events_list if "birth_death" in x.types
-        ]
-        self.relation_events = [
-            x for x in game.cur_events_list if "relation" in x.types
-        ]
-        self.health_events = [x for x in game.cur_events_list if "health" in x.types]
-        self.other_clans_events = [
-            x for x in game.cur_events_list if "other_clans" in x.types
-        ]
-        self.misc_events = [x for x in game.cur_events_list if "misc" in x.types]
+        if self.shown_moon is not None and not self.all_events:
+            self.all_events.append(Single_Event(i18n.t("screens.events.no_events")))
+
+    def show_moon(self, moon):
+        """
+        Shows the events of an earlier moon, or of the current moon if moon is None
+        """
+        self.shown_moon = moon
+        switch_set_value(Switch.saved_scroll_positions, {})
+        self.event_row_heights = {}
+        self.update_display_events_lists()
+        self.handle_tab_switch(self.current_display, is_rescale=True)
+
+    def update_moon_buttons(self):
+        """
+        Enables the buttons to go to an earlier moon if the event log has one, and to a later one if there is one
+        """
+        moon = game.clan.age if self.shown_moon is None else self.shown_moon
+        logged_moons = game.get_event_log().moon_range()
+        if logged_moons and logged_moons[0] < moon:
+            self.previous_moon_button.enable()
+        else:
+            self.previous_moon_button.disable()
+
+        if self.shown_moon is None:
+            self.next_moon_button.disable()
+        else:
+            self.next_moon_button.enable()
 
     def update_events_display(self):
         """
         Kills and recreates the event display, updates the clan info, sets the event display scroll position if it was
-        previously saved
+        previously saved. Only the rows in and around the view are built, see update_event_rows.
         """
 
         # UPDATE CLAN INFO
@@ -576,30 +675,37 @@ class EventsScreen(Screens):
         self.clan_info["age"].set_text(
             "screens.events.age", text_kwargs={"count": game.clan.age}
         )
+        if self.shown_moon is None:
+            self.clan_info["heading"].set_text("screens.events.heading")
+        else:
+            self.clan_info["heading"].set_text(
+                "screens.events.past_moon_heading",
+                text_kwargs={"moon": self.shown_moon},
+            )
+        self.update_moon_buttons()
 
+        # the rows and buttons are killed along with the old container
         self.make_event_scrolling_container()
-
-        for ele in self.event_display_containers:
-            ele.kill()
-        self.event_display_containers = []
-
-        for ele in self.event_display_boxes:
-            ele.kill()
-        self.event_display_boxes = []
-
-        for ele in self.cat_profile_buttons:
-            ele.kill()
-        self.cat_profile_buttons = []
-
-        for ele in self.involved_cat_buttons:
-            ele.kill()
+        self.event_rows = {}
+        self.spare_event_rows = []
+        self.close_cat_buttons()
         self.involved_cat_buttons = []
+        self.event_list = None
+        self.event_scroll_top = None
 
         # Stop if Clan is new, so that events from previously loaded Clan don't show up
         if game.clan.age == 0:
             return
 
-        default_rect = pygame.Rect(
+        for event_object in [
+            x for x in self.display_events if not isinstance(x.text, str)
+        ]:
+            print(
+                f"Incorrectly Formatted Event: {event_object.text}, {type(event_object)}"
+            )
+            self.display_events.remove(event_object)
+
+        self.event_row_rect = pygame.Rect(
             ui_scale_offset((5, 0)),
             (
                 self.event_display.get_relative_rect()[2]
@@ -609,110 +715,180 @@ class EventsScreen(Screens):
             ),
         )
 
-        catbutton_rect = ui_scale(pygame.Rect((0, 0), (34, 34)))
-        catbutton_rect.topright = ui_scale_offset((-10, 5))
+        self.event_list = VirtualList(len(self.display_events), ui_scale_value(80))
+        for i, event_object in enumerate(self.display_events):
+            if event_object in self.event_row_heights:
+                self.event_list.set_height(i, self.event_row_heights[event_object])
+        self.event_display.set_scrollable_area_dimensions(
+            (self.event_row_rect[2], self.event_list.total_height)
+        )
 
-        anchor = {"top": "top"}
+        # this HAS TO UPDATE before saved scroll position can be set
+        self.event_display.scrollable_container.update(1)
 
-        alternate_color = (
-            pygame.Color(87, 76, 55)
-            if game_setting_get("dark mode")
-            else pygame.Color(167, 148, 111)
+        # don't ask me why we have to redefine these dimensions, we just do
+        # otherwise the scroll position save will break
+        self.event_display.set_dimensions(
+            (
+                self.event_display.get_relative_rect()[2],
+                self.event_display.get_relative_rect()[3],
+            )
         )
 
-        for i, event_object in enumerate(self.display_events):
-            if not isinstance(event_object.text, str):
-                print(
-                    f"Incorrectly Formatted Event: {event_object.text}, {type(event_object)}"
-                )
-                self.display_events.remove(event_object)
-                continue
-
-            display_element_container = pygame_gui.elements.UIPanel(
-                default_rect,
-                5,
-                MANAGER,
-                container=self.event_display,
-                element_id="event_panel",
-                object_id="#dark" if game_setting_get("dark mode") else None,
-                margins={"top": 0, "bottom": 0, "left": 0, "right": 0},
-                anchors=anchor,
+        # set saved scroll position
+        if switch_get_value(Switch.saved_scroll_positions).get(self.current_display):
+            self.event_display.vert_scroll_bar.set_scroll_from_start_percentage(
+                switch_get_value(Switch.saved_scroll_positions)[self.current_display]
             )
+            # moves the rows to the saved position now, rather than on the next frame
+            self.event_display.update(0)
 
-            self.event_display_containers.append(display_element_container)
+        self.update_event_rows()
 
-            if i % 2 == 0:
-                display_element_container.background_colour = alternate_color
-                display_element_container.rebuild()
+    def get_event_scroll_top(self) -> int:
+        """Returns how far the event display is scrolled down."""
+        return -self.event_display.scrollable_container.get_relative_rect()[1]
 
-            # TEXT BOX
-            display_element_event = pygame_gui.elements.UITextBox(
-                event_object.text,
-                ui_scale(pygame.Rect((0, 0), (509, -1))),
-                object_id=get_text_box_theme("#text_box_30_horizleft"),
-                starting_height=1,
-                container=display_element_container,
-                manager=MANAGER,
-                text_kwargs=getattr(event_object, "cat_dict"),
-                anchors={"left": "left", "right": "right"},
+    def update_event_rows(self):
+        """
+        Builds the event rows in and around the view of the event display, reusing the rows that went out of it.
+        The row at the top of the view stays in place when rows above it get measured.
+        """
+        if not self.event_list:
+            return
+
+        view_height = self.event_display.get_relative_rect()[3]
+        top = self.get_event_scroll_top()
+        anchor = self.event_list.row_at(top)
+        anchor_offset = top - self.event_list.offsets[anchor]
+
+        # measuring the new rows can bring more rows into range
+        while True:
+            top = self.event_list.offsets[anchor] + anchor_offset
+            first, last = self.event_list.rows_between(
+                top - view_height, top + 2 * view_height
+            )
+            for index in [i for i in self.event_rows if not first <= i < last]:
+                self.hide_event_row(index)
+            missing = [i for i in range(first, last) if i not in self.event_rows]
+            if not missing:
+                break
+            for index in missing:
+                self.show_event_row(index)
+
+        self.update_event_row_positions()
+        if top != self.get_event_scroll_top() and self.event_display.vert_scroll_bar:
+            self.event_display.vert_scroll_bar.set_scroll_from_start_percentage(
+                top / self.event_list.total_height
+            )
+            self.event_display.update(0)
+        self.event_scroll_top = self.get_event_scroll_top()
+
+    def update_event_row_positions(self):
+        """Moves the built rows and resizes the scrollable area to match the current row heights."""
+        for index, row in self.event_rows.items():
+            self.event_list.set_height(index, row.panel.get_relative_rect()[3])
+        offsets = self.event_list.offsets
+        for index, row in self.event_rows.items():
+            row.panel.set_relative_position((self.event_row_rect[0], offsets[index]))
+        if (
+            self.event_display.scrollable_container.get_relative_rect()[3]
+            != self.event_list.total_height
+        ):
+            self.event_display.set_scrollable_area_dimensions(
+                (self.event_row_rect[2], self.event_list.total_height)
             )
 
-            self.event_display_boxes.append(display_element_event)
+    def make_event_row(self) -> EventRow:
+        panel = pygame_gui.elements.UIPanel(
+            self.event_row_rect,
+            5,
+            MANAGER,
+            container=self.event_display,
+            element_id="event_panel",
+            object_id="#dark" if game_setting_get("dark mode") else None,
+            margins={"top": 0, "bottom": 0, "left": 0, "right": 0},
+        )
+        text_box = pygame_gui.elements.UITextBox(
+            "",
+            ui_scale(pygame.Rect((0, 0), (509, -1))),
+            object_id=get_text_box_theme("#text_box_30_horizleft"),
+            starting_height=1,
+            container=panel,
+            manager=MANAGER,
+            anchors={"left": "left", "right": "right"},
+        )
+        return EventRow(panel, text_box, panel.background_colour)
+
+    def show_event_row(self, index: int):
+        """Fills a spare (or new) row with the event at the given index of display_events and measures it."""
+        event_object = self.display_events[index]
+        if self.spare_event_rows:
+            row = self.spare_event_rows.pop()
+        else:
+            row = self.make_event_row()
+        row.panel.show()
+        self.event_rows[index] = row
+
+        colour = row.colour
+        if index % 2 == 0:
+            colour = (
+                pygame.Color(87, 76, 55)
+                if game_setting_get("dark mode")
+                else pygame.Color(167, 148, 111)
+            )
+        if row.panel.background_colour != colour:
+            row.panel.background_colour = colour
+            row.panel.rebuild()
 
-            if event_object.cats_involved:
-                involved_cat_button = IDImageButton(
+        # TEXT BOX
+        row.text_box.set_text(
+            event_object.text, text_kwargs=getattr(event_object, "cat_dict")
+        )
+        height = row.text_box.get_relative_rect()[3]
+
+        if event_object.cats_involved:
+            catbutton_rect = ui_scale(pygame.Rect((0, 0), (34, 34)))
+            catbutton_rect.topright = ui_scale_offset((-10, 0))
+            catbutton_rect.top = height + ui_scale_value(5)
+            if row.involved_cat_button is None:
+                row.involved_cat_button = IDImageButton(
                     catbutton_rect,
                     Icon.CAT_HEAD,
                     get_button_dict(ButtonStyles.ICON, (34, 34)),
                     ids=event_object.cats_involved,
                     layer_starting_height=3,
                     object_id="@buttonstyles_icon",
-                    parent_element=display_element_container,
-                    container=display_element_container,
+                    parent_element=row.panel,
+                    container=row.panel,
                     manager=MANAGER,
-                    anchors={
-                        "right": "right",
-                        "top_target": display_element_event,
-                    },
+                    anchors={"right": "right", "top": "top"},
                 )
-                self.involved_cat_buttons.append(involved_cat_button)
-
-            display_element_container.set_dimensions(
-                (
-                    default_rect[2],
-                    (
-                        display_element_event.get_relative_rect()[3]
-                        + (
-                            involved_cat_button.get_relative_rect()[3]
-                            + ui_scale_value(10)
-                        )
-                        if event_object.cats_involved
-                        else display_element_event.get_relative_rect()[3]
-                    ),
-                )
-            )
-
-            anchor = {"top_target": display_element_container}
-
-        del catbutton_rect
-
-        # this HAS TO UPDATE before saved scroll position can be set
-        self.event_display.scrollable_container.update(1)
-
-        # don't ask me why we have to redefine these dimensions, we just do
-        # otherwise the scroll position save will break
-        self.event_display.set_dimensions(
-            (
-                self.event_display.get_relative_rect()[2],
-                self.event_display.get_relative_rect()[3],
-            )
-        )
-
-        # set saved scroll position
-        if switch_get_value(Switch.saved_scroll_positions).get(self.current_display):
-            self.event_display.vert_scroll_bar.set_scroll_from_start_percentage(
-                switch_get_value(Switch.saved_scroll_positions)[self.current_display]
+                self.involved_cat_buttons.append(row.involved_cat_button)
+            else:
+                row.involved_cat_button.ids = event_object.cats_involved
+                row.involved_cat_button.set_relative_position(catbutton_rect.topleft)
+                row.involved_cat_button.show()
+            height += row.involved_cat_button.get_relative_rect()[3] + ui_scale_value(
+                10
             )
+        elif row.involved_cat_button is not None:
+            row.involved_cat_button.hide()
+
+        row.panel.set_dimensions((self.event_row_rect[2], height))
+        self.event_list.set_height(index, height)
+        self.event_row_heights[event_object] = height
+
+    def hide_event_row(self, index: int):
+        """Hides the row of the event at the given index of display_events and keeps it for reuse."""
+        row = self.event_rows.pop(index)
+        if (
+            row.involved_cat_button is not None
+            and row.involved_cat_button == self.open_involved_cat_button
+        ):
+            self.close_cat_buttons()
+        row.panel.hide()
+        self.spare_event_rows.append(row)
 
     def update_list_buttons(self):
         """
@@ -726,11 +902,15 @@ class EventsScreen(Screens):
     def on_use(self):
         super().on_use()
         self.loading_screen_on_use(self.events_thread, self.timeskip_done)
+        if self.event_list and self.get_event_scroll_top() != self.event_scroll_top:
+            self.update_event_rows()
 
     def timeskip_done(self):
         """Various sorting and other tasks that must be done with the timeskip is over."""
 
         switch_set_value(Switch.saved_scroll_positions, {})
+        self.event_row_heights = {}
+        self.shown_moon = None
 
         if get_living_clan_cat_count(Cat) == 0:
             GameOver(GameScreen.EVENTS)
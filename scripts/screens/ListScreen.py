@@ -81,6 +81,13 @@ class ListScreen(Screens):
         self.full_cat_list = []
         self.current_listed_cats = []
 
+        self.sorted_list = None
+        """The list that was sorted last, with sorted_type"""
+        self.sorted_type = None
+        self.searched_text = ""
+        """The search text current_listed_cats was found with, and the IDs of those cats"""
+        self.search_matches = None
+
         self.list_screen_container = None
 
         self.cat_list_bar = None
@@ -248,6 +255,10 @@ class ListScreen(Screens):
         self.set_disabled_menu_buttons(["catlist_screen"])
         self.show_menu_buttons()
 
+        # the cats may have changed since the list was last shown
+        self.sorted_list = None
+        self.search_matches = None
+
         # SCREEN CONTAINER - everything should come back to here
         self.list_screen_container = pygame_gui.core.UIContainer(
             ui_scale(pygame.Rect((0, 0), (800, 700))),
@@ -561,11 +572,15 @@ class ListScreen(Screens):
         """
         updates the cat list and display, search text is taken into account
         """
-        self.current_listed_cats = []
-
-        # make sure cat list is the same everywhere else in the game.
-        Cat.sort_cats(self.full_cat_list)
-        Cat.sort_cats(Cat.all_cats_list)
+        # only sort when the list or the sort type changed, not on every page or keystroke
+        sort_type = switch_get_value(Switch.sort_type)
+        if self.sorted_list is not self.full_cat_list or self.sorted_type != sort_type:
+            # make sure cat list is the same everywhere else in the game.
+            Cat.sort_cats(self.full_cat_list)
+            Cat.sort_cats(Cat.all_cats_list)
+            self.sorted_list = self.full_cat_list
+            self.sorted_type = sort_type
+            self.search_matches = None
 
         # adding in the guide if necessary, this ensures the guide isn't affected by sorting as we always want them to
         # be the first cat on the list
@@ -582,13 +597,24 @@ class ListScreen(Screens):
 
         search_text = search_text.strip()
         if search_text not in ("", "name search"):
-            self.current_listed_cats = [
-                cat
-                for cat in self.full_cat_list
-                if search_text.lower() in str(cat.name).lower()
-            ]
+            if (
+                self.search_matches is not None
+                and self.searched_text.lower() in search_text.lower()
+            ):
+                # the text was typed on, so the cats can only be narrowed down
+                matches = Cat.get_registry().search_names(
+                    search_text, self.search_matches
+                )
+                listed_cats = self.current_listed_cats
+            else:
+                matches = Cat.get_registry().search_names(search_text)
+                listed_cats = self.full_cat_list
+            self.current_listed_cats = [cat for cat in listed_cats if cat.ID in matches]
+            self.searched_text = search_text
+            self.search_matches = matches
         else:
             self.current_listed_cats = self.full_cat_list.copy()
+            self.search_matches = None
 
         self.all_pages = (
             int(ceil(len(self.current_listed_cats) / 20.0))
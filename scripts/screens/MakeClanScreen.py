@@ -2161,6 +2161,7 @@ class MakeClanScreen(Screens):
         )
         game.clan.create_clan()
         game.cur_events_list.clear()
+        game.close_event_log()
         game.herb_events_list.clear()
         game.clan.herb_supply.start_storage(len(self.members))
         game.clan.save_herb_supply(game.clan)
@@ -115,6 +115,11 @@ class ProfileScreen(Screens):
         self.sub_tab_1 = None
         self.backstory_background = None
         self.history_text_box = None
+        self.past_events_text_box = None
+        self.newer_past_events_arrow = None
+        self.older_past_events_arrow = None
+        self.past_events_page = 0
+        self.past_events_cat = None
         self.conditions_tab_button = None
         self.condition_container = None
         self.left_conditions_arrow = None
@@ -371,13 +376,38 @@ class ProfileScreen(Screens):
                     if self.save_text:
                         self.save_text.kill()
                     self.help_button.kill()
+                elif self.open_sub_tab == "past events":
+                    self.close_past_events_tab()
                 self.open_sub_tab = "life events"
                 self.toggle_history_sub_tab()
             elif event.ui_element == self.sub_tab_2:
                 if self.open_sub_tab == "life events":
                     self.history_text_box.kill()
+                elif self.open_sub_tab == "past events":
+                    self.close_past_events_tab()
                 self.open_sub_tab = "user notes"
                 self.toggle_history_sub_tab()
+            elif event.ui_element == self.sub_tab_3:
+                if self.open_sub_tab == "life events":
+                    self.history_text_box.kill()
+                    self.no_moons.kill()
+                    self.show_moons.kill()
+                elif self.open_sub_tab == "user notes":
+                    self.notes_entry.kill()
+                    self.display_notes.kill()
+                    if self.edit_text:
+                        self.edit_text.kill()
+                    if self.save_text:
+                        self.save_text.kill()
+                    self.help_button.kill()
+                self.open_sub_tab = "past events"
+                self.toggle_history_sub_tab()
+            elif event.ui_element == self.newer_past_events_arrow:
+                self.past_events_page -= 1
+                self.display_past_events_page()
+            elif event.ui_element == self.older_past_events_arrow:
+                self.past_events_page += 1
+                self.display_past_events_page()
             elif event.ui_element == self.fav_tab:
                 switch_set_value(Switch.favorite_sub_tab, None)
                 self.fav_tab.hide()
@@ -1253,6 +1283,78 @@ class ProfileScreen(Screens):
         elif self.open_sub_tab == "user notes":
             self.toggle_user_notes_tab()
 
+        elif self.open_sub_tab == "past events":
+            self.toggle_past_events_tab()
+
+    def toggle_past_events_tab(self):
+        """Opens the Past Events portion of the History Tab, the events of the cat from the event log"""
+        self.newer_past_events_arrow = UISurfaceImageButton(
+            ui_scale(pygame.Rect((52, 514), (34, 34))),
+            Icon.ARROW_UP,
+            get_button_dict(ButtonStyles.ICON, (34, 34)),
+            object_id="@buttonstyles_icon",
+            tool_tip_text="screens.profile.newer_past_events_tooltip",
+            manager=MANAGER,
+        )
+        self.older_past_events_arrow = UISurfaceImageButton(
+            ui_scale(pygame.Rect((52, 552), (34, 34))),
+            Icon.ARROW_DOWN,
+            get_button_dict(ButtonStyles.ICON, (34, 34)),
+            object_id="@buttonstyles_icon",
+            tool_tip_text="screens.profile.older_past_events_tooltip",
+            manager=MANAGER,
+        )
+
+        self.update_disabled_buttons_and_text()
+
+    def close_past_events_tab(self):
+        """Closes the Past Events portion of the History Tab"""
+        if self.past_events_text_box:
+            self.past_events_text_box.kill()
+        self.newer_past_events_arrow.kill()
+        self.older_past_events_arrow.kill()
+
+    def display_past_events_page(self):
+        """Shows a page of the events the cat was involved in, the latest moons first"""
+        if self.past_events_cat != self.the_cat.ID:
+            self.past_events_cat = self.the_cat.ID
+            self.past_events_page = 0
+
+        event_log = game.get_event_log()
+        # the events of this moon only go into the log on the next save or timeskip
+        event_log.add_moon(game.clan.age, game.cur_events_list)
+        page = event_log.query(
+            cat_id=self.the_cat.ID, page=self.past_events_page, page_size=10
+        )
+        self.past_events_page = page.page
+
+        if page.events:
+            text = "\n\n".join(
+                i18n.t("screens.profile.past_event", moon=moon, text=event.text)
+                for moon, event in page.events
+            )
+        else:
+            text = i18n.t("screens.profile.no_past_events")
+
+        if self.past_events_text_box:
+            self.past_events_text_box.kill()
+        self.past_events_text_box = UITextBoxTweaked(
+            text,
+            ui_scale(pygame.Rect((100, 473), (600, 149))),
+            object_id="#text_box_26_horizleft_pad_10_14",
+            line_spacing=1,
+            manager=MANAGER,
+        )
+
+        if page.page == 0:
+            self.newer_past_events_arrow.disable()
+        else:
+            self.newer_past_events_arrow.enable()
+        if page.page >= page.page_count - 1:
+            self.older_past_events_arrow.disable()
+        else:
+            self.older_past_events_arrow.enable()
+
     def get_all_history_text(self):
         """Generates a string with all important history information."""
         output = ""
@@ -2325,6 +2427,7 @@ class ProfileScreen(Screens):
             if self.open_sub_tab == "life events":
                 self.sub_tab_1.disable()
                 self.sub_tab_2.enable()
+                self.sub_tab_3.enable()
                 self.history_text_box.kill()
                 self.history_text_box = UITextBoxTweaked(
                     self.get_all_history_text(),
@@ -2357,6 +2460,7 @@ class ProfileScreen(Screens):
             elif self.open_sub_tab == "user notes":
                 self.sub_tab_1.enable()
                 self.sub_tab_2.disable()
+                self.sub_tab_3.enable()
                 if self.history_text_box:
                     self.history_text_box.kill()
                     self.no_moons.kill()
@@ -2410,6 +2514,11 @@ class ProfileScreen(Screens):
                         line_spacing=1,
                         manager=MANAGER,
                     )
+            elif self.open_sub_tab == "past events":
+                self.sub_tab_1.enable()
+                self.sub_tab_2.enable()
+                self.sub_tab_3.disable()
+                self.display_past_events_page()
 
         # Conditions Tab
         elif self.open_tab == "conditions":
@@ -2462,6 +2571,8 @@ class ProfileScreen(Screens):
                     self.history_text_box.kill()
                 self.show_moons.kill()
                 self.no_moons.kill()
+            elif self.open_sub_tab == "past events":
+                self.close_past_events_tab()
 
         elif self.open_tab == "conditions":
             self.left_conditions_arrow.kill()
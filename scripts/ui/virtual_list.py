@@ -0,0 +1,70 @@
+from bisect import bisect_right
+from typing import List, Optional, Tuple
+
+
+class VirtualList:
+    """
+    Keeps track of where the rows of a scrolling list are, so only the rows near the view need widgets.
+
+    Rows that were never built have no measured height yet, they count as the average of the
+    measured rows (or the given estimate, before any row was measured).
+    """
+
+    def __init__(self, count: int, estimate: int):
+        """
+        :param count: amount of rows
+        :param estimate: height of a row that was never measured, until one is
+        """
+        self.heights: List[Optional[int]] = [None] * count
+        """The measured height of each row, None for rows that were never measured"""
+        self.estimate = estimate
+        self._measured_total = 0
+        self._measured_count = 0
+        self._offsets: Optional[List[int]] = None
+
+    def __len__(self):
+        return len(self.heights)
+
+    @property
+    def row_estimate(self) -> int:
+        if not self._measured_count:
+            return self.estimate
+        return round(self._measured_total / self._measured_count)
+
+    def set_height(self, index: int, height: int):
+        """Records the measured height of a row."""
+        old_height = self.heights[index]
+        if old_height == height:
+            return
+        if old_height is None:
+            self._measured_count += 1
+        else:
+            self._measured_total -= old_height
+        self._measured_total += height
+        self.heights[index] = height
+        self._offsets = None
+
+    @property
+    def offsets(self) -> List[int]:
+        """The top of each row, followed by the bottom of the last row"""
+        if self._offsets is None:
+            estimate = self.row_estimate
+            offsets = [0]
+            for height in self.heights:
+                offsets.append(offsets[-1] + (estimate if height is None else height))
+            self._offsets = offsets
+        return self._offsets
+
+    @property
+    def total_height(self) -> int:
+        return self.offsets[-1]
+
+    def row_at(self, position: int) -> int:
+        """Returns the index of the row at the given position, clamped to the rows there are."""
+        return max(0, min(bisect_right(self.offsets, position) - 1, len(self) - 1))
+
+    def rows_between(self, top: int, bottom: int) -> Tuple[int, int]:
+        """Returns the first and one past the last index of the rows that are at least partly between top and bottom."""
+        if not self.heights or bottom <= 0 or top >= self.total_height:
+            return 0, 0
+        return self.row_at(top), self.row_at(bottom - 1) + 1
@@ -6,12 +6,14 @@ TODO: Docs
 
 """  # pylint: enable=line-too-long
 
+import heapq
 import logging
 import os
 import re
 import traceback
 from itertools import combinations
 from math import floor
+from operator import attrgetter
 from random import choice, choices, randint, random, sample, randrange, getrandbits
 from sys import exit as sys_exit
 from typing import List, Tuple, TYPE_CHECKING, Type, Union, Optional
@@ -110,11 +112,7 @@ def find_alive_cats_with_rank(
     :param bool sort: default False, set to True if you would like list sorted by descending moon age
     """
 
-    alive_cats = [
-        i
-        for i in Cat.all_cats.values()
-        if i.status.rank in ranks and i.status.alive_in_player_clan
-    ]
+    alive_cats = Cat.clan_cats_with_rank(ranks)
 
     if working:
         alive_cats = [i for i in alive_cats if not i.not_working()]
@@ -130,12 +128,7 @@ def get_living_cat_count(Cat):
     Returns the int of all living cats, both in and out of the Clan
     :param Cat: Cat class
     """
-    count = 0
-    for the_cat in Cat.all_cats.values():
-        if the_cat.dead:
-            continue
-        count += 1
-    return count
+    return len(Cat.living_cats())
 
 
 def get_living_clan_cat_count(Cat):
@@ -143,12 +136,7 @@ def get_living_clan_cat_count(Cat):
     Returns the int of all living cats within the Clan
     :param Cat: Cat class
     """
-    count = 0
-    for the_cat in Cat.all_cats.values():
-        if not the_cat.status.alive_in_player_clan:
-            continue
-        count += 1
-    return count
+    return len(Cat.living_clan_cats())
 
 
 def get_cats_same_age(Cat, cat, age_range=10):
@@ -159,9 +147,7 @@ def get_cats_same_age(Cat, cat, age_range=10):
     :param int age_range: The allowed age difference between the two cats, default 10
     """
     cats = []
-    for inter_cat in Cat.all_cats.values():
-        if not inter_cat.status.alive_in_player_clan:
-            continue
+    for inter_cat in Cat.living_clan_cats():
         if inter_cat.ID == cat.ID:
             continue
 
@@ -183,9 +169,7 @@ def get_cats_same_age(Cat, cat, age_range=10):
 def get_free_possible_mates(cat):
     """Returns a list of available cats, which are possible mates for the given cat."""
     cats = []
-    for inter_cat in cat.all_cats.values():
-        if not inter_cat.status.alive_in_player_clan:
-            continue
+    for inter_cat in cat.living_clan_cats():
         if inter_cat.ID == cat.ID:
             continue
 
@@ -531,9 +515,7 @@ def create_new_cat_block(
     # check if we can use an existing cat here
     chosen_cat: Optional["Cat"] = None
     if "exists" in attribute_list:
-        existing_outsiders = [
-            i for i in Cat.all_cats.values() if i.status.is_outsider and not i.dead
-        ]
+        existing_outsiders = Cat.outsider_cats()
         possible_outsiders = []
         for cat in existing_outsiders:
             if stor and cat.backstory not in stor:
@@ -988,7 +970,8 @@ def get_highest_romantic_relation(
     max_love_value = 0
     current_max_relationship = None
     for rel in relationships:
-        if rel.romance < 0:
+        # checked first, it's much cheaper than the mate checks
+        if rel.romance <= max_love_value:
             continue
         if exclude_mate and rel.cat_from.ID in rel.cat_to.mate:
             continue
@@ -1073,9 +1056,7 @@ def get_personality_compatibility(cat1, cat2):
 def get_cats_of_romantic_interest(cat):
     """Returns a list of cats, those cats are love interest of the given cat"""
     cats = []
-    for inter_cat in cat.all_cats.values():
-        if not inter_cat.status.alive_in_player_clan:
-            continue
+    for inter_cat in cat.living_clan_cats():
         if inter_cat.ID == cat.ID:
             continue
 
@@ -1086,9 +1067,8 @@ def get_cats_of_romantic_interest(cat):
             continue
 
         # Extra check to ensure they are potential mates
-        if (
-            inter_cat.is_potential_mate(cat, for_love_interest=True)
-            and cat.relationships[inter_cat.ID].romance > 0
+        if cat.relationships[inter_cat.ID].romance > 0 and inter_cat.is_potential_mate(
+            cat, for_love_interest=True
         ):
             cats.append(inter_cat)
     return cats
@@ -1102,51 +1082,71 @@ def get_num_of_cats_with_relation_amount_towards(cat, amount, all_cats):
     :param all_cats: list of cats which has to be checked
     """
 
-    # collect all true or false if the value is reached for the cat or not
-    # later count or sum can be used to get the amount of cats
-    # this will be handled like this, because it is easier / shorter to check
+    return_dict = {v: 0 for v in [*RelType]}
+    if not amount:
+        return return_dict
 
-    relation_dict = {v: [] for v in [*RelType]}
+    for relation in get_relations_towards(cat, all_cats):
+        for value in return_dict:
+            if amount > 0:
+                return_dict[value] += getattr(relation, value) >= amount
+            else:
+                return_dict[value] += getattr(relation, value) <= amount
 
-    for inter_cat in all_cats:
-        if cat.ID in inter_cat.relationships:
-            relation = inter_cat.relationships[cat.ID]
-        else:
-            continue
+    return return_dict
 
-        for value in [*RelType]:
-            if amount > 0:
-                relation_dict[value].append(
-                    relation.get_amount_of_type(value) >= amount
-                )
-            elif amount < 0:
-                relation_dict[value].append(
-                    relation.get_amount_of_type(value) <= amount
-                )
 
-    return_dict = {v: sum(relation_dict[v]) for v in [*RelType]}
+def get_relations_towards(cat, cats=None) -> list:
+    """
+    Returns the relationships other cats have towards the given cat, in the order of cats
+    :param cat: cat in question
+    :param cats: list of cats whose feelings are looked at, default the living Clan cats
+    """
+    if cats is None:
+        cats = cat.living_clan_cats()
 
-    return return_dict
+    relations = []
+    for inter_cat in cats:
+        relation = inter_cat.relationships.get(cat.ID)
+        if relation is not None:
+            relations.append(relation)
+    return relations
 
 
-def filter_relationship_type(
-    group: list, filter_types: List[str], event_id: str = None, patrol_leader=None
-):
+def get_relations_from(cat, cats=None) -> list:
     """
-    filters for specific types of relationships between groups of cat objects, returns bool
-    :param group: the group of cats to be tested (make sure they're in the correct order (i.e. if testing for
-    parent/child, the cat being tested as parent must be index 0)
-    :param filter_types: the relationship types to check for.
-    :param event_id: if the event has an ID, include it here
-    :param patrol_leader: if you are testing a patrol, ensure you include the self.patrol_leader here
+    Returns the relationships the given cat has towards other cats, in the order of cats
+    :param cat: cat in question
+    :param cats: list of cats the feelings are towards, default every cat the cat has a relationship with
+    """
+    if cats is None:
+        return list(cat.relationships.values())
+    return [
+        cat.relationships[inter_cat.ID]
+        for inter_cat in cats
+        if inter_cat.ID in cat.relationships
+    ]
+
+
+def get_top_relations(cat, rel_type: RelType, k: int, cats=None, inbound=False) -> list:
     """
-    if not filter_types:
-        return True
+    Returns the k relationships with the highest rel_type value, highest first.
+    Relationships with the same value keep their order.
+    :param cat: cat in question
+    :param rel_type: the relationship value to rank by
+    :param k: how many relationships to return at most
+    :param cats: list of cats to look at, see get_relations_from and get_relations_towards for the default
+    :param inbound: rank the feelings of the other cats towards the cat instead of the cat's own feelings
+    """
+    if inbound:
+        relations = get_relations_towards(cat, cats)
+    else:
+        relations = get_relations_from(cat, cats)
+    return heapq.nlargest(k, relations, key=attrgetter(rel_type))
 
-    filter_list = filter_types.copy()
 
-    # keeping this list here just for quick reference of what tags are handled here
-    all_possible_tags = [
+RELATIONSHIP_STATUS_TAGS = frozenset(
+    [
         "siblings",
         "not_siblings",
         "littermates",
@@ -1163,12 +1163,31 @@ def filter_relationship_type(
         "app/mentor",
         "not_app",
     ]
-    for tier_list in rel_type_tiers.values():
-        all_possible_tags.extend(tier_list)
-        all_possible_tags.extend([f"{l}_only" for l in tier_list])
-    if not set(filter_list).issubset(set(all_possible_tags)):
+    + [tier for tier_list in rel_type_tiers.values() for tier in tier_list]
+    + [f"{tier}_only" for tier_list in rel_type_tiers.values() for tier in tier_list]
+)
+"""All tags filter_relationship_type handles"""
+
+
+def filter_relationship_type(
+    group: list, filter_types: List[str], event_id: str = None, patrol_leader=None
+):
+    """
+    filters for specific types of relationships between groups of cat objects, returns bool
+    :param group: the group of cats to be tested (make sure they're in the correct order (i.e. if testing for
+    parent/child, the cat being tested as parent must be index 0)
+    :param filter_types: the relationship types to check for.
+    :param event_id: if the event has an ID, include it here
+    :param patrol_leader: if you are testing a patrol, ensure you include the self.patrol_leader here
+    """
+    if not filter_types:
+        return True
+
+    filter_list = filter_types.copy()
+
+    if not RELATIONSHIP_STATUS_TAGS.issuperset(filter_list):
         print(
-            f"WARNING: {[tag for tag in filter_list if tag not in all_possible_tags]} is not a valid relationship_status tag!"
+            f"WARNING: {[tag for tag in filter_list if tag not in RELATIONSHIP_STATUS_TAGS]} is not a valid relationship_status tag!"
         )
 
     if patrol_leader:
@@ -1318,18 +1337,19 @@ def filter_relationship_type(
 
     # Filtering relationship values
     # each cat has to have relationships toward each other matching every level tag
+    group_ids = list(dict.fromkeys(cat.ID for cat in group))
     for tier in filter_list:
         for inter_cat in group:
             if len(group) == 2 and inter_cat == group[1]:
                 # if this is a two cat group, then we only look for the first cat's rel toward the second cat.
                 # groups > 2 will require that all cats feel the same way toward each other.
                 continue
-            group_ids = [cat.ID for cat in group]
 
+            # looked up directly, the cats can have relationships to the whole Clan
             relevant_relationships = [
-                rel
-                for rel in inter_cat.relationships.values()
-                if rel.cat_to.ID in group_ids and rel.cat_to.ID != inter_cat.ID
+                inter_cat.relationships[cat_id]
+                for cat_id in group_ids
+                if cat_id != inter_cat.ID and cat_id in inter_cat.relationships
             ]
 
             # list of every cat's tier list
@@ -1644,7 +1664,7 @@ def change_relationship_values(
                     count=single_cat_to.moons,
                 )
                 if log_text not in rel.log:
-                    rel.log.append(log_text)
+                    rel.add_log(log_text)
 
 
 # ---------------------------------------------------------------------------- #
@@ -1856,13 +1876,11 @@ def get_special_snippet_list(
         if (
             chosen_list == "story_list"
         ):  # story list has some biome specific things to collect
-            snippets = SNIPPETS[chosen_list]["general"]
-            snippets.extend(SNIPPETS[chosen_list][biome])
+            snippets = SNIPPETS[chosen_list]["general"] + SNIPPETS[chosen_list][biome]
         elif (
             chosen_list == "clair_list"
         ):  # the clair list also pulls from the dream list
-            snippets = SNIPPETS[chosen_list]
-            snippets.extend(SNIPPETS["dream_list"])
+            snippets = SNIPPETS[chosen_list] + SNIPPETS["dream_list"]
         else:  # the dream list just gets the one
             snippets = SNIPPETS[chosen_list]
 
@@ -2577,8 +2595,15 @@ def update_mask(cat):
         cat.sprite_mask = None
         return
 
+    # sprites are shared between cats that look the same, so their masks can be too
+    mask_size = ui_scale_dimensions((50, 50))
+    cached_mask = image_cache.sprite_cache.get_mask(cat.sprite, mask_size)
+    if cached_mask is not None:
+        cat.sprite_mask = cached_mask
+        return
+
     val = pygame.mask.from_surface(
-        pygame.transform.scale(cat.sprite, ui_scale_dimensions((50, 50))), threshold=250
+        pygame.transform.scale(cat.sprite, mask_size), threshold=250
     )
 
     inflated_mask = pygame.Mask(
@@ -2597,6 +2622,7 @@ def update_mask(cat):
                         inflated_mask.set_at((point[0] + dx, point[1] + dy), 1)
                     except IndexError:
                         continue
+    image_cache.sprite_cache.add_mask(cat.sprite, mask_size, inflated_mask)
     cat.sprite_mask = inflated_mask
 
 
@@ -2629,6 +2655,75 @@ def clan_symbol_sprite(clan, return_string=False, force_light=False):
         return sprites.get_symbol(clan.chosen_symbol, force_light=force_light)
 
 
+def recolor_lineart(
+    sprite: pygame.Surface, color=None, source: pygame.Surface = None
+) -> pygame.Surface:
+    """
+    Replaces the opaque black pixels of a sprite, without touching the original sprite.
+
+    :param sprite: lineart to recolor
+    :param color: color to apply to all black pixels
+    :param source: source surface of same size as sprite, black pixels take the color of
+        the source pixel at the same position. Only used if no color is given.
+    :return: the recolored copy of the sprite
+    """
+    if color is None and source is None:
+        raise ValueError("Must provide either `color` or `source` for recolor_lineart")
+
+    # the color threshold ignores alpha, so only keep the fully opaque black pixels
+    black_mask = pygame.mask.from_threshold(
+        sprite, (0, 0, 0, 255), (1, 1, 1, 255)
+    ).overlap_mask(pygame.mask.from_surface(sprite, threshold=254), (0, 0))
+
+    if color:
+        return black_mask.to_surface(setcolor=color, unsetsurface=sprite)
+    return black_mask.to_surface(setsurface=source, unsetsurface=sprite)
+
+
+def get_sprite_cache_key(cat, cat_sprite, dead, scars_hidden, acc_hidden) -> tuple:
+    """
+    Returns a key containing everything generate_sprite reads to draw the cat,
+    so cats that look the same share their sprite.
+
+    :param cat: the cat to draw
+    :param cat_sprite: the pose index of the sprite
+    :param dead: if the sprite is drawn with afterlife lineart
+    :param scars_hidden: if the scars are hidden
+    :param acc_hidden: if the accessories are hidden
+    """
+    pelt = cat.pelt
+    fading = (
+        dead
+        and pelt.opacity <= 97
+        and not cat.prevent_fading
+        and get_clan_setting("fading")
+    )
+    return (
+        cat_sprite,
+        cat.status.group if dead else None,
+        pelt.get_sprites_name(),
+        pelt.name,
+        pelt.colour,
+        pelt.tortie_base,
+        pelt.tortie_pattern,
+        pelt.tortie_colour,
+        pelt.tortie_marking,
+        pelt.tint,
+        pelt.white_patches,
+        pelt.white_patches_tint,
+        pelt.points,
+        pelt.vitiligo,
+        pelt.eye_colour,
+        pelt.eye_colour2,
+        pelt.skin,
+        None if scars_hidden else tuple(pelt.scars),
+        None if acc_hidden else tuple(pelt.accessory or ()),
+        pelt.opacity if fading else None,
+        pelt.reverse,
+        game_setting_get("shaders") and not dead,
+    )
+
+
 def generate_sprite(
     cat,
     life_state=None,
@@ -2693,6 +2788,14 @@ def generate_sprite(
 
     # generating the sprite
     try:
+        # reuse the sprite if a cat with the same appearance was already drawn
+        cache_key = get_sprite_cache_key(
+            cat, cat_sprite, dead, scars_hidden, acc_hidden
+        )
+        cached_sprite = image_cache.sprite_cache.get(cache_key)
+        if cached_sprite is not None:
+            return cached_sprite
+
         if cat.pelt.name not in ["Tortie", "Calico"]:
             new_sprite.blit(
                 sprites.sprites[
@@ -2857,26 +2960,7 @@ def generate_sprite(
             """
             if not dead:
                 return sprite
-
-            if color is None and source is None:
-                raise ValueError(
-                    "Must provide either `color` or `source` for _recolor_lineart"
-                )
-
-            out = sprite.copy()
-            if color:
-                pixel_array = pygame.PixelArray(out)
-                pixel_array.replace((0, 0, 0), color, distance=0)
-                del pixel_array
-                return out
-
-            width, height = sprite.get_size()
-            for x in range(width):
-                for y in range(height):
-                    if sprite.get_at((x, y)) == pygame.Color(0, 0, 0):
-                        color = source.get_at((x, y))
-                        sprite.set_at((x, y), color)
-            return out
+            return recolor_lineart(sprite, color, source)
 
         # draw line art
         if game_setting_get("shaders") and not dead:
@@ -3042,6 +3126,8 @@ def generate_sprite(
         if cat.pelt.reverse:
             new_sprite = pygame.transform.flip(new_sprite, True, False)
 
+        image_cache.sprite_cache.add(cache_key, new_sprite)
+
     except (TypeError, KeyError):
         traceback.print_exc()
         logger.exception("Failed to load sprite")
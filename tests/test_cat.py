@@ -3,6 +3,8 @@ import unittest
 from unittest.mock import patch
 from copy import deepcopy
 
+import i18n
+
 from scripts.game_structure import game
 
 os.environ["SDL_VIDEODRIVER"] = "dummy"
@@ -10,7 +12,13 @@ os.environ["SDL_AUDIODRIVER"] = "dummy"
 
 from scripts.cat.cats import Cat
 from scripts.cat.enums import CatAge, CatRank, CatGroup, CatSocial
+from scripts.cat.names import Name
 from scripts.cat_relations.relationship import Relationship
+from scripts.game_structure.game.switches import (
+    switch_get_value,
+    switch_set_value,
+    Switch,
+)
 
 
 class TestCreationAge(unittest.TestCase):
@@ -88,6 +96,44 @@ class TestRelativesFunction(unittest.TestCase):
         self.assertFalse(kit.is_grandparent(grand_parent))
         self.assertTrue(grand_parent.is_grandparent(kit))
 
+    # test that is_cousin returns True for cats whose parents are siblings and False otherwise
+    def test_is_cousin(self):
+        grand_parent = Cat(disable_random=True)
+        sibling1 = Cat(parent1=grand_parent.ID, disable_random=True)
+        sibling2 = Cat(parent1=grand_parent.ID, disable_random=True)
+        kit1 = Cat(parent1=sibling1.ID, disable_random=True)
+        kit2 = Cat(parent1=sibling2.ID, disable_random=True)
+        self.assertFalse(kit1.is_cousin(sibling2))
+        self.assertFalse(kit1.is_cousin(grand_parent))
+        self.assertTrue(kit1.is_cousin(kit2))
+        self.assertTrue(kit2.is_cousin(kit1))
+
+    # test that kits born after the inheritance was created are found by their relatives
+    def test_new_kit_updates_relatives(self):
+        grand_parent = Cat(disable_random=True)
+        parent = Cat(parent1=grand_parent.ID, disable_random=True)
+        grand_parent.create_inheritance_new_cat()
+        parent.create_inheritance_new_cat()
+        self.assertEqual(len(grand_parent.inheritance.grand_kits), 0)
+
+        kit = Cat(parent1=parent.ID, disable_random=True)
+        kit.create_inheritance_new_cat()
+        self.assertIn(kit.ID, parent.inheritance.kits)
+        self.assertIn(kit.ID, grand_parent.inheritance.grand_kits)
+
+    # test that set_mate updates the inheritance of the relatives of the new mates
+    def test_set_mate_updates_relatives(self):
+        parent = Cat(disable_random=True)
+        kit1 = Cat(parent1=parent.ID, disable_random=True)
+        kit2 = Cat(parent1=parent.ID, disable_random=True)
+        mate = Cat(disable_random=True)
+        for cat in (parent, kit1, kit2, mate):
+            cat.create_inheritance_new_cat()
+
+        kit1.set_mate(mate)
+        self.assertIn(mate.ID, kit2.inheritance.siblings_mates)
+        self.assertIn(mate.ID, parent.inheritance.kits_mates)
+
 
 class TestPossibleMateFunction(unittest.TestCase):
     # test that is_potential_mate returns False for cats that are related to each other
@@ -719,3 +765,172 @@ class TestSocialAssignment(unittest.TestCase):
             with self.subTest("outsider social assignment"):
                 cat = Cat(status_dict={"rank": rank}, disable_random=True)
                 self.assertTrue(cat.status.social == social)
+
+
+class TestPopulationViews(unittest.TestCase):
+    def setUp(self):
+        self.warrior = Cat(status_dict={"rank": CatRank.WARRIOR}, moons=30)
+        self.kitten = Cat(status_dict={"rank": CatRank.KITTEN}, moons=3)
+        self.loner = Cat(status_dict={"rank": CatRank.LONER}, moons=30)
+
+    def test_views_follow_status(self):
+        self.assertIn(self.warrior, Cat.living_clan_cats())
+        self.assertIn(self.warrior, Cat.clan_cats_with_rank([CatRank.WARRIOR]))
+        self.assertNotIn(self.loner, Cat.living_clan_cats())
+        self.assertIn(self.loner, Cat.outsider_cats())
+
+        self.warrior.status._change_rank(CatRank.ELDER)
+        self.assertNotIn(self.warrior, Cat.clan_cats_with_rank([CatRank.WARRIOR]))
+        self.assertIn(self.warrior, Cat.clan_cats_with_rank([CatRank.ELDER]))
+
+        self.warrior.status.send_to_afterlife(CatGroup.STARCLAN_ID)
+        self.assertNotIn(self.warrior, Cat.living_cats())
+        self.assertIn(self.warrior, Cat.afterlife_cats([CatGroup.STARCLAN_ID]))
+        self.assertNotIn(self.warrior, Cat.afterlife_cats([CatGroup.DARK_FOREST_ID]))
+
+    def test_views_follow_age(self):
+        self.assertIn(self.kitten, Cat.clan_cats_of_age([CatAge.KITTEN]))
+
+        self.kitten.moons = 7
+        self.assertNotIn(self.kitten, Cat.clan_cats_of_age([CatAge.KITTEN]))
+        self.assertIn(self.kitten, Cat.clan_cats_of_age([CatAge.ADOLESCENT]))
+
+    def test_views_keep_registry_order(self):
+        Cat.all_cats.pop(self.warrior.ID)
+        Cat.all_cats[self.warrior.ID] = self.warrior
+        self.kitten.status._change_rank(CatRank.WARRIOR)
+
+        for ranks in ([CatRank.WARRIOR], [CatRank.WARRIOR, CatRank.ELDER]):
+            self.assertEqual(
+                Cat.clan_cats_with_rank(ranks),
+                [
+                    cat
+                    for cat in Cat.all_cats.values()
+                    if cat.status.alive_in_player_clan and cat.status.rank in ranks
+                ],
+            )
+
+
+class TestNameSearch(unittest.TestCase):
+    def setUp(self):
+        self.cat = Cat(
+            prefix="Thistle",
+            suffix="claw",
+            status_dict={"rank": CatRank.WARRIOR},
+            moons=30,
+        )
+
+    def search(self, text, within=None):
+        return Cat.all_cats.search_names(text, within)
+
+    def test_search_ignores_case(self):
+        self.assertIn(self.cat.ID, self.search("thistlecl"))
+        self.assertIn(self.cat.ID, self.search("TLEC"))
+        self.assertIn(self.cat.ID, self.search("w"))
+        self.assertNotIn(self.cat.ID, self.search("thistlepaw"))
+
+    def test_search_follows_name_changes(self):
+        self.cat.name.prefix = "Bramble"
+        self.assertNotIn(self.cat.ID, self.search("thistle"))
+        self.assertIn(self.cat.ID, self.search("brambleclaw"))
+
+        self.cat.name = Name("Fern", "song", cat=self.cat)
+        self.assertIn(self.cat.ID, self.search("fernsong"))
+
+        # the suffix follows the rank
+        self.cat.status._change_rank(CatRank.LEADER)
+        self.assertIn(self.cat.ID, self.search("fernstar"))
+        self.assertNotIn(self.cat.ID, self.search("fernsong"))
+
+    def test_search_follows_the_language(self):
+        self.search("thistle")
+        # a name that reads differently without being changed
+        self.cat.name._prefix = "Bramble"
+        self.assertIn(self.cat.ID, self.search("thistle"))
+
+        locale = i18n.config.get("locale")
+        self.addCleanup(i18n.config.set, "locale", locale)
+        i18n.config.set("locale", "es" if locale != "es" else "en")
+        self.assertNotIn(self.cat.ID, self.search("thistle"))
+        self.assertIn(self.cat.ID, self.search("bramble"))
+
+    def test_search_follows_the_registry(self):
+        kit = Cat(prefix="Thistle", suffix="kit", status_dict={"rank": CatRank.KITTEN})
+        self.assertTrue({self.cat.ID, kit.ID} <= self.search("thistle"))
+
+        Cat.all_cats.pop(kit.ID)
+        Cat.all_cats_list.remove(kit)
+        self.assertNotIn(kit.ID, self.search("thistle"))
+        self.assertNotIn(kit.ID, self.search("th"))
+
+    def test_search_within(self):
+        other = Cat(
+            prefix="Thistle", suffix="fur", status_dict={"rank": CatRank.WARRIOR}
+        )
+        matches = self.search("thistle")
+        self.assertTrue({self.cat.ID, other.ID} <= matches)
+        self.assertEqual(self.search("thistlec", {other.ID}), set())
+        self.assertEqual(self.search("tlecl", matches), self.search("tlecl"))
+
+
+class TestSortCats(unittest.TestCase):
+    def setUp(self):
+        self.sort_type = switch_get_value(Switch.sort_type)
+        self.warrior = Cat(status_dict={"rank": CatRank.WARRIOR}, moons=30)
+        self.elder = Cat(status_dict={"rank": CatRank.ELDER}, moons=130)
+        self.kitten = Cat(status_dict={"rank": CatRank.KITTEN}, moons=3)
+        self.cats = [self.kitten, self.elder, self.warrior]
+
+    def tearDown(self):
+        switch_set_value(Switch.sort_type, self.sort_type)
+
+    def sorted_cats(self, sort_type):
+        switch_set_value(Switch.sort_type, sort_type)
+        Cat.sort_cats(self.cats)
+        return self.cats
+
+    def test_sort_follows_changes(self):
+        self.assertEqual(
+            self.sorted_cats("age"), [self.kitten, self.warrior, self.elder]
+        )
+        self.kitten.moons = 200
+        self.assertEqual(
+            self.sorted_cats("age"), [self.warrior, self.elder, self.kitten]
+        )
+
+        self.assertEqual(
+            self.sorted_cats("rank"), [self.warrior, self.elder, self.kitten]
+        )
+        self.elder.status._change_rank(CatRank.DEPUTY)
+        self.assertEqual(
+            self.sorted_cats("rank"), [self.elder, self.warrior, self.kitten]
+        )
+
+        for cat, experience in ((self.warrior, 50), (self.elder, 10), (self.kitten, 0)):
+            cat.experience = experience
+        self.assertEqual(
+            self.sorted_cats("exp"), [self.warrior, self.elder, self.kitten]
+        )
+        self.kitten.experience = 100
+        self.assertEqual(
+            self.sorted_cats("exp"), [self.kitten, self.warrior, self.elder]
+        )
+
+    def test_sort_by_death(self):
+        for cat, dead_for in ((self.warrior, 5), (self.elder, 2)):
+            cat.status.send_to_afterlife(CatGroup.STARCLAN_ID)
+            cat.dead_for = dead_for
+        self.assertEqual(self.sorted_cats("death")[:2], [self.warrior, self.elder])
+
+        for _ in range(4):
+            self.elder.status.increase_current_moons_as()
+        self.assertEqual(self.sorted_cats("death")[:2], [self.elder, self.warrior])
+
+    def test_sort_cats_outside_the_registry(self):
+        self.sorted_cats("age")
+        Cat.all_cats.pop(self.elder.ID)
+        Cat.all_cats_list.remove(self.elder)
+        self.elder.moons = 1
+        self.assertEqual(
+            self.sorted_cats("age"), [self.elder, self.kitten, self.warrior]
+        )
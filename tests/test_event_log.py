@@ -0,0 +1,115 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+from scripts.event_class import Single_Event
+from scripts.game_structure.game.save_load.event_log import EventLog, SEGMENT_MOONS
+
+
+class TestEventLog(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.directory = Path(self.temp_dir.name) / "event_log"
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    @staticmethod
+    def make_events(moon):
+        return [
+            Single_Event(f"death {moon}", "birth_death", ["1"]),
+            Single_Event(f"ceremony {moon}", ["ceremony", "misc"], ["1", "2"]),
+            Single_Event(f"patrol {moon}", "misc", ["2"]),
+        ]
+
+    def test_events_round_trip(self):
+        log = EventLog(self.directory)
+        events = self.make_events(3)
+        log.add_moon(3, events)
+        log.flush()
+
+        read = EventLog(self.directory).moon_events(3)
+        self.assertEqual(
+            [event.to_dict() for event in read], [event.to_dict() for event in events]
+        )
+
+    def test_saving_appends_only_new_events(self):
+        log = EventLog(self.directory)
+        for moon in range(SEGMENT_MOONS + 5):
+            log.add_moon(moon, self.make_events(moon))
+        log.flush()
+        first_segment = log.segment_path(0).read_bytes()
+
+        # saving the same moon again, with one new event
+        log = EventLog(self.directory)
+        moon = SEGMENT_MOONS + 4
+        events = self.make_events(moon)
+        log.add_moon(moon, events)
+        log.flush()
+        log.add_moon(moon, events + [Single_Event("new", "misc")])
+        log.flush()
+
+        self.assertEqual(log.segment_path(0).read_bytes(), first_segment)
+        self.assertEqual(
+            [event.text for event in EventLog(self.directory).moon_events(moon)],
+            [event.text for event in events] + ["new"],
+        )
+        self.assertEqual(log.moon_range(), (0, SEGMENT_MOONS + 4))
+
+    def test_unwritten_moons_are_replaced_and_queried(self):
+        log = EventLog(self.directory)
+        log.add_moon(1, self.make_events(1))
+        log.flush()
+        log.add_moon(2, self.make_events(2))
+        log.add_moon(3, self.make_events(3))
+        # the clan was loaded again at moon 2
+        log.add_moon(2, [Single_Event("other", "misc", ["1"])])
+
+        page = log.query(cat_id="1", page_size=10)
+        self.assertEqual(
+            [(moon, event.text) for moon, event in page.events],
+            [(2, "other"), (1, "death 1"), (1, "ceremony 1")],
+        )
+        self.assertEqual(log.moon_range(), (1, 2))
+
+    def test_queries(self):
+        log = EventLog(self.directory)
+        for moon in range(100):
+            log.add_moon(moon, self.make_events(moon))
+        log.flush()
+        log = EventLog(self.directory)
+
+        deaths = log.query(
+            event_type="birth_death", first_moon=20, last_moon=29, page_size=4
+        )
+        self.assertEqual(deaths.page_count, 3)
+        self.assertEqual(
+            [event.text for _, event in deaths.events],
+            ["death 29", "death 28", "death 27", "death 26"],
+        )
+
+        page = log.query(cat_id="2", event_type="misc", page=99, newest_first=False)
+        self.assertEqual(page.page, page.page_count - 1)
+        self.assertEqual(
+            [event.text for _, event in page.events][-2:], ["ceremony 99", "patrol 99"]
+        )
+
+        # events written after the index was built are found too
+        log.add_moon(100, [Single_Event("new", "birth_death", ["3"])])
+        log.flush()
+        self.assertEqual(
+            [event.text for _, event in log.query(cat_id="3").events], ["new"]
+        )
+        self.assertEqual(log.query(cat_id="4"), ([], 0, 1))
+
+    def test_partly_written_line_is_dropped(self):
+        log = EventLog(self.directory)
+        log.add_moon(1, self.make_events(1))
+        log.flush()
+        with open(log.segment_path(0), "ab") as log_file:
+            log_file.write(b'{"moon": 2, "te')
+
+        log = EventLog(self.directory)
+        log.add_moon(2, self.make_events(2))
+        log.flush()
+        self.assertEqual(len(log.query(page_size=100).events), 6)
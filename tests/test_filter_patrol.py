@@ -7,7 +7,7 @@ os.environ["SDL_AUDIODRIVER"] = "dummy"
 from scripts.cat.cats import Cat
 from scripts.cat_relations.relationship import Relationship
 from scripts.clan import Clan
-from scripts.events_module.patrol.patrol import PatrolEvent, Patrol
+from scripts.events_module.patrol.patrol import PatrolEvent, Patrol, PatrolIndex
 
 from scripts.utility import filter_relationship_type
 
@@ -895,3 +895,57 @@ class TestRelationshipConstraintPatrols(unittest.TestCase):
                 patrol.patrol_leader,
             )
         )
+
+
+class TestPatrolIndex(unittest.TestCase):
+    def test_patrol_fits(self):
+        patrol_event = PatrolEvent(
+            patrol_id="test",
+            biome=["forest"],
+            season=["any"],
+            types=["hunting"],
+            min_cats=2,
+            max_cats=3,
+            min_max_status={"all apprentices": [1, 6]},
+        )
+        setup = {
+            "biome": "forest",
+            "camp": "camp1",
+            "current_season": "greenleaf",
+            "patrol_type": "hunting",
+            "patrol_size": 2,
+            "patrol_statuses": {"all apprentices": 1},
+        }
+        self.assertTrue(PatrolIndex.patrol_fits(patrol_event, **setup))
+
+        for change in (
+            {"biome": "beach"},
+            {"patrol_type": "border"},
+            {"patrol_size": 4},
+            {"patrol_statuses": {"normal adult": 2}},
+        ):
+            with self.subTest(change=change):
+                self.assertFalse(
+                    PatrolIndex.patrol_fits(patrol_event, **{**setup, **change})
+                )
+
+    def test_bucket_keeps_file_order(self):
+        patrol_index = PatrolIndex()
+        patrol_file = "patrols/forest/hunting/greenleaf.json"
+        patrols = patrol_index.get_patrols(patrol_file)
+        bucket = patrol_index.get_bucket(
+            patrol_file, "forest", "camp1", "greenleaf", "hunting", 2, {}
+        )
+
+        self.assertTrue(bucket)
+        self.assertEqual(
+            bucket,
+            [
+                patrol
+                for patrol in patrols
+                if PatrolIndex.patrol_fits(
+                    patrol, "forest", "camp1", "greenleaf", "hunting", 2, {}
+                )
+            ],
+        )
+        self.assertIs(patrol_index.get_patrols(patrol_file), patrols)
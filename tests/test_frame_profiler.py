@@ -0,0 +1,46 @@
+import unittest
+
+from scripts.game_structure.frame_profiler import FrameProfiler
+
+
+class TestFrameProfiler(unittest.TestCase):
+    def record_frames(self, profiler, amount):
+        for _ in range(amount):
+            profiler.begin_frame("test screen")
+            profiler.end_stage("on_use")
+            profiler.end_stage("draw_ui")
+        profiler.begin_frame("test screen")
+
+    def test_disabled_profiler_records_nothing(self):
+        profiler = FrameProfiler()
+        self.record_frames(profiler, 5)
+        self.assertEqual(len(profiler.frames), 0)
+        self.assertIsNone(profiler.get_worst_stage())
+
+    def test_ring_buffer_keeps_last_frames(self):
+        profiler = FrameProfiler(size=10)
+        profiler.set_enabled(True)
+        self.record_frames(profiler, 25)
+
+        self.assertEqual(len(profiler.frames), 10)
+        self.assertEqual(profiler.frame_count, 25)
+        self.assertEqual(
+            [stage[0] for stage in profiler.frames[-1].stages], ["on_use", "draw_ui"]
+        )
+        self.assertIn(profiler.get_worst_stage(99)[0], ("on_use", "draw_ui"))
+
+    def test_chrome_trace_nests_stages_in_frames(self):
+        profiler = FrameProfiler()
+        profiler.set_enabled(True)
+        self.record_frames(profiler, 2)
+
+        events = profiler.get_chrome_trace()["traceEvents"]
+        self.assertEqual(len(events), 6)
+        frame, first_stage, second_stage = events[:3]
+        self.assertEqual(frame["name"], "test screen")
+        self.assertEqual(first_stage["name"], "on_use")
+        self.assertTrue(all(event["ph"] == "X" for event in events))
+        self.assertLessEqual(frame["ts"], first_stage["ts"])
+        self.assertAlmostEqual(
+            frame["dur"], first_stage["dur"] + second_stage["dur"], places=3
+        )
@@ -1,5 +1,6 @@
 import os
 import unittest
+from unittest.mock import MagicMock, patch
 
 from scripts.events_module.short.short_event import ShortEvent
 
@@ -8,6 +9,12 @@ os.environ["SDL_AUDIODRIVER"] = "dummy"
 
 from scripts.cat.cats import Cat
 from scripts.cat.pelts import Pelt
+from scripts.events_module.short.short_event_generation import (
+    ShortEventCatalog,
+    find_needed_events,
+    generate_event_objects,
+    short_event_catalog,
+)
 
 
 class TestHandleEvent(unittest.TestCase):
@@ -194,3 +201,80 @@ class TestHandleFreshkillSupply(unittest.TestCase):
 
 class TestHandleHerbSupply(unittest.TestCase):
     pass
+
+
+class TestShortEventCatalog(unittest.TestCase):
+    def setUp(self):
+        from scripts.game_structure import game
+
+        self.clan = MagicMock()
+        self.clan.biome = "Forest"
+        self.clan.override_biome = None
+        self.clan.camp_bg = "camp1"
+        self.clan.current_season = "Leaf-bare"
+        self.clan.game_mode = "classic"
+        patcher = patch.object(game, "clan", self.clan)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_matches_unindexed_filtering(self):
+        from scripts.events_module.event_filters import (
+            event_for_location,
+            event_for_season,
+        )
+
+        catalog = ShortEventCatalog()
+        events = [event for _, event in generate_event_objects("misc", "general")]
+        for frequency in (1, 2, 3, 4):
+            for sub_types in {frozenset(event.sub_type) for event in events}:
+                found = catalog.get_events(
+                    "misc", "general", frequency, list(sub_types)
+                )
+                self.assertEqual(
+                    [event.event_id for event in found],
+                    [
+                        event.event_id
+                        for event, (event_frequency, _) in zip(
+                            events, generate_event_objects("misc", "general")
+                        )
+                        if event_frequency == frequency
+                        and set(event.sub_type) == sub_types
+                        and event_for_location(event.location)
+                        and event_for_season(event.season)
+                        and not {"expanded", "cruel_season"} & set(event.tags)
+                    ],
+                )
+
+    def test_unfiltered_keeps_all_events_of_frequency(self):
+        catalog = ShortEventCatalog()
+        frequencies = [
+            frequency for frequency, _ in generate_event_objects("misc", "general")
+        ]
+        self.assertEqual(
+            len(catalog.get_events("misc", "general", 4, clan_filtered=False)),
+            frequencies.count(4),
+        )
+
+    def test_override_requirements_skips_sub_types(self):
+        from scripts.game_structure import constants
+
+        expected = short_event_catalog.get_events(
+            "misc", "forest", 4, clan_filtered=False
+        ) + short_event_catalog.get_events("misc", "general", 4, clan_filtered=False)
+        with patch.dict(
+            constants.CONFIG["event_generation"], {"debug_override_requirements": True}
+        ):
+            found = find_needed_events(4, "misc", ["some_sub_type"])
+        self.assertEqual(found, expected)
+        self.assertTrue(found)
+
+    def test_cleared_on_locale_change(self):
+        catalog = ShortEventCatalog()
+        catalog.get_events("misc", "general", 4)
+        self.assertIn(("misc", "general"), catalog.files)
+
+        # as if the events were loaded before the language was changed
+        catalog.lang = "other_locale"
+        catalog.get_file("misc", "forest")
+        self.assertNotIn(("misc", "general"), catalog.files)
+        self.assertFalse(catalog.clan_events)
@@ -0,0 +1,140 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+import pygame
+import ujson
+
+os.environ["SDL_VIDEODRIVER"] = "dummy"
+os.environ["SDL_AUDIODRIVER"] = "dummy"
+
+from scripts.cat.sprites import Sprites
+from scripts.game_structure import constants
+from scripts.game_structure.image_cache import SpriteCache
+
+
+class TestSpriteCache(unittest.TestCase):
+    @staticmethod
+    def create_sprite():
+        return pygame.Surface((10, 10), pygame.SRCALPHA)  # 400 bytes
+
+    def test_hit_and_miss(self):
+        cache = SpriteCache(max_bytes=1000)
+        sprite = self.create_sprite()
+        self.assertIsNone(cache.get("a"))
+        cache.add("a", sprite)
+        self.assertIs(cache.get("a"), sprite)
+        self.assertEqual(cache.hits, 1)
+        self.assertEqual(cache.misses, 1)
+
+    def test_evicts_least_recently_used(self):
+        cache = SpriteCache(max_bytes=1000)
+        cache.add("a", self.create_sprite())
+        cache.add("b", self.create_sprite())
+        cache.get("a")
+        cache.add("c", self.create_sprite())
+
+        self.assertEqual(len(cache), 2)
+        self.assertIsNotNone(cache.get("a"))
+        self.assertIsNone(cache.get("b"))
+        self.assertIsNotNone(cache.get("c"))
+        self.assertEqual(cache.used_bytes, 800)
+
+    def test_masks_are_dropped_with_sprites(self):
+        cache = SpriteCache(max_bytes=1000)
+        sprite = self.create_sprite()
+        mask = pygame.mask.from_surface(sprite)
+        cache.add("a", sprite)
+        cache.add_mask(sprite, (10, 10), mask)
+        self.assertIs(cache.get_mask(sprite, (10, 10)), mask)
+        self.assertIsNone(cache.get_mask(sprite, (20, 20)))
+
+        cache.clear()
+        self.assertIsNone(cache.get_mask(sprite, (10, 10)))
+        self.assertEqual(cache.used_bytes, 0)
+
+
+class TestSpriteAtlas(unittest.TestCase):
+    def setUp(self):
+        self.cache_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.cache_dir.cleanup)
+        patcher = patch(
+            "scripts.cat.sprites.get_cache_dir", lambda: self.cache_dir.name
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def read_atlas_index(self):
+        with open(os.path.join(self.cache_dir.name, "sprite_atlas.bin"), "rb") as f:
+            return ujson.loads(f.readline())
+
+    def test_baked_sprites_match(self):
+        sliced = Sprites()
+        sliced.load_all()
+        self.assertEqual(
+            self.read_atlas_index()["sprites"].keys(), sliced.sprites.keys()
+        )
+
+        baked = Sprites()
+        with patch.object(Sprites, "spritesheet") as spritesheet:
+            baked.load_all()
+            spritesheet.assert_not_called()
+
+        # the sprites are only unpacked when they're looked up
+        self.assertEqual(dict.keys(baked.sprites), set())
+        self.assertEqual(sliced.sprites.keys(), baked.sprites.recipes.keys())
+        for name in list(sliced.sprites)[::50]:
+            self.assertEqual(
+                pygame.image.tobytes(sliced.sprites[name], "RGBA"),
+                pygame.image.tobytes(baked.sprites[name], "RGBA"),
+            )
+
+    def test_rebuilt_when_sources_change(self):
+        Sprites().load_all()
+
+        rebaked = Sprites()
+        with patch.object(Sprites, "get_atlas_key", return_value="changed"):
+            with patch.object(
+                Sprites, "spritesheet", autospec=True, side_effect=Sprites.spritesheet
+            ) as spritesheet:
+                rebaked.load_all()
+                spritesheet.assert_called()
+
+        self.assertEqual(self.read_atlas_index()["key"], "changed")
+
+    def test_rebuilt_when_cut_off(self):
+        Sprites().load_all()
+        atlas_path = os.path.join(self.cache_dir.name, "sprite_atlas.bin")
+        with open(atlas_path, "r+b") as atlas_file:
+            atlas_file.truncate(os.path.getsize(atlas_path) - 1)
+
+        self.assertFalse(Sprites().load_atlas(self.read_atlas_index()["key"]))
+
+
+class TestLazySprites(unittest.TestCase):
+    def test_lazy_sprites_match(self):
+        eager = Sprites()
+        with patch("scripts.cat.sprites.get_cache_dir", tempfile.gettempdir):
+            with patch.object(Sprites, "load_atlas", return_value=False):
+                with patch.object(Sprites, "save_atlas"):
+                    eager.load_all()
+
+        lazy = Sprites()
+        with patch.dict(constants.CONFIG["cat_sprites"], {"lazy_loading": True}):
+            lazy.load_all()
+
+        # only the lineart and fade masks are made while loading
+        self.assertIn("lineart0", dict.keys(lazy.sprites))
+        self.assertNotIn("acc_collarsBOW_crimson0", dict.keys(lazy.sprites))
+        self.assertNotIn("palettes_missing", lazy.sprites)
+
+        for name in list(eager.sprites)[::50]:
+            self.assertIn(name, lazy.sprites)
+            self.assertEqual(
+                pygame.image.tobytes(eager.sprites[name], "RGBA"),
+                pygame.image.tobytes(lazy.sprites[name], "RGBA"),
+            )
+        self.assertEqual(
+            eager.sprites.keys(), lazy.sprites.recipes.keys() | dict.keys(lazy.sprites)
+        )
@@ -11,6 +11,7 @@ os.environ["SDL_AUDIODRIVER"] = "dummy"
 from scripts.cat.cats import Cat, Relationship
 from scripts.cat.skills import SkillPath, Skill
 from scripts.cat_relations.interaction import (
+    InteractionConstraints,
     SingleInteraction,
     cats_fulfill_single_interaction_constraints,
 )
@@ -315,6 +316,34 @@ class RelationshipConstraints(unittest.TestCase):
                     )
 
 
+class RelationshipStorage(unittest.TestCase):
+    def test_log_is_made_when_needed(self):
+        cat_from = Cat()
+        cat_to = Cat()
+        rel = Relationship(cat_from, cat_to)
+        self.assertIsNone(rel._log)
+        self.assertEqual(rel.to_dict()["log"], [])
+
+        rel.add_log("test")
+        self.assertEqual(rel.log, ["test"])
+        self.assertEqual(
+            Relationship(cat_from, cat_to, log=rel.to_dict()["log"]).log, ["test"]
+        )
+
+    def test_used_interaction_ids_are_shared_until_reset(self):
+        cat_from = Cat()
+        cat_to = Cat()
+        rel = Relationship(cat_from, cat_to)
+        other_rel = Relationship(cat_to, cat_from)
+        self.assertIs(rel.used_interaction_ids, other_rel.used_interaction_ids)
+
+        rel.used_interaction_ids = []
+        self.assertIsNot(rel.used_interaction_ids, other_rel.used_interaction_ids)
+        self.assertIs(
+            other_rel.used_interaction_ids, Relationship.shared_interaction_ids
+        )
+
+
 class SingleInteractionCatConstraints(unittest.TestCase):
     def test_status(self):
         # given
@@ -497,3 +526,45 @@ class SingleInteractionCatConstraints(unittest.TestCase):
         self.assertTrue(
             cats_fulfill_single_interaction_constraints(clan, clan, all_to_clan)
         )
+
+
+class TestInteractionConstraints(unittest.TestCase):
+    def test_compiled_constraints_match(self):
+        # given
+        warrior = Cat(status_dict={"rank": CatRank.WARRIOR}, disable_random=True)
+        warrior.personality.trait = "calm"
+        warrior.backstory = "clanborn"
+        warrior.skills.primary = Skill(SkillPath.HUNTER, points=9)
+        medicine = Cat(status_dict={"rank": CatRank.MEDICINE_CAT}, disable_random=True)
+        medicine.personality.trait = "troublesome"
+        medicine.backstory = "halfclan1"
+        medicine.skills.primary = Skill(SkillPath.FIGHTER, points=9)
+        medicine.injuries["bruises"] = {}
+        self.addCleanup(medicine.injuries.clear)
+
+        # when
+        interactions = [
+            SingleInteraction("status", main_status_constraint=["warrior"]),
+            SingleInteraction("any_status", random_status_constraint=["any"]),
+            SingleInteraction("trait", random_trait_constraint=["troublesome"]),
+            SingleInteraction("skill", main_skill_constraint=["HUNTER,1"]),
+            SingleInteraction("bad_skill", main_skill_constraint=["good hunter"]),
+            SingleInteraction("backstory", backstory_constraint={"r_c": ["clanborn"]}),
+            SingleInteraction("injury", has_injuries={"m_c": ["bruises"]}),
+        ]
+
+        # then
+        for interaction in interactions:
+            constraints = InteractionConstraints(interaction)
+            for main_cat, random_cat in (
+                (warrior, medicine),
+                (medicine, warrior),
+                (warrior, warrior),
+            ):
+                with self.subTest(interaction=interaction.id, main_cat=main_cat.ID):
+                    self.assertEqual(
+                        constraints.fulfilled_by(main_cat, random_cat),
+                        cats_fulfill_single_interaction_constraints(
+                            main_cat, random_cat, interaction
+                        ),
+                    )
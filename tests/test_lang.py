@@ -13,6 +13,8 @@ from scripts.game_structure.localization import (
     get_new_pronouns,
     determine_plural_pronouns,
     set_lang_config_directory,
+    load_lang_resource,
+    resource_cache,
 )
 from scripts.utility import event_text_adjust
 
@@ -109,3 +111,40 @@ class TestLocalisation(unittest.TestCase):
                     ),
                     value[1]["subject"],
                 )
+
+
+class TestLoadLangResource(unittest.TestCase):
+    def tearDown(self):
+        i18n.config.set("locale", "en")
+
+    def test_resource_is_cached(self):
+        resource = load_lang_resource("snippet_collections.json")
+        hits = resource_cache.hits
+
+        self.assertIs(resource, load_lang_resource("snippet_collections.json"))
+        self.assertIs(resource, load_lang_resource("./snippet_collections.json"))
+        self.assertEqual(resource_cache.hits, hits + 2)
+
+    def test_cache_cleared_on_locale_change(self):
+        resource = load_lang_resource("snippet_collections.json")
+
+        # the resources fall back to the default language
+        i18n.config.set("locale", "test")
+        fallback_resource = load_lang_resource("snippet_collections.json")
+        self.assertIsNot(resource, fallback_resource)
+        self.assertEqual(resource, fallback_resource)
+        self.assertEqual(len(resource_cache), 1)
+
+    def test_resource_is_read_only(self):
+        resource = load_lang_resource("snippet_collections.json")
+        story_list = resource["story_list"]["general"]
+
+        with self.assertRaises(TypeError):
+            resource["story_list"] = []
+        with self.assertRaises(TypeError):
+            story_list.extend(["A new story"])
+
+        # copies can be changed
+        stories = story_list.copy()
+        stories.append("A new story")
+        self.assertNotIn("A new story", story_list)
@@ -1,13 +1,35 @@
 import os
 import shutil
+import tempfile
+import threading
 import unittest
+from pathlib import Path
+from unittest import mock
 
-from scripts.game_structure.game.save_load import read_clans
+from scripts.game_structure.game.save_load import (
+    read_clans,
+    SaveBatch,
+    copy_clan_storage,
+)
 
 os.environ["SDL_VIDEODRIVER"] = "dummy"
 os.environ["SDL_AUDIODRIVER"] = "dummy"
 
+from scripts.cat import save_load
+from scripts.cat.cats import Cat
+from scripts.cat.enums import CatRank
 from scripts.game_structure import game
+from scripts.game_structure.game.save_load import storage
+from scripts.game_structure.game.save_load.storage import (
+    ClanStorage,
+    JsonClanStorage,
+    SqliteClanStorage,
+)
+from scripts.game_structure.game.switches import (
+    switch_get_value,
+    switch_set_value,
+    Switch,
+)
 from scripts.housekeeping.datadir import get_save_dir
 
 if not os.path.exists("tests/testSaves"):
@@ -147,3 +169,260 @@ class MigrateSave(unittest.TestCase):
                     file_list,
                     "Save " + str(i) + " not migrated correctly",
                 )
+
+
+class TestSaveBatch(unittest.TestCase):
+    def setUp(self):
+        self.directory = Path(tempfile.mkdtemp())
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_commit(self):
+        kept = self.directory / "kept.json"
+        removed = self.directory / "removed.json"
+        removed.write_text("[]")
+
+        batch = SaveBatch()
+        batch.write(kept, {"ID": "1"})
+        batch.remove(removed)
+
+        # nothing changes until the batch is committed
+        self.assertFalse(kept.exists())
+        self.assertTrue(removed.exists())
+
+        batch.commit()
+        self.assertEqual(kept.read_text(), '{\n    "ID": "1"\n}')
+        self.assertFalse(removed.exists())
+        self.assertEqual(os.listdir(self.directory), ["kept.json"])
+
+    def test_discard(self):
+        kept = self.directory / "kept.json"
+        kept.write_text("old")
+
+        batch = SaveBatch()
+        batch.write(kept, "new")
+        batch.remove(kept)
+        batch.discard()
+
+        self.assertEqual(kept.read_text(), "old")
+        self.assertEqual(os.listdir(self.directory), ["kept.json"])
+
+
+class TestClanStorage(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.patch = mock.patch.object(storage, "get_save_dir", lambda: self.directory)
+        self.patch.start()
+
+    def tearDown(self):
+        storage.close_clan_storage()
+        self.patch.stop()
+        shutil.rmtree(self.directory)
+
+    def fill(self, clan_storage):
+        cats = {
+            cat_id: ('{"ID":"%s"}' % cat_id, '{\n    "ID": "%s"\n}' % cat_id)
+            for cat_id in ("2", "1", "3")
+        }
+        with clan_storage.transaction():
+            clan_storage.write_clan({"clanname": "Test", "leader_lives": 9})
+            clan_storage.write_cats(cats, cats.keys())
+            clan_storage.write_relationships("1", [{"cat_to_id": "2", "like": 5}])
+            clan_storage.write_relationships("2", [{"cat_to_id": "1", "like": -5}])
+            clan_storage.write_history("3", {"died_by": []})
+            clan_storage.write_conditions("1", {"injuries": {"bruises": {}}})
+
+    def test_storage_choice(self):
+        self.assertIsInstance(storage.get_clan_storage("Test"), JsonClanStorage)
+
+        SqliteClanStorage("Test").connection.close()
+        self.assertIsInstance(storage.get_clan_storage("Test"), SqliteClanStorage)
+
+    def test_read_write(self):
+        for clan_storage in (JsonClanStorage("Test"), SqliteClanStorage("Test")):
+            with self.subTest(storage=type(clan_storage).__name__):
+                self.fill(clan_storage)
+
+                self.assertEqual(
+                    [cat["ID"] for cat in clan_storage.read_cats()], ["2", "1", "3"]
+                )
+                self.assertEqual(clan_storage.read_clan()["leader_lives"], 9)
+                self.assertEqual(clan_storage.read_relationships("1")[0]["like"], 5)
+                self.assertIsNone(clan_storage.read_relationships("3"))
+                self.assertEqual(clan_storage.read_history("3"), {"died_by": []})
+                self.assertIsNone(clan_storage.read_conditions("2"))
+
+                with clan_storage.transaction():
+                    clan_storage.keep_relationships(["2"])
+                    clan_storage.write_conditions("1", None)
+                self.assertIsNone(clan_storage.read_relationships("1"))
+                self.assertIsNotNone(clan_storage.read_relationships("2"))
+                self.assertIsNone(clan_storage.read_conditions("1"))
+
+                clan_storage.remove_all()
+
+    def test_prefetch(self):
+        for clan_storage in (JsonClanStorage("Test"), SqliteClanStorage("Test")):
+            with self.subTest(storage=type(clan_storage).__name__):
+                self.fill(clan_storage)
+
+                clan_storage.prefetch(["1", "2", "3"], ["1", "2"])
+                self.assertEqual(clan_storage.read_relationships("1")[0]["like"], 5)
+                self.assertIsNone(clan_storage.read_relationships("3"))
+                self.assertEqual(
+                    clan_storage.read_conditions("1"), {"injuries": {"bruises": {}}}
+                )
+                self.assertIsNone(clan_storage.read_conditions("2"))
+
+                # writes replace what was prefetched
+                with clan_storage.transaction():
+                    clan_storage.write_relationships("2", [])
+                self.assertEqual(clan_storage.read_relationships("2"), [])
+
+                clan_storage.remove_all()
+
+    def test_failed_transaction(self):
+        for clan_storage in (JsonClanStorage("Test"), SqliteClanStorage("Test")):
+            with self.subTest(storage=type(clan_storage).__name__):
+                self.fill(clan_storage)
+
+                with self.assertRaises(RuntimeError):
+                    with clan_storage.transaction():
+                        clan_storage.write_history("3", {"died_by": ["fell"]})
+                        raise RuntimeError
+                self.assertEqual(clan_storage.read_history("3"), {"died_by": []})
+
+                clan_storage.remove_all()
+
+    def test_incomplete_storage(self):
+        class IncompleteStorage(ClanStorage):
+            def read_cats(self):
+                return []
+
+        with self.assertRaises(TypeError):
+            IncompleteStorage("Test")
+
+    def test_sqlite_threads(self):
+        clan_storage = SqliteClanStorage("Test")
+
+        # the clan is loaded on one thread, then saved from another
+        loading_thread = threading.Thread(
+            target=lambda: (self.fill(clan_storage), clan_storage.read_cats())
+        )
+        loading_thread.start()
+        loading_thread.join()
+
+        with clan_storage.transaction():
+            clan_storage.write_clan({"clanname": "Test", "leader_lives": 8})
+            clan_storage.write_relationships("3", [])
+
+        read = {}
+        reading_thread = threading.Thread(
+            target=lambda: read.update(
+                clan=clan_storage.read_clan(),
+                relationships=clan_storage.read_relationships("3"),
+            )
+        )
+        reading_thread.start()
+        reading_thread.join()
+        self.assertEqual(read["clan"]["leader_lives"], 8)
+        self.assertEqual(read["relationships"], [])
+
+        clan_storage.remove_all()
+
+    def test_transaction_threads(self):
+        for clan_storage in (JsonClanStorage("Test"), SqliteClanStorage("Test")):
+            with self.subTest(storage=type(clan_storage).__name__):
+                self.fill(clan_storage)
+                started = threading.Event()
+
+                def save():
+                    with clan_storage.transaction():
+                        clan_storage.write_history("1", {"died_by": []})
+                        started.set()
+                        # give the other thread time to try its own transaction
+                        threading.Event().wait(0.1)
+                        clan_storage.write_history("2", {"died_by": []})
+
+                saving_thread = threading.Thread(target=save)
+                saving_thread.start()
+                started.wait()
+                # waits for the transaction of the saving thread to end
+                with clan_storage.transaction():
+                    clan_storage.write_conditions("3", {"illnesses": {}})
+                saving_thread.join()
+
+                self.assertEqual(clan_storage.read_history("2"), {"died_by": []})
+                self.assertEqual(clan_storage.read_conditions("3"), {"illnesses": {}})
+
+                clan_storage.remove_all()
+
+    def test_copy(self):
+        json_storage = JsonClanStorage("Test")
+        self.fill(json_storage)
+        data = json_storage.dump()
+
+        sqlite_storage = SqliteClanStorage("Test")
+        # whatever the target held before is replaced
+        with sqlite_storage.transaction():
+            extra = {"4": ('{"ID":"4"}', '{\n    "ID": "4"\n}')}
+            sqlite_storage.write_cats(extra, extra.keys())
+            sqlite_storage.write_relationships("4", [])
+            sqlite_storage.write_history("4", {"died_by": []})
+            sqlite_storage.write_conditions("4", {"illnesses": {}})
+        copy_clan_storage(json_storage, sqlite_storage)
+        self.assertEqual(sqlite_storage.dump(), data)
+
+        json_storage.remove_all()
+        self.assertEqual(json_storage.dump()["cats"], [])
+
+        copy_clan_storage(sqlite_storage, json_storage)
+        self.assertEqual(json_storage.dump(), data)
+        sqlite_storage.close()
+
+
+class TestLoadOnDemand(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.patch = mock.patch.object(storage, "get_save_dir", lambda: self.directory)
+        self.patch.start()
+        self.clan_name = switch_get_value(Switch.clan_name)
+        switch_set_value(Switch.clan_name, "Test")
+        save_load.reset_save_state("Test")
+
+        self.clan_cat = Cat(status_dict={"rank": CatRank.WARRIOR}, disable_random=True)
+        self.loner = Cat(status_dict={"rank": CatRank.LONER}, disable_random=True)
+        self.loner.create_one_relationship(self.clan_cat).like = 30
+        self.clan_cat.create_one_relationship(self.loner).link_relationship()
+        with storage.get_clan_storage("Test").transaction() as clan_storage:
+            self.loner.save_relationship_of_cat(clan_storage)
+        save_load.changed_relationships.clear()
+        save_load.mark_loaded(self.loner.ID)
+
+    def tearDown(self):
+        save_load.reset_save_state()
+        switch_set_value(Switch.clan_name, self.clan_name)
+        storage.close_clan_storage()
+        self.patch.stop()
+        shutil.rmtree(self.directory)
+
+    def test_outside_cats_are_unloaded(self):
+        save_load.unload_cats(Cat, budget=0)
+
+        self.assertIsNone(self.loner._relationships)
+        self.assertIsNotNone(self.clan_cat._relationships)
+        self.assertIsNone(
+            self.clan_cat.relationships[self.loner.ID].opposite_relationship
+        )
+        # loaded again from the save
+        self.assertEqual(self.loner.relationships[self.clan_cat.ID].like, 30)
+
+    def test_changed_relationships_stay_loaded(self):
+        self.loner.relationships[self.clan_cat.ID].add_log("test")
+        save_load.unload_cats(Cat, budget=0)
+        self.assertIsNotNone(self.loner._relationships)
+
+    def test_budget(self):
+        save_load.unload_cats(Cat, budget=1)
+        self.assertIsNotNone(self.loner._relationships)
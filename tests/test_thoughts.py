@@ -1,6 +1,8 @@
 import os
 import unittest
 
+import i18n
+
 from scripts.cat.enums import CatRank, CatGroup
 
 os.environ["SDL_VIDEODRIVER"] = "dummy"
@@ -8,6 +10,7 @@ os.environ["SDL_AUDIODRIVER"] = "dummy"
 
 from scripts.cat.cats import Cat
 from scripts.cat.thoughts import Thoughts
+from scripts.game_structure.localization import load_lang_resource
 
 
 class TestNotWorkingThoughts(unittest.TestCase):
@@ -170,3 +173,66 @@ class TestFamilyThoughts(unittest.TestCase):
         # when
 
         # then
+
+
+class TestThoughtPools(unittest.TestCase):
+    def setUp(self):
+        self.biome = "Forest"
+        self.season = "Newleaf"
+        self.camp = "camp2"
+
+    def test_pool_matches_full_check(self):
+        main = Cat(status_dict={"rank": CatRank.WARRIOR}, moons=40)
+        other = Cat(status_dict={"rank": CatRank.MEDICINE_CAT}, moons=40)
+        loaded_thoughts = load_lang_resource(
+            "thoughts/alive/warrior.json"
+        ) + load_lang_resource("thoughts/alive/general.json")
+
+        self.assertEqual(
+            Thoughts.create_thoughts(
+                loaded_thoughts,
+                main,
+                other,
+                "expanded",
+                self.biome,
+                self.season,
+                self.camp,
+            ),
+            Thoughts.load_thoughts(
+                main, other, "expanded", self.biome, self.season, self.camp
+            ),
+        )
+
+    def test_pool_is_reused(self):
+        pool = Thoughts.get_thought_pool(
+            "thoughts/alive/general.json", self.biome, self.season, self.camp
+        )
+        self.assertIs(
+            pool,
+            Thoughts.get_thought_pool(
+                "thoughts/alive/general.json", self.biome, self.season, self.camp
+            ),
+        )
+        self.assertTrue(
+            all(
+                "season" not in thought or self.season in thought["season"]
+                for thought in pool
+            )
+        )
+
+    def test_pool_is_rebuilt_on_language_change(self):
+        pool = Thoughts.get_thought_pool(
+            "thoughts/alive/general.json", self.biome, self.season, self.camp
+        )
+        locale = i18n.config.get("locale")
+        try:
+            # the resources fall back to the default language
+            i18n.config.set("locale", "test")
+            self.assertIsNot(
+                pool,
+                Thoughts.get_thought_pool(
+                    "thoughts/alive/general.json", self.biome, self.season, self.camp
+                ),
+            )
+        finally:
+            i18n.config.set("locale", locale)
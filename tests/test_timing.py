@@ -0,0 +1,60 @@
+import os
+import tempfile
+import unittest
+
+import ujson
+
+os.environ["SDL_VIDEODRIVER"] = "dummy"
+os.environ["SDL_AUDIODRIVER"] = "dummy"
+
+from scripts.cat.cats import Cat
+from scripts.game_structure import timing
+
+
+class TestTiming(unittest.TestCase):
+    def setUp(self):
+        timing.reset()
+        self.addCleanup(timing.reset)
+        self.addCleanup(timing.set_enabled, False)
+
+    def test_disabled_spans_are_not_recorded(self):
+        @timing.timed("test")
+        def double(value):
+            return value * 2
+
+        self.assertEqual(double(2), 4)
+        with timing.span("test"):
+            pass
+        self.assertEqual(timing.get_report(), [])
+
+    def test_spans_count_calls_and_slowest_cat(self):
+        timing.set_enabled(True)
+        cat = Cat()
+
+        @timing.timed("test", per_cat=True)
+        def nested(cat, depth):
+            if depth:
+                nested(cat, depth - 1)
+
+        nested(cat, 2)
+        nested(cat, 0)
+
+        (report,) = timing.get_report()
+        self.assertEqual(report["name"], "test")
+        # the nested calls are part of the outer call
+        self.assertEqual(report["calls"], 2)
+        self.assertEqual(report["max_cat_ID"], cat.ID)
+        self.assertGreaterEqual(report["total"], report["max"])
+
+    def test_dump_report(self):
+        timing.set_enabled(True)
+        with timing.span("test"):
+            pass
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = timing.dump_report(os.path.join(directory, "timing.json"))
+            with open(path, "r", encoding="utf-8") as read_file:
+                dumped = ujson.loads(read_file.read())
+
+        self.assertEqual([span["name"] for span in dumped["spans"]], ["test"])
+        self.assertEqual(dumped["spans"][0]["calls"], 1)
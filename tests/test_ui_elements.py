@@ -0,0 +1,97 @@
+import os
+import unittest
+from importlib.metadata import version
+
+import pygame
+
+os.environ["SDL_VIDEODRIVER"] = "dummy"
+os.environ["SDL_AUDIODRIVER"] = "dummy"
+
+from scripts.cat.cats import Cat
+from scripts.cat.enums import CatRank
+from scripts.cat.sprites import sprites
+from scripts.game_structure.screen_settings import MANAGER
+from scripts.game_structure.ui_elements import (
+    UICatListDisplay,
+    UISurfaceImageButton,
+    fit_cat_list_name,
+)
+from scripts.ui.generate_button import get_button_dict, ButtonStyles
+from scripts.utility import ui_scale, ui_scale_value
+
+
+PYGAME_GUI_VERSION = tuple(int(part) for part in version("pygame_gui").split(".")[:3])
+
+
+@unittest.skipIf(
+    PYGAME_GUI_VERSION >= (0, 6, 14),
+    "the image buttons are written for the single button images of pygame_gui 0.6.13, see uv.lock",
+)
+class TestUICatListDisplay(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        sprites.load_all()
+
+    @staticmethod
+    def create_button():
+        return UISurfaceImageButton(
+            ui_scale(pygame.Rect((0, 0), (34, 34))),
+            "x",
+            get_button_dict(ButtonStyles.ICON, (34, 34)),
+            object_id="@buttonstyles_icon",
+            manager=MANAGER,
+        )
+
+    def create_display(self, cats):
+        display = UICatListDisplay(
+            ui_scale(pygame.Rect((0, 0), (600, 400))),
+            container=None,
+            object_id="#cat_list_display",
+            starting_height=1,
+            cat_list=cats,
+            cats_displayed=4,
+            x_px_between=ui_scale_value(240),
+            y_px_between=ui_scale_value(200),
+            columns=2,
+            prev_button=self.create_button(),
+            next_button=self.create_button(),
+            first_button=self.create_button(),
+            last_button=self.create_button(),
+            current_page=1,
+            show_names=True,
+            tool_tip_name=True,
+            text_theme="#text_box_30_horizcenter",
+            manager=MANAGER,
+        )
+        self.addCleanup(display.kill)
+        return display
+
+    @staticmethod
+    def shown_cat_ids(display):
+        return [
+            sprite.return_cat_id()
+            for sprite in display.cat_sprites.values()
+            if sprite.button.visible
+        ]
+
+    def test_page_turn_keeps_cells(self):
+        cats = [Cat(status_dict={"rank": CatRank.WARRIOR}, moons=30) for _ in range(6)]
+        display = self.create_display(cats)
+        self.assertEqual(self.shown_cat_ids(display), [cat.ID for cat in cats[:4]])
+        cells = dict(display.cat_sprites)
+
+        display.update_display(2, cats)
+
+        # the cells are given the cats of the new page, not made again,
+        # and the ones left over on the last page are hidden
+        for key, sprite in cells.items():
+            self.assertIs(display.cat_sprites[key], sprite)
+        self.assertEqual(self.shown_cat_ids(display), [cats[4].ID, cats[5].ID])
+
+        sprite = display.cat_sprites["sprite0"]
+        self.assertIs(sprite.return_cat_object(), cats[4])
+        self.assertEqual(sprite.button.tool_tip_text, str(cats[4].name))
+        self.assertEqual(
+            display.cat_names["name0"].text,
+            fit_cat_list_name(str(cats[4].name), ui_scale_value(220)),
+        )
@@ -1,7 +1,10 @@
 import os
 import unittest
 
+import pygame
+
 from scripts.cat.enums import CatRank, CatCompatibility
+from scripts.cat_relations.enums import RelType
 
 os.environ["SDL_VIDEODRIVER"] = "dummy"
 os.environ["SDL_AUDIODRIVER"] = "dummy"
@@ -13,6 +16,11 @@ from scripts.utility import (
     get_personality_compatibility,
     get_num_of_cats_with_relation_amount_towards,
     get_alive_clan_queens,
+    recolor_lineart,
+    filter_relationship_type,
+    get_relations_from,
+    get_relations_towards,
+    get_top_relations,
 )
 
 
@@ -167,6 +175,52 @@ class TestCountRelation(unittest.TestCase):
         self.assertEqual(relation_dict["trust"], 0)
 
 
+class TestRelationQueries(unittest.TestCase):
+    def setUp(self):
+        self.cats = [Cat(disable_random=True) for _ in range(4)]
+        for cat_from in self.cats:
+            for cat_to in self.cats:
+                if cat_from is not cat_to:
+                    cat_from.relationships[cat_to.ID] = Relationship(cat_from, cat_to)
+
+    def test_inbound_and_outbound(self):
+        # given
+        cat1, cat2, cat3, cat4 = self.cats
+
+        # then
+        self.assertEqual(
+            get_relations_from(cat1, self.cats),
+            [cat1.relationships[cat.ID] for cat in (cat2, cat3, cat4)],
+        )
+        self.assertEqual(
+            get_relations_towards(cat1, self.cats),
+            [cat.relationships[cat1.ID] for cat in (cat2, cat3, cat4)],
+        )
+        self.assertEqual(get_relations_from(cat1, [cat1]), [])
+
+    def test_top_relations(self):
+        # given
+        cat1, cat2, cat3, cat4 = self.cats
+
+        # when
+        cat1.relationships[cat2.ID].like = 10
+        cat1.relationships[cat3.ID].like = 30
+        cat1.relationships[cat4.ID].like = 10
+        cat3.relationships[cat1.ID].trust = 40
+        cat4.relationships[cat1.ID].trust = 50
+
+        # then
+        self.assertEqual(
+            get_top_relations(cat1, RelType.LIKE, 2, self.cats),
+            [cat1.relationships[cat3.ID], cat1.relationships[cat2.ID]],
+        )
+        self.assertEqual(
+            get_top_relations(cat1, RelType.TRUST, 2, self.cats, inbound=True),
+            [cat4.relationships[cat1.ID], cat3.relationships[cat1.ID]],
+        )
+        self.assertEqual(len(get_top_relations(cat1, RelType.LIKE, 10, self.cats)), 3)
+
+
 class TestHighestRomance(unittest.TestCase):
     def test_exclude_mate(self):
         # given
@@ -229,6 +283,34 @@ class TestHighestRomance(unittest.TestCase):
         )
 
 
+class TestFilterRelationshipType(unittest.TestCase):
+    def test_only_relationships_inside_the_group_count(self):
+        # given
+        cat1 = Cat(disable_random=True)
+        cat2 = Cat(disable_random=True)
+        cat3 = Cat(disable_random=True)
+        outside_cat = Cat(disable_random=True)
+        for cat_from in (cat1, cat2, cat3):
+            for cat_to in (cat1, cat2, cat3, outside_cat):
+                if cat_from is not cat_to:
+                    cat_from.relationships[cat_to.ID] = Relationship(
+                        cat_from, cat_to, like=50
+                    )
+
+        # when
+        cat1.relationships[outside_cat.ID].like = -50
+
+        # then
+        self.assertTrue(filter_relationship_type([cat1, cat2, cat3], ["likes"]))
+        self.assertFalse(
+            filter_relationship_type([cat1, cat2, cat3, outside_cat], ["likes"])
+        )
+        self.assertTrue(filter_relationship_type([cat2, cat1], ["likes"]))
+        cat2.relationships[cat1.ID].like = -50
+        self.assertFalse(filter_relationship_type([cat2, cat1], ["likes"]))
+        self.assertFalse(filter_relationship_type([cat1, cat2, cat3], ["likes"]))
+
+
 class TestGetQueens(unittest.TestCase):
     def setUp(self) -> None:
         self.test_cat1 = Cat(status_dict={"rank": CatRank.WARRIOR}, disable_random=True)
@@ -413,3 +495,32 @@ class TestGetQueens(unittest.TestCase):
         self.assertEqual(
             [self.test_cat2.ID], list(get_alive_clan_queens(living_cats)[0].keys())
         )
+
+
+class TestRecolorLineart(unittest.TestCase):
+    def setUp(self):
+        self.sprite = pygame.Surface((3, 1), pygame.SRCALPHA)
+        self.sprite.set_at((0, 0), (0, 0, 0, 255))  # lineart
+        self.sprite.set_at((1, 0), (0, 0, 0, 100))  # transparent shadow
+        self.sprite.set_at((2, 0), (10, 20, 30, 255))  # fur
+
+    def test_color(self):
+        recolored = recolor_lineart(self.sprite, color=pygame.Color(200, 0, 0))
+        self.assertEqual(recolored.get_at((0, 0)), pygame.Color(200, 0, 0, 255))
+        self.assertEqual(recolored.get_at((1, 0)), pygame.Color(0, 0, 0, 100))
+        self.assertEqual(recolored.get_at((2, 0)), pygame.Color(10, 20, 30, 255))
+
+    def test_source(self):
+        source = pygame.Surface((3, 1), pygame.SRCALPHA)
+        source.fill((40, 50, 60, 255))
+        recolored = recolor_lineart(self.sprite, source=source)
+        self.assertEqual(recolored.get_at((0, 0)), pygame.Color(40, 50, 60, 255))
+        self.assertEqual(recolored.get_at((1, 0)), pygame.Color(0, 0, 0, 100))
+        self.assertEqual(recolored.get_at((2, 0)), pygame.Color(10, 20, 30, 255))
+
+        # the original sprite must not be changed
+        self.assertEqual(self.sprite.get_at((0, 0)), pygame.Color(0, 0, 0, 255))
+
+    def test_no_color_or_source(self):
+        with self.assertRaises(ValueError):
+            recolor_lineart(self.sprite)
@@ -0,0 +1,37 @@
+import unittest
+
+from scripts.ui.virtual_list import VirtualList
+
+
+class TestVirtualList(unittest.TestCase):
+    def test_unmeasured_rows_use_the_average(self):
+        rows = VirtualList(5, 10)
+        self.assertEqual(rows.total_height, 50)
+
+        rows.set_height(0, 20)
+        rows.set_height(1, 40)
+        self.assertEqual(rows.row_estimate, 30)
+        self.assertEqual(rows.offsets, [0, 20, 60, 90, 120, 150])
+
+        rows.set_height(1, 20)
+        self.assertEqual(rows.total_height, 100)
+
+    def test_rows_between(self):
+        rows = VirtualList(4, 10)
+        for index, height in enumerate((10, 30, 10, 10)):
+            rows.set_height(index, height)
+        # rows at 0-10, 10-40, 40-50, 50-60
+
+        self.assertEqual(rows.rows_between(0, 10), (0, 1))
+        self.assertEqual(rows.rows_between(5, 45), (0, 3))
+        self.assertEqual(rows.rows_between(-100, 15), (0, 2))
+        self.assertEqual(rows.rows_between(55, 1000), (3, 4))
+        self.assertEqual(rows.rows_between(60, 1000), (0, 0))
+        self.assertEqual(VirtualList(0, 10).rows_between(0, 100), (0, 0))
+
+    def test_row_at(self):
+        rows = VirtualList(3, 10)
+        self.assertEqual(rows.row_at(-5), 0)
+        self.assertEqual(rows.row_at(10), 1)
+        self.assertEqual(rows.row_at(29), 2)
+        self.assertEqual(rows.row_at(500), 2)